@@ -0,0 +1,249 @@
+# Investment Atlas - Headless page benchmark
+# Drives every analysis page through Streamlit's AppTest at several dataset sizes
+# and records wall time, peak memory and emitted payload per rerun
+#
+# Usage:
+#   python benchmarks/bench_pages.py                       # write benchmarks/baseline.json
+#   python benchmarks/bench_pages.py --check               # compare against the baseline
+#   python benchmarks/bench_pages.py --sizes 200 --reruns 5
+#   python benchmarks/bench_pages.py --sizes 200 --sparse --output /tmp/sparse.json  # pages survive missing counts
+
+import argparse
+import glob
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+APP_PATH = os.path.abspath(os.path.join(ROOT, 'streamlit_app.py'))
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+PAGES = [
+    "🎯 Executive Summary",
+    "🗺️ Interactive Investment Map",
+    "🤖 AI Model Insights",
+    "📊 Sector Analysis",
+    "🏙️ District Deep Dive",
+    "🧪 Scenario Simulator",
+    "🔬 Technical Methodology"
+]
+METRICS = ('first_run_s', 'rerun_s', 'peak_memory_mb', 'payload_kb')
+# Count columns the schema turns into nullable integers when a cell is empty
+SPARSE_COLUMNS = ('population_2025', 'gdp_per_capita', 'industrial_establishments')
+SPARSE_EVERY = 25
+
+
+def build_dataset(districts, out_dir, source_dir=os.path.join(ROOT, 'data'), synthetic=False):
+    """Tile the shipped state files up to `districts` rows with unique codes (or generate them)"""
+    import pandas as pd
+
+    if synthetic:
+        sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+        from generate_synthetic_data import generate
+        return sum(generate(districts, 4, os.path.join(out_dir, 'data')).values())
+
+    files = sorted(glob.glob(os.path.join(source_dir, '*_economic_analysis.csv')))
+    frames = {os.path.basename(f): pd.read_csv(f) for f in files}
+    base = sum(len(frame) for frame in frames.values())
+    copies = -(-districts // base)
+    data_dir = os.path.join(out_dir, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+
+    written = 0
+    for name, frame in frames.items():
+        share = round(districts * len(frame) / base) if name != list(frames)[-1] else districts - written
+        tiled = pd.concat([frame] * copies, ignore_index=True).head(share)
+        copy_id = (tiled.index // len(frame)).astype(str)
+        suffix = copy_id.where(copy_id != '0', '')
+        tiled['district_code'] = tiled['district_code'] + ('_' + suffix).where(suffix != '', '')
+        tiled['district_name'] = tiled['district_name'] + (' ' + suffix).where(suffix != '', '')
+        tiled.to_csv(os.path.join(data_dir, name), index=False)
+        written += len(tiled)
+    return written
+
+
+def blank_counts(data_dir, every=SPARSE_EVERY):
+    """Empty every `every`-th cell of SPARSE_COLUMNS in each state file, so pages meet missing counts"""
+    import pandas as pd
+
+    for path in glob.glob(os.path.join(data_dir, '*_economic_analysis.csv')):
+        frame = pd.read_csv(path, dtype={'district_code': str})
+        for offset, column in enumerate(SPARSE_COLUMNS):
+            frame.loc[frame.index[offset::every], column] = None
+        frame.to_csv(path, index=False)
+
+
+def measure_pages(reruns, timeout):
+    """Run every page in this process (cwd holds the dataset) and return per-page metrics"""
+    import logging
+    import tracemalloc
+    import warnings
+    warnings.filterwarnings('ignore')
+    logging.disable(logging.WARNING)
+
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import AppTest
+
+    # AppTest recompiles the script on every run; the server compiles it once
+    bytecode = {}
+    get_bytecode = ScriptCache.get_bytecode
+
+    def shared_bytecode(self, script_path):
+        if script_path not in bytecode:
+            bytecode[script_path] = get_bytecode(self, script_path)
+        return bytecode[script_path]
+
+    ScriptCache.get_bytecode = shared_bytecode
+
+    # Payload = serialized size of every element delta sent to the browser
+    payload = {'bytes': 0}
+    enqueue = ForwardMsgQueue.enqueue
+
+    def counting_enqueue(self, msg):
+        if msg.HasField('delta'):
+            payload['bytes'] += msg.ByteSize()
+        return enqueue(self, msg)
+
+    ForwardMsgQueue.enqueue = counting_enqueue
+
+    def timed_run(at):
+        payload['bytes'] = 0
+        start = time.perf_counter()
+        at.run()
+        elapsed = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+        return elapsed, payload['bytes']
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    load_s, _ = timed_run(at)
+
+    results = {'load_s': round(load_s, 4), 'pages': {}}
+    for page in PAGES:
+        at.sidebar.selectbox[0].select(page)
+        first_run, _ = timed_run(at)
+        timings, sizes = [], []
+        for _ in range(reruns):
+            elapsed, size = timed_run(at)
+            timings.append(elapsed)
+            sizes.append(size)
+
+        # Separate rerun under tracemalloc so tracing overhead stays out of the timings
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        timed_run(at)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        results['pages'][page] = {
+            'first_run_s': round(first_run, 4),
+            'rerun_s': round(statistics.median(timings), 4),
+            'peak_memory_mb': round(peak / 1e6, 2),
+            'payload_kb': round(max(sizes) / 1e3, 1)
+        }
+    return results
+
+
+def run_size(districts, reruns, timeout, synthetic=False, sparse=False):
+    """Benchmark one dataset size in a fresh interpreter with empty caches"""
+    work_dir = tempfile.mkdtemp(prefix=f'atlas_bench_{districts}_')
+    try:
+        rows = build_dataset(districts, work_dir, synthetic=synthetic)
+        if sparse:
+            blank_counts(os.path.join(work_dir, 'data'))
+        command = [sys.executable, os.path.abspath(__file__), '--child',
+                   '--reruns', str(reruns), '--timeout', str(timeout)]
+        output = subprocess.run(command, cwd=work_dir, capture_output=True, text=True)
+        if output.returncode != 0:
+            sys.exit(f"{districts:,} districts failed:\n{output.stderr[-2000:]}")
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        result['districts'] = rows
+        return result
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def environment():
+    """Where the numbers came from; timings only compare on similar machines"""
+    import streamlit
+    return {
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count()
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Metrics that exceed the baseline by more than `tolerance` (fractional)"""
+    regressions = []
+    for size, current in results['sizes'].items():
+        previous = baseline['sizes'].get(size)
+        if previous is None:
+            continue
+        for page, metrics in current['pages'].items():
+            for metric in METRICS:
+                before = previous['pages'].get(page, {}).get(metric)
+                after = metrics[metric]
+                # Ignore noise on tiny absolute values
+                if before and after > before * (1 + tolerance) and after - before > 0.01:
+                    regressions.append(f"{size:>7} {page:<32} {metric:<15} {before:>10} -> {after}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every page at several dataset sizes")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[200, 10_000, 100_000])
+    parser.add_argument('--reruns', type=int, default=3, help="Warm reruns per page; the median is reported")
+    parser.add_argument('--timeout', type=float, default=600, help="Seconds allowed per script run")
+    parser.add_argument('--output', default=BASELINE_PATH, help="Where to write results (ignored with --check)")
+    parser.add_argument('--check', nargs='?', const=BASELINE_PATH, default=None,
+                        help="Compare against a baseline JSON instead of writing one")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed fractional slowdown with --check")
+    parser.add_argument('--synthetic', action='store_true',
+                        help="Use scripts/generate_synthetic_data.py instead of tiling the shipped files")
+    parser.add_argument('--sparse', action='store_true',
+                        help=f"Empty every {SPARSE_EVERY}th population, GDP and establishment count; any page error fails the run")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_pages(args.reruns, args.timeout)))
+        return
+
+    dataset = ('synthetic' if args.synthetic else 'tiled') + ('+sparse' if args.sparse else '')
+    results = {'environment': environment(), 'dataset': dataset, 'sizes': {}}
+    for districts in args.sizes:
+        result = run_size(districts, args.reruns, args.timeout, args.synthetic, args.sparse)
+        results['sizes'][str(districts)] = result
+        print(f"\n{result['districts']:,} districts (initial load {result['load_s']:.2f}s)")
+        print(f"  {'page':<32} {'first run (s)':>14} {'rerun (s)':>10} {'peak MB':>9} {'payload KB':>11}")
+        for page, m in result['pages'].items():
+            print(f"  {page:<32} {m['first_run_s']:>14.3f} {m['rerun_s']:>10.3f} {m['peak_memory_mb']:>9.1f} {m['payload_kb']:>11.1f}")
+
+    if args.check:
+        with open(args.check) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions beyond {args.tolerance:.0%}:")
+            print('\n'.join(regressions))
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%} against {args.check}")
+        return
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    print(f"\nBaseline written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
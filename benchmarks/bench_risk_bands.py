@@ -0,0 +1,64 @@
+# Investment Atlas - Risk banding benchmark
+# Row-wise df.apply lambda (previous load_data path) vs assign_risk_bands
+#
+# Usage: python benchmarks/bench_risk_bands.py [--rows 100000 1000000]
+
+import argparse
+import logging
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+warnings.filterwarnings('ignore')
+logging.disable(logging.WARNING)  # Streamlit warns about running outside `streamlit run`
+
+import streamlit_app as app
+
+
+def lambda_bands(df):
+    """The original row-wise categorisation from load_data"""
+    return df.apply(lambda row:
+        'Low Risk, High Return' if row['ml_predicted_score'] > 120 else
+        'Medium Risk, Good Return' if row['ml_predicted_score'] > 80 else
+        'Higher Risk, Moderate Return', axis=1)
+
+
+def best_of(func, repeats):
+    """Fastest wall time over a few repeats, plus the last result"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark risk banding strategies")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'rows':>10} {'df.apply (s)':>14} {'vectorized (s)':>15} {'speedup':>9}")
+    for rows in args.rows:
+        df = pd.DataFrame({'ml_predicted_score': rng.uniform(30, 150, rows)})
+        # Exact threshold values exercise the strict ">" boundaries
+        df.loc[::1000, 'ml_predicted_score'] = 80.0
+        df.loc[1::1000, 'ml_predicted_score'] = 120.0
+
+        slow, expected = best_of(lambda: lambda_bands(df), 1 if rows >= 1_000_000 else args.repeats)
+        fast, actual = best_of(lambda: app.assign_risk_bands(df['ml_predicted_score']), args.repeats)
+
+        if not np.array_equal(np.asarray(actual, dtype=object), expected.to_numpy(dtype=object)):
+            sys.exit(f"Vectorized bands disagree with the lambda at {rows:,} rows")
+        print(f"{rows:>10,} {slow:>14.3f} {fast:>15.4f} {slow / fast:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# Investment Atlas - Cold-start benchmark
+# Time to first paint and to a fully rendered page, each in a fresh interpreter
+#
+# Usage: python benchmarks/bench_startup.py [--app streamlit_app.py] [--runs 3] [--page LABEL ...]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+HEAVY_MODULES = ('pandas', 'pyarrow')
+
+
+def measure(app_path, page, timeout):
+    """Run one cold start in this process and return its timings"""
+    start = time.perf_counter()
+
+    import logging
+    import types
+    import warnings
+    warnings.filterwarnings('ignore')
+    logging.disable(logging.WARNING)
+
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+    from streamlit.testing.v1 import AppTest
+
+    # First paint = the first element delta the script sends to the browser
+    marks = {}
+    enqueue = ForwardMsgQueue.enqueue
+
+    def timed_enqueue(self, msg):
+        if 'first_paint' not in marks and msg.HasField('delta'):
+            marks['first_paint'] = time.perf_counter()
+        return enqueue(self, msg)
+
+    ForwardMsgQueue.enqueue = timed_enqueue
+
+    at = AppTest.from_file(app_path, default_timeout=timeout)
+    if page:
+        at.session_state['page'] = page
+    at.run()
+    finished = time.perf_counter()
+
+    loaded = [name for name in HEAVY_MODULES
+              if type(sys.modules.get(name)) is types.ModuleType]
+    return {
+        'first_paint': marks.get('first_paint', finished) - start,
+        'full_render': finished - start,
+        'exceptions': len(at.exception),
+        'loaded': loaded
+    }
+
+
+def cold_start(app_path, page, timeout):
+    """Measure one cold start in a fresh interpreter"""
+    command = [sys.executable, os.path.abspath(__file__), '--child', '--app', app_path, '--timeout', str(timeout)]
+    if page:
+        command += ['--page', page]
+    output = subprocess.run(command, cwd=os.path.dirname(app_path), capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start time to first paint per page")
+    parser.add_argument('--app', default=os.path.join(ROOT, 'streamlit_app.py'))
+    parser.add_argument('--page', nargs='*', default=None, help="Sidebar labels to open (default: landing page and About)")
+    parser.add_argument('--runs', type=int, default=3, help="Fresh interpreters per page; medians are reported")
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    app_path = os.path.abspath(args.app)
+
+    if args.child:
+        print(json.dumps(measure(app_path, args.page[0] if args.page else None, args.timeout)))
+        return
+
+    pages = args.page if args.page else [None, "👨‍💼 About"]
+    print(f"{'page':<32} {'first paint (s)':>16} {'full render (s)':>16}  modules loaded")
+    for page in pages:
+        results = [cold_start(app_path, page, args.timeout) for _ in range(args.runs)]
+        if any(r['exceptions'] for r in results):
+            sys.exit(f"{page or 'landing page'} raised an exception during the run")
+        first_paint = statistics.median(r['first_paint'] for r in results)
+        full_render = statistics.median(r['full_render'] for r in results)
+        print(f"{page or '(landing page)':<32} {first_paint:>16.2f} {full_render:>16.2f}  {', '.join(results[-1]['loaded']) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+# Investment Atlas - In-memory footprint of the district frame
+# Compares the default pandas dtypes against DISTRICT_SCHEMA
+#
+# Usage: python benchmarks/memory_report.py [data_dir] [--repeat N]
+
+import argparse
+import glob
+import logging
+import os
+import sys
+import warnings
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+warnings.filterwarnings('ignore')
+logging.disable(logging.WARNING)  # Streamlit warns about running outside `streamlit run`
+
+import streamlit_app as app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report district frame memory before and after the typed schema")
+    parser.add_argument('data_dir', nargs='?', default='data', help="Directory holding *_economic_analysis.csv files")
+    parser.add_argument('--repeat', type=int, default=1, help="Tile the districts N times to project larger datasets")
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(args.data_dir, '*_economic_analysis.csv')))
+    if not files:
+        sys.exit(f"No *_economic_analysis.csv files found in {args.data_dir}")
+
+    raw = pd.concat([pd.read_csv(f) for f in files] * args.repeat, ignore_index=True)
+    raw = app.derive_district_columns(raw)
+    typed = app.apply_district_schema(raw)
+
+    report = app.memory_footprint_report(raw, typed)
+    pd.set_option('display.width', 160)
+    print(f"{len(raw):,} districts from {len(files)} files\n")
+    print(report.to_string(float_format=lambda x: f"{x:,.1f}"))
+
+
+if __name__ == '__main__':
+    main()
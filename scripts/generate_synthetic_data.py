@@ -0,0 +1,387 @@
+# Investment Atlas - Synthetic district data generator
+# Writes *_economic_analysis.csv files with the exact schema of data/ for scale testing,
+# and optionally subdistricts/*_subdistricts.csv files for the drill-down hierarchy and
+# panel/*_panel.csv files with yearly histories that end at the 2025 snapshot
+#
+# Districts share a latent development factor, so GDP per capita, literacy,
+# urbanization, the sector mix and the infrastructure indicators move together
+# the way they do in the real files. Rows are generated and appended in chunks,
+# so output size is bounded by disk, not memory.
+#
+# Usage: python scripts/generate_synthetic_data.py --districts 1000000 --states 36 --out-dir synthetic_data
+#        python scripts/generate_synthetic_data.py --districts 700 --subdistricts 30 --panel-years 11 --out-dir synthetic_data
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Column order of the source files
+COLUMNS = [
+    'district_name', 'district_code', 'tier', 'region', 'state', 'population_2025',
+    'literacy_rate_2025', 'urbanization_rate_2025', 'work_participation_rate_2025', 'data_quality',
+    'gdp_per_capita', 'industrial_establishments', 'service_sector_share', 'manufacturing_share',
+    'agriculture_share', 'bank_branches_per_100k', 'internet_penetration', 'road_density',
+    'power_availability', 'logistics_connectivity', 'total_gdp', 'economic_diversification_index',
+    'infrastructure_index', 'investment_readiness_score'
+]
+
+# The four shipped states first, then the rest of India
+STATES = [
+    ('Maharashtra', 'MH'), ('Uttar Pradesh', 'UP'), ('Karnataka', 'KA'), ('Tamil Nadu', 'TN'),
+    ('Andhra Pradesh', 'AP'), ('Arunachal Pradesh', 'AR'), ('Assam', 'AS'), ('Bihar', 'BR'),
+    ('Chhattisgarh', 'CG'), ('Goa', 'GA'), ('Gujarat', 'GJ'), ('Haryana', 'HR'),
+    ('Himachal Pradesh', 'HP'), ('Jharkhand', 'JH'), ('Kerala', 'KL'), ('Madhya Pradesh', 'MP'),
+    ('Manipur', 'MN'), ('Meghalaya', 'ML'), ('Mizoram', 'MZ'), ('Nagaland', 'NL'),
+    ('Odisha', 'OD'), ('Punjab', 'PB'), ('Rajasthan', 'RJ'), ('Sikkim', 'SK'),
+    ('Telangana', 'TS'), ('Tripura', 'TR'), ('Uttarakhand', 'UK'), ('West Bengal', 'WB'),
+    ('Andaman and Nicobar Islands', 'AN'), ('Chandigarh', 'CH'), ('Dadra and Nagar Haveli and Daman and Diu', 'DH'),
+    ('Delhi', 'DL'), ('Jammu and Kashmir', 'JK'), ('Ladakh', 'LA'), ('Lakshadweep', 'LD'), ('Puducherry', 'PY')
+]
+REGIONS = ['Northern', 'Southern', 'Eastern', 'Western', 'Central']
+
+# Tier mix and per-tier (mean, std, min, max) fitted to the shipped files
+TIER_SHARES = {'Metro': 0.07, 'Tier-2': 0.21, 'Tier-3': 0.72}
+TIER_PROFILES = {
+    'Metro': {
+        'population_2025': (7.9e6, 3.7e6, 2.0e6, 2.0e7),
+        'literacy_rate_2025': (90.7, 4.0, 75.0, 95.0),
+        'urbanization_rate_2025': (85.1, 9.0, 60.0, 95.0),
+        'work_participation_rate_2025': (45.8, 3.5, 35.0, 55.0),
+        'gdp_per_capita': (209_000, 55_000, 120_000, 400_000),
+        'establishments_per_lakh': (140, 40, 60, 260),
+        'bank_branches_per_100k': (17.0, 4.4, 8, 30),
+        'internet_penetration': (88.9, 8.7, 65, 99),
+        'road_density': (168, 43, 100, 260),
+        'power_availability': (94.5, 5.8, 80, 99),
+        'logistics_connectivity': (90.9, 7.5, 70, 99)
+    },
+    'Tier-2': {
+        'population_2025': (4.0e6, 1.3e6, 1.2e6, 9.0e6),
+        'literacy_rate_2025': (83.9, 5.4, 65.0, 95.0),
+        'urbanization_rate_2025': (70.1, 15.6, 35.0, 95.0),
+        'work_participation_rate_2025': (44.2, 5.9, 32.0, 55.0),
+        'gdp_per_capita': (142_000, 46_000, 60_000, 280_000),
+        'establishments_per_lakh': (100, 45, 30, 220),
+        'bank_branches_per_100k': (13.5, 4.3, 4, 24),
+        'internet_penetration': (70.9, 14.9, 30, 99),
+        'road_density': (121, 33, 50, 200),
+        'power_availability': (90.7, 9.9, 60, 99),
+        'logistics_connectivity': (75.2, 16.5, 40, 99)
+    },
+    'Tier-3': {
+        'population_2025': (2.0e6, 0.48e6, 0.5e6, 4.0e6),
+        'literacy_rate_2025': (79.9, 4.7, 60.0, 92.0),
+        'urbanization_rate_2025': (53.2, 8.6, 25.0, 75.0),
+        'work_participation_rate_2025': (37.4, 5.5, 30.0, 55.0),
+        'gdp_per_capita': (90_000, 34_000, 35_000, 190_000),
+        'establishments_per_lakh': (48, 30, 10, 150),
+        'bank_branches_per_100k': (7.8, 3.1, 2, 16),
+        'internet_penetration': (46.0, 15.7, 20, 85),
+        'road_density': (76, 24, 30, 140),
+        'power_availability': (80.7, 12.9, 50, 99),
+        'logistics_connectivity': (52.8, 15.6, 25, 92)
+    }
+}
+
+# Sector mixes (service, manufacturing, agriculture) observed per tier, least to most developed
+SECTOR_MIXES = {
+    'Metro': [(45, 25, 30), (65, 25, 10), (70, 25, 5), (75, 20, 5)],
+    'Tier-2': [(30, 25, 45), (45, 35, 20), (55, 30, 15), (50, 40, 10)],
+    'Tier-3': [(15, 15, 70), (25, 20, 55), (35, 30, 35), (30, 35, 35)]
+}
+
+DATA_QUALITY = {
+    'Metro': (['High'], [1.0]),
+    'Tier-2': (['High', 'Estimated', 'Medium'], [0.43, 0.41, 0.16]),
+    'Tier-3': (['Estimated', 'Medium'], [0.98, 0.02])
+}
+
+# infrastructure_index = (internet + roads / scale + power + logistics) / 4, with a
+# road scale that differs by state. These are the shipped files' scales; every
+# other state draws one, seeded, from the same range.
+ROAD_SCALES = {'Maharashtra': 1.5, 'Uttar Pradesh': 1.2, 'Karnataka': 2.0, 'Tamil Nadu': 1.8}
+ROAD_SCALE_RANGE = (1.2, 2.0)
+
+# How strongly each indicator follows the latent development factor
+DEVELOPMENT_LOADING = 0.7
+
+# Column order of the sub-district files and the local name of the unit, cycled across states
+SUBDISTRICT_COLUMNS = [
+    'subdistrict_name', 'subdistrict_code', 'subdistrict_type', 'district_code', 'population_2025',
+    'literacy_rate_2025', 'urbanization_rate_2025', 'work_participation_rate_2025', 'service_sector_share',
+    'manufacturing_share', 'agriculture_share', 'infrastructure_index', 'investment_readiness_score'
+]
+SUBDISTRICT_TYPES = ['Taluka', 'Tehsil', 'Taluk', 'Block']
+
+# Panel history: (snapshot column, annual drift mean, drift std, yearly noise std, low, high).
+# Multiplicative indicators drift by a growth rate, the others by points per year.
+PANEL_LAST_YEAR = 2025
+PANEL_GROWTH = {
+    'population': ('population_2025', 0.012, 0.006, 0.003, None, None),
+    'gdp_per_capita': ('gdp_per_capita', 0.062, 0.022, 0.025, None, None)
+}
+PANEL_DRIFT = {
+    'literacy_rate': ('literacy_rate_2025', 0.6, 0.25, 0.3, 30, 99),
+    'urbanization_rate': ('urbanization_rate_2025', 0.5, 0.3, 0.4, 3, 99),
+    'infrastructure_index': ('infrastructure_index', 1.4, 0.6, 1.2, 5, 110)
+}
+PANEL_COLUMNS = ['district_code', 'year'] + list(PANEL_GROWTH) + list(PANEL_DRIFT)
+# Year-on-year GDP shock applied to every district (pandemic contraction and rebound)
+PANEL_GDP_SHOCKS = {2020: -0.08, 2021: 0.05}
+
+
+def correlated(rng, development, profile, size):
+    """Draw one indicator that loads on the shared development factor, clipped to its range"""
+    mean, std, low, high = profile
+    noise = rng.standard_normal(size)
+    values = mean + std * (DEVELOPMENT_LOADING * development + np.sqrt(1 - DEVELOPMENT_LOADING ** 2) * noise)
+    return np.clip(values, low, high)
+
+
+def generate_chunk(rng, state, code, regions, start, size, road_scale=2.0):
+    """One chunk of districts for a state, as a frame in the source column order"""
+    tier = rng.choice(list(TIER_SHARES), size=size, p=list(TIER_SHARES.values()))
+    development = rng.standard_normal(size)
+    chunk = pd.DataFrame(index=np.arange(size))
+
+    for name in TIER_PROFILES['Metro']:
+        chunk[name] = 0.0
+    mix = np.zeros((size, 3))
+    quality = np.empty(size, dtype=object)
+
+    for tier_name, profile in TIER_PROFILES.items():
+        rows = np.flatnonzero(tier == tier_name)
+        if len(rows) == 0:
+            continue
+        for name, params in profile.items():
+            if name == 'population_2025':
+                # Population is right-skewed and independent of development
+                mean, std, low, high = params
+                sigma = np.sqrt(np.log1p((std / mean) ** 2))
+                values = np.clip(rng.lognormal(np.log(mean) - sigma ** 2 / 2, sigma, len(rows)), low, high)
+            else:
+                values = correlated(rng, development[rows], params, len(rows))
+            chunk.loc[rows, name] = values
+
+        # More developed districts get the less agricultural sector mixes
+        mixes = SECTOR_MIXES[tier_name]
+        position = np.clip(np.round((development[rows] + rng.normal(0, 0.5, len(rows)) + 1.5) / 3 * (len(mixes) - 1)), 0, len(mixes) - 1)
+        mix[rows] = np.asarray(mixes)[position.astype(int)]
+
+        labels, weights = DATA_QUALITY[tier_name]
+        quality[rows] = rng.choice(labels, size=len(rows), p=weights)
+
+    ids = np.arange(start + 1, start + size + 1)
+    population = np.round(chunk['population_2025']).astype(np.int64)
+    gdp_per_capita = np.round(chunk['gdp_per_capita']).astype(np.int64)
+    internet = np.round(chunk['internet_penetration']).astype(np.int64)
+    roads = np.round(chunk['road_density']).astype(np.int64)
+    power = np.round(chunk['power_availability']).astype(np.int64)
+    logistics = np.round(chunk['logistics_connectivity']).astype(np.int64)
+    banks = np.round(chunk['bank_branches_per_100k']).astype(np.int64)
+    diversification = 100 - mix[:, 2].astype(np.int64)
+    infrastructure = (internet + roads / road_scale + power + logistics) / 4
+    literacy = chunk['literacy_rate_2025'].round(2)
+    work = chunk['work_participation_rate_2025']
+    readiness = (0.49 * infrastructure + 0.21 * diversification + 0.15 * literacy + 0.07 * work + 0.44 * banks
+                 + rng.normal(0, 1.0, size))
+
+    out = pd.DataFrame({
+        'district_name': [f"{state} District {i}" for i in ids],
+        'district_code': [f"{code}{i:03d}" for i in ids],
+        'tier': tier,
+        'region': rng.choice(regions, size=size),
+        'state': state,
+        'population_2025': population,
+        'literacy_rate_2025': literacy,
+        'urbanization_rate_2025': chunk['urbanization_rate_2025'],
+        'work_participation_rate_2025': work,
+        'data_quality': quality,
+        'gdp_per_capita': gdp_per_capita,
+        'industrial_establishments': np.round(chunk['establishments_per_lakh'] * population / 1e5).astype(np.int64),
+        'service_sector_share': mix[:, 0].astype(np.int64),
+        'manufacturing_share': mix[:, 1].astype(np.int64),
+        'agriculture_share': mix[:, 2].astype(np.int64),
+        'bank_branches_per_100k': banks,
+        'internet_penetration': internet,
+        'road_density': roads,
+        'power_availability': power,
+        'logistics_connectivity': logistics,
+        'total_gdp': population * gdp_per_capita * 1e-5,
+        'economic_diversification_index': diversification,
+        'infrastructure_index': infrastructure,
+        'investment_readiness_score': np.clip(readiness, 0, 100).round(4)
+    })
+    return out[COLUMNS]
+
+
+def generate_subdistricts(rng, districts, per_district, unit_type):
+    """Sub-districts of a chunk of districts, scattered around their parent's indicators"""
+    counts = np.maximum(rng.poisson(per_district, len(districts)), 1)
+    parent = np.repeat(np.arange(len(districts)), counts)
+    rows = districts.iloc[parent].reset_index(drop=True)
+    size = len(rows)
+
+    # Split each district's population with gamma weights, so the parts add up to the parent
+    weights = rng.gamma(2.0, size=size)
+    starts = np.r_[0, np.cumsum(counts)[:-1]]
+    shares = weights / np.repeat(np.add.reduceat(weights, starts), counts)
+    population = np.round(rows['population_2025'].to_numpy() * shares).astype(np.int64)
+
+    # Larger units are the towns: more urban, more literate, more service-driven
+    size_effect = np.log(shares * counts[parent])
+    local = rng.standard_normal(size)
+    agriculture = np.clip(rows['agriculture_share'] - 8 * size_effect + 6 * local, 2, 90)
+    manufacturing = np.clip(rows['manufacturing_share'] + rng.normal(0, 4, size), 2, 60)
+    services = np.clip(100 - agriculture - manufacturing, 3, 95)
+    total = agriculture + manufacturing + services
+    sequence = np.arange(size) - np.repeat(starts, counts) + 1
+
+    out = pd.DataFrame({
+        'subdistrict_name': rows['district_name'] + ' ' + unit_type + ' ' + sequence.astype(str),
+        'subdistrict_code': rows['district_code'] + '-' + pd.Series(sequence).map('{:02d}'.format),
+        'subdistrict_type': unit_type,
+        'district_code': rows['district_code'],
+        'population_2025': population,
+        'literacy_rate_2025': np.clip(rows['literacy_rate_2025'] + 2 * size_effect + 2.5 * local, 40, 99).round(2),
+        'urbanization_rate_2025': np.clip(rows['urbanization_rate_2025'] + 12 * size_effect + 8 * local, 3, 99),
+        'work_participation_rate_2025': np.clip(rows['work_participation_rate_2025'] + rng.normal(0, 2, size), 25, 60),
+        'service_sector_share': np.round(100 * services / total).astype(np.int64),
+        'manufacturing_share': np.round(100 * manufacturing / total).astype(np.int64),
+        'agriculture_share': np.round(100 * agriculture / total).astype(np.int64),
+        'infrastructure_index': np.clip(rows['infrastructure_index'] + 5 * size_effect + rng.normal(0, 6, size), 10, 110),
+        'investment_readiness_score': np.clip(rows['investment_readiness_score'] + 4 * size_effect + rng.normal(0, 5, size), 0, 100).round(4)
+    })
+    return out[SUBDISTRICT_COLUMNS]
+
+
+def generate_panel(rng, districts, years):
+    """Yearly histories of a chunk of districts, walked back from their 2025 values"""
+    size = len(districts)
+    calendar = np.arange(PANEL_LAST_YEAR - years + 1, PANEL_LAST_YEAR + 1)
+    columns = {}
+
+    for name, (source, drift, drift_std, noise, _, _) in PANEL_GROWTH.items():
+        rates = rng.normal(drift, drift_std, (size, 1)) + rng.normal(0, noise, (size, years - 1))
+        if name == 'gdp_per_capita':
+            rates += np.array([PANEL_GDP_SHOCKS.get(year, 0.0) for year in calendar[1:]])
+        # Growth into each later year, accumulated back from the snapshot
+        backward = np.cumprod((1 + rates)[:, ::-1], axis=1)[:, ::-1]
+        history = districts[source].to_numpy(dtype=float)[:, None] / np.hstack([backward, np.ones((size, 1))])
+        columns[name] = np.round(history).astype(np.int64)
+
+    for name, (source, drift, drift_std, noise, low, high) in PANEL_DRIFT.items():
+        steps = rng.normal(drift, drift_std, (size, 1)) + rng.normal(0, noise, (size, years - 1))
+        backward = np.cumsum(steps[:, ::-1], axis=1)[:, ::-1]
+        history = districts[source].to_numpy(dtype=float)[:, None] - np.hstack([backward, np.zeros((size, 1))])
+        columns[name] = np.clip(history, low, high).round(2)
+
+    out = pd.DataFrame({name: values.ravel() for name, values in columns.items()})
+    out.insert(0, 'year', np.tile(calendar, size))
+    out.insert(0, 'district_code', np.repeat(districts['district_code'].to_numpy(), years))
+    return out[PANEL_COLUMNS]
+
+
+def state_sizes(rng, districts, states):
+    """Split the district total across states with uneven, seeded weights"""
+    weights = rng.gamma(4.0, size=states)
+    sizes = np.floor(districts * weights / weights.sum()).astype(int)
+    sizes[: districts - sizes.sum()] += 1
+    return sizes
+
+
+def generate(districts, states, out_dir, chunk_size=100_000, seed=42, overwrite=False, subdistricts=0,
+             panel_years=0):
+    """Stream synthetic state files into out_dir; returns {path: rows}
+
+    With `subdistricts` > 0, each district also gets about that many
+    sub-districts in out_dir/subdistricts/<state>_subdistricts.csv. With
+    `panel_years` > 1, the last that many years of every district are written
+    in long format to out_dir/panel/<state>_panel.csv.
+    """
+    if panel_years == 1:
+        raise ValueError("A panel needs at least 2 years")
+    if states > len(STATES):
+        raise ValueError(f"At most {len(STATES)} states are available")
+    os.makedirs(out_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    sizes = state_sizes(rng, districts, states)
+    regions_by_state = [list(rng.choice(REGIONS, size=4, replace=False)) for _ in range(states)]
+    road_scales = [ROAD_SCALES.get(state) or round(float(rng.uniform(*ROAD_SCALE_RANGE)), 1) for state, _ in STATES[:states]]
+
+    written = {}
+    for index, ((state, code), size) in enumerate(zip(STATES[:states], sizes)):
+        stem = state.lower().replace(' ', '_')
+        path = os.path.join(out_dir, f"{stem}_economic_analysis.csv")
+        sub_path = os.path.join(out_dir, 'subdistricts', f"{stem}_subdistricts.csv")
+        panel_path = os.path.join(out_dir, 'panel', f"{stem}_panel.csv")
+        extra = ([sub_path] if subdistricts else []) + ([panel_path] if panel_years else [])
+        for target in [path] + extra:
+            if os.path.exists(target) and not overwrite:
+                raise FileExistsError(f"{target} exists (use --force to overwrite)")
+
+        # Each chunk has its own seeded stream, so output is reproducible for a given chunk size
+        sub_rows = 0
+        for target in extra:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(path, 'w', newline='') as f, \
+                open(sub_path if subdistricts else os.devnull, 'w', newline='') as sub_f, \
+                open(panel_path if panel_years else os.devnull, 'w', newline='') as panel_f:
+            for start in range(0, size, chunk_size):
+                chunk_rng = np.random.default_rng([seed, index, start])
+                chunk = generate_chunk(chunk_rng, state, code, regions_by_state[index], start, min(chunk_size, size - start),
+                                       road_scales[index])
+                chunk.to_csv(f, header=start == 0, index=False)
+                if subdistricts:
+                    unit_type = SUBDISTRICT_TYPES[index % len(SUBDISTRICT_TYPES)]
+                    units = generate_subdistricts(chunk_rng, chunk, subdistricts, unit_type)
+                    units.to_csv(sub_f, header=start == 0, index=False)
+                    sub_rows += len(units)
+                if panel_years:
+                    history = generate_panel(chunk_rng, chunk, panel_years)
+                    history.to_csv(panel_f, header=start == 0, index=False)
+        written[path] = int(size)
+        if subdistricts:
+            written[sub_path] = sub_rows
+        if panel_years:
+            written[panel_path] = int(size) * panel_years
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate schema-faithful synthetic district data")
+    parser.add_argument('--districts', type=int, default=10_000, help="Total districts across all states")
+    parser.add_argument('--states', type=int, default=4, help=f"Number of states (1-{len(STATES)})")
+    parser.add_argument('--out-dir', default='synthetic_data')
+    parser.add_argument('--chunk-size', type=int, default=100_000, help="Rows generated and written per chunk")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--subdistricts', type=int, default=0,
+                        help="Average sub-districts per district (0 skips the sub-district files)")
+    parser.add_argument('--panel-years', type=int, default=0,
+                        help=f"Years of history per district ending {PANEL_LAST_YEAR} (0 skips the panel files)")
+    parser.add_argument('--force', action='store_true', help="Overwrite existing files in out-dir")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        written = generate(args.districts, args.states, args.out_dir, args.chunk_size, args.seed, args.force,
+                           args.subdistricts, args.panel_years)
+    except (ValueError, FileExistsError) as e:
+        sys.exit(str(e))
+
+    total_bytes = sum(os.path.getsize(path) for path in written)
+    state_files = {path: rows for path, rows in written.items() if path.endswith('_economic_analysis.csv')}
+    units = sum(rows for path, rows in written.items() if path.endswith('_subdistricts.csv'))
+    panel_rows = sum(rows for path, rows in written.items() if path.endswith('_panel.csv'))
+    print(f"Wrote {sum(state_files.values()):,} districts across {len(state_files)} state files"
+          + (f", {units:,} sub-districts" if units else "")
+          + (f", {panel_rows:,} panel rows" if panel_rows else "")
+          + f" ({total_bytes / 1e6:,.1f} MB) to {args.out_dir} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
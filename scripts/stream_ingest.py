@@ -0,0 +1,72 @@
+# Investment Atlas - Chunked ingestion of large district CSVs
+# Derives each *_economic_analysis.csv chunk by chunk into a parquet store,
+# using the same validation, derivations and schema as the app's load_data
+#
+# Usage: python scripts/stream_ingest.py big_state_economic_analysis.csv [...] --out-dir store --chunk-rows 250000 [--check]
+
+import argparse
+import logging
+import os
+import resource
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+warnings.filterwarnings('ignore')
+logging.disable(logging.WARNING)  # Streamlit warns about running outside `streamlit run`
+
+import streamlit_app as app
+
+
+def check_parity(csv_path, store_path):
+    """Differences between the streamed store and the app's in-memory ingest of the same file"""
+    streamed = app.apply_district_schema(app.pd.read_parquet(store_path))
+    parsed = app.apply_district_schema(app.derive_district_columns(app._read_source_csv(csv_path)))
+    problems = [f"{column}: {streamed[column].dtype} streamed vs {parsed[column].dtype} in memory"
+                for column in parsed.columns
+                if column in streamed.columns and streamed[column].dtype != parsed[column].dtype]
+    missing = sorted(set(parsed.columns) ^ set(streamed.columns))
+    if missing:
+        problems.append(f"columns in only one ingest: {', '.join(missing)}")
+    if not problems and not streamed['district_code'].equals(parsed['district_code']):
+        problems.append("district_code values differ")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream large district CSVs into a derived parquet store")
+    parser.add_argument('inputs', nargs='+', help="Source CSV files with the state file schema")
+    parser.add_argument('--out-dir', default='store', help="One <name>.parquet is written per input")
+    parser.add_argument('--chunk-rows', type=int, default=app.STREAMING_CHUNK_ROWS,
+                        help="Rows held in memory at a time")
+    parser.add_argument('--check', action='store_true',
+                        help="Also ingest each file in memory and compare dtypes with the store (reads the whole file)")
+    args = parser.parse_args()
+
+    failed = False
+    for csv_path in args.inputs:
+        store_path = os.path.join(args.out_dir, os.path.basename(csv_path)[:-len('.csv')] + '.parquet')
+        start = time.perf_counter()
+        rows, problems = app.stream_ingest(csv_path, store_path, args.chunk_rows)
+        if problems:
+            failed = True
+            print(f"❌ {csv_path}: {'; '.join(problems)}")
+            continue
+        print(f"✅ {csv_path}: {rows:,} districts -> {store_path} "
+              f"({os.path.getsize(store_path) / 1e6:,.1f} MB) in {time.perf_counter() - start:.1f}s")
+        if args.check:
+            mismatches = check_parity(csv_path, store_path)
+            if mismatches:
+                failed = True
+                print(f"❌ {csv_path}: streamed and in-memory ingest differ: {'; '.join(mismatches)}")
+            else:
+                print(f"✅ {csv_path}: streamed and in-memory ingest match")
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"Peak resident memory: {peak_mb:,.0f} MB")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
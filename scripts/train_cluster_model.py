@@ -0,0 +1,97 @@
+# Investment Atlas - Train the ai_cluster model
+# Fits mini-batch k-means on the state files (optionally with every
+# sub-district row), or folds new rows into the existing centroids with
+# --update, and writes the versioned artifact that load_data assigns with
+#
+# Usage: python scripts/train_cluster_model.py [--k 3] [--include-subdistricts] [--update]
+
+import argparse
+import datetime
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from train_score_model import app, load_training_frame
+
+
+def load_subdistrict_rows(data_dir):
+    """Cluster features of every sub-district file under data_dir/subdistricts"""
+    frames = [app._read_source_csv(path)[app.CLUSTER_FEATURES]
+              for path in app.discover_subdistrict_files(os.path.join(data_dir, 'subdistricts'))]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=app.CLUSTER_FEATURES)
+
+
+def silhouette(Z, labels, sample_rows, seed):
+    """Mean silhouette coefficient on a seeded row sample"""
+    rng = np.random.default_rng(seed)
+    rows = rng.choice(len(Z), min(sample_rows, len(Z)), replace=False)
+    Z, labels = Z[rows], labels[rows]
+    distances = np.sqrt(np.maximum((Z ** 2).sum(1)[:, None] - 2 * Z @ Z.T + (Z ** 2).sum(1), 0))
+    clusters = np.unique(labels)
+    if len(clusters) < 2:
+        return float('nan')
+    mean_to = np.stack([distances[:, labels == c].sum(1) / np.maximum((labels == c).sum() - (labels == c), 1)
+                        for c in clusters], axis=1)
+    own = np.searchsorted(clusters, labels)
+    a = mean_to[np.arange(len(Z)), own]
+    mean_to[np.arange(len(Z)), own] = np.inf
+    b = mean_to.min(1)
+    return float(np.mean((b - a) / np.maximum(a, b)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the district cluster model")
+    parser.add_argument('--data-dir', default=app.DATA_DIR)
+    parser.add_argument('--k', type=int, default=len(app.CLUSTER_NAMES))
+    parser.add_argument('--batch-size', type=int, default=1024)
+    parser.add_argument('--include-subdistricts', action='store_true',
+                        help="Also train on every row of data-dir/subdistricts")
+    parser.add_argument('--update', action='store_true',
+                        help="Fold the rows into the existing artifact's centroids instead of refitting")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--version', type=int, default=1)
+    parser.add_argument('--output', default=app.CLUSTER_MODEL_PATH)
+    args = parser.parse_args()
+
+    districts, digests = load_training_frame(args.data_dir)
+    rows = districts[app.CLUSTER_FEATURES]
+    if args.include_subdistricts:
+        rows = pd.concat([rows, load_subdistrict_rows(args.data_dir)], ignore_index=True)
+
+    start = time.perf_counter()
+    if args.update:
+        model = app.load_cluster_model(args.output)
+        if model is None:
+            sys.exit(f"No cluster model to update at {args.output}")
+        model.partial_fit(rows, batch_size=args.batch_size)
+        action = "Updated"
+    else:
+        model = app.ClusterModel.fit(rows, k=args.k, batch_size=args.batch_size, seed=args.seed, version=args.version)
+        action = "Fitted"
+    fit_s = time.perf_counter() - start
+
+    labels = model.assign_codes(rows)
+    Z = model.standardize(rows)
+    sizes = np.bincount(labels, minlength=len(model.names))
+    model.metrics = {
+        **model.metrics,
+        'inertia': round(float(((Z - model.centroids[labels]) ** 2).sum(1).mean()), 4),
+        'silhouette': round(silhouette(Z, labels, 2_000, args.seed), 4),
+        'sizes': dict(zip(model.names, sizes.tolist()))
+    }
+    model.trained_on = {'rows': len(rows), 'files': digests, 'subdistricts': args.include_subdistricts,
+                        'date': datetime.date.today().isoformat()}
+    model.save(args.output)
+
+    print(f"{action} {len(model.names)} clusters on {len(rows):,} rows in {fit_s:.2f}s "
+          f"(inertia {model.metrics['inertia']:.3f}, silhouette {model.metrics['silhouette']:.3f})")
+    print(model.profiles().round(1).to_string())
+    print(f"Model v{model.version} written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# Investment Atlas - Train the ml_predicted_score model
+# Fits the ridge scoring model on the state files, reports hold-out and
+# cross-validated accuracy and writes the versioned artifact that load_data
+# scores districts with; the app shows the stored cross-validation report
+#
+# Usage: python scripts/train_score_model.py [--data-dir data] [--alpha 1.0] [--folds 5] [--version 1]
+
+import argparse
+import datetime
+import logging
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+warnings.filterwarnings('ignore')
+logging.disable(logging.WARNING)  # Streamlit warns about running outside `streamlit run`
+
+import streamlit_app as app
+
+
+def load_training_frame(data_dir):
+    """Every valid state file in data_dir, concatenated, plus {file name: content hash}"""
+    frames, digests = [], {}
+    for path in app.discover_state_files(data_dir):
+        frame = app._read_source_csv(path)
+        problems = app.validate_state_file(frame)
+        if problems:
+            print(f"⚠️ Skipped {os.path.basename(path)}: {'; '.join(problems)}")
+            continue
+        frames.append(frame)
+        digests[os.path.basename(path)] = app.source_digest(path)
+    if not frames:
+        sys.exit(f"No usable state files in {data_dir}")
+    return pd.concat(frames, ignore_index=True), digests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the district scoring model")
+    parser.add_argument('--data-dir', default=app.DATA_DIR)
+    parser.add_argument('--alpha', type=float, default=1.0, help="Ridge penalty on standardized features")
+    parser.add_argument('--holdout', type=float, default=0.3, help="Share of districts held out for evaluation")
+    parser.add_argument('--folds', type=int, default=app.CV_FOLDS, help="Cross-validation folds stored with the model")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--version', type=int, default=1)
+    parser.add_argument('--output', default=app.SCORE_MODEL_PATH)
+    args = parser.parse_args()
+
+    df, digests = load_training_frame(args.data_dir)
+    target = df[app.SCORE_MODEL_TARGET].to_numpy(dtype=float)
+
+    # Hold-out evaluation, then refit on every district for the shipped artifact
+    order = np.random.default_rng(args.seed).permutation(len(df))
+    n_test = int(round(len(df) * args.holdout))
+    test, train = order[:n_test], order[n_test:]
+    holdout_model = app.ScoringModel.fit(df.iloc[train], alpha=args.alpha)
+    metrics = {
+        'train': app.regression_metrics(target[train], holdout_model.predict(df.iloc[train]).astype(float)),
+        'test': app.regression_metrics(target[test], holdout_model.predict(df.iloc[test]).astype(float)),
+        'holdout': args.holdout,
+        'seed': args.seed
+    }
+    start = time.perf_counter()
+    metrics['cv'] = app.cross_validation_report(df, holdout_model, args.folds, args.seed)
+    cv_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model = app.ScoringModel.fit(
+        df, alpha=args.alpha, version=args.version, metrics=metrics,
+        trained_on={'rows': len(df), 'files': digests, 'date': datetime.date.today().isoformat()}
+    )
+    fit_s = time.perf_counter() - start
+    model.save(args.output)
+
+    print(f"Trained on {len(df):,} districts in {fit_s * 1000:.1f} ms (alpha={args.alpha})")
+    for split in ('train', 'test'):
+        m = metrics[split]
+        print(f"  {split:<5} R² {m['r2']:.4f}  MAE {m['mae']:.3f}  RMSE {m['rmse']:.3f}")
+    if metrics['cv'] is not None:
+        cv = metrics['cv']['summary']
+        print(f"  cv    R² {cv['r2']:.4f}  MAE {cv['mae']:.3f}  RMSE {cv['rmse']:.3f}  "
+              f"({cv['folds']} folds in {cv_s:.1f}s)")
+    print(f"Model v{args.version} written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
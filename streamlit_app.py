@@ -2,13 +2,39 @@
 # Professional consulting-grade web application
 
 import streamlit as st
-import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import numpy as np
+import importlib
+import glob
 import json
 import os
+import hashlib
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+import re
+import shutil
+import time
+import warnings
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access
+    
+    Deliberately kept out of sys.modules, so tools that scan loaded modules
+    (inspect, Streamlit's own checks) cannot trigger the import early.
+    """
+    
+    def __init__(self, name):
+        self._name = name
+    
+    def __getattr__(self, attr):
+        value = getattr(importlib.import_module(self._name), attr)
+        setattr(self, attr, value)
+        return value
+
+# pandas is the one dependency Streamlit does not already import, so it loads
+# with the data; pages that never touch the data (About) skip it.
+pd = LazyModule("pandas")
 
 # Professional page configuration
 st.set_page_config(
@@ -24,7 +50,7 @@ st.set_page_config(
 )
 
 # Dark theme professional CSS styling
-st.markdown("""
+APP_CSS = """
 <style>
     /* Import professional font */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
@@ -279,112 +305,2318 @@ st.markdown("""
         color: #e2e8f0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# Data loading function
-@st.cache_data
-def load_data():
-    """Load all processed data with error handling"""
+@st.cache_resource(show_spinner=False)
+def minified_css(css):
+    """Strip comments and whitespace from the stylesheet (computed once per process)"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};:,>])\s*', r'\1', css).strip()
+
+# Re-sent on every rerun, so it goes out minified
+st.markdown(minified_css(APP_CSS), unsafe_allow_html=True)
+
+# On-disk cache for the fully derived district frame and for each state file on
+# its own. Entries are keyed by the content hashes of the source CSVs plus
+# the derivation tag (DERIVATION_VERSION and the scoring model), so editing a
+# data file, retraining the model or changing the derivations below
+# invalidates the cache automatically.
+DATA_DIR = "data"
+CACHE_DIR = os.path.join(DATA_DIR, ".cache")
+DERIVATION_VERSION = 6
+
+@st.cache_data(show_spinner=False, max_entries=1000)
+def _file_digest(path, mtime_ns, size):
+    """Content hash of one source file; the stat key means unchanged files are hashed once"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+def source_digest(path):
+    """Content hash of a source file, recomputed only when its size or mtime changes"""
+    stat = os.stat(path)
+    return _file_digest(path, stat.st_mtime_ns, stat.st_size)
+
+def _source_fingerprint(file_digests, tag=None):
+    """Combine the name and content hash of every source file into one cache key"""
+    digest = hashlib.sha256(f"derivation-{tag or derivation_tag()}".encode())
+    for name in sorted(file_digests):
+        digest.update(f"{name}:{file_digests[name]}".encode())
+    return digest.hexdigest()[:16]
+
+def _frame_cache_paths(fingerprint):
+    """Parquet paths for the cached district frame and feature importance"""
+    return (os.path.join(CACHE_DIR, f"districts_{fingerprint}.parquet"),
+            os.path.join(CACHE_DIR, f"feature_importance_{fingerprint}.parquet"))
+
+def _read_frame_cache(fingerprint):
+    """Return the cached (df, feature_importance) pair, or None on a miss"""
+    df_path, fi_path = _frame_cache_paths(fingerprint)
+    if not (os.path.exists(df_path) and os.path.exists(fi_path)):
+        return None
     try:
-        # Try multiple possible file locations and names
-        base_path = "data"
-        possible_files = [
-            # Your actual files with both current directory and full path
-            'multi_state_economic_analysis.csv',
-            'maharashtra_economic_analysis.csv',
-            'tamil_nadu_economic_analysis.csv',
-            'karnataka_economic_analysis.csv',
-            'uttar_pradesh_economic_analysis.csv',
-            'multi_state_investment_comparison.csv',
-            # Expected files (if they exist)
-            'final_ml_investment_analysis.csv',
-            'feature_importance_analysis.csv'
-        ]
-        
-        # Find available files
-        available_files = {}
-        for file in possible_files:
-            file_paths = [
-                file,  # Current directory
-                os.path.join(base_path, file)  # Full path
-            ]
-            
-            for file_path in file_paths:
-                if os.path.exists(file_path):
-                    try:
-                        temp_df = pd.read_csv(file_path)
-                        available_files[file.replace('.csv', '')] = temp_df
-                        break
-                    except Exception as e:
-                        pass  # Silent failure
-        
-        # Create main dataframe by combining all state files
-        state_dataframes = []
+        return pd.read_parquet(df_path), pd.read_parquet(fi_path)
+    except Exception:
+        return None  # Unreadable cache is treated as a miss and rebuilt
+
+def _write_frame_cache(fingerprint, df, feature_importance):
+    """Persist the derived frames and drop entries for older source versions"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for frame, path in zip((df, feature_importance), _frame_cache_paths(fingerprint)):
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            frame.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)  # Atomic, so concurrent pods never see partial files
         
-        # ALWAYS try to combine individual state files first (prioritize individual files)
-        state_files = ['maharashtra_economic_analysis', 'tamil_nadu_economic_analysis', 
-              'karnataka_economic_analysis', 'uttar_pradesh_economic_analysis']
+        current = {os.path.basename(path) for path in _frame_cache_paths(fingerprint)}
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith(('districts_', 'feature_importance_')) and name not in current:
+                os.remove(os.path.join(CACHE_DIR, name))
+    except Exception:
+        pass  # Caching is an optimisation; the app still works without it
 
-        for state_file in state_files:
-            if state_file in available_files:
-               state_dataframes.append(available_files[state_file])
+def _state_unit_path(path, digest):
+    """Parquet path of one derived state file, keyed by its content and the derivations"""
+    stem = os.path.basename(path)[:-len('.csv')]
+    return os.path.join(CACHE_DIR, f"state_{stem}_{derivation_tag()}_{digest}.parquet")
 
-            # If we got state files, use them. Otherwise fall back to combined file
-        if state_dataframes:
-            df = pd.concat(state_dataframes, ignore_index=True)
-        elif 'multi_state_economic_analysis' in available_files:
-            df = available_files['multi_state_economic_analysis']
+def _prune_cache_units(prefix, keep):
+    """Remove cached parquet units starting with `prefix` other than the paths in `keep`"""
+    keep = {os.path.basename(path) for path in keep}
+    for name in os.listdir(CACHE_DIR):
+        if name.startswith(prefix) and name.endswith('.parquet') and name not in keep:
+            os.remove(os.path.join(CACHE_DIR, name))
+
+def _prune_state_units(path, keep):
+    """Remove cached units of a state other than `keep`"""
+    _prune_cache_units(f"state_{os.path.basename(path)[:-len('.csv')]}_", [keep])
+
+def _write_state_unit(path, digest, frame):
+    """Persist one derived state file and drop older versions of the same state"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        unit_path = _state_unit_path(path, digest)
+        tmp_path = f"{unit_path}.{os.getpid()}.tmp"
+        frame.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, unit_path)
+        _prune_state_units(path, unit_path)
+    except Exception:
+        pass  # Caching is an optimisation; the app still works without it
+
+# Explicit in-memory schema for the combined district frame. Labels become
+# categoricals, keys text, counts become 32-bit integers and rates/shares/indices become
+# float32; total_gdp stays float64 because it is a large monetary amount.
+DISTRICT_SCHEMA = {
+    # Keys
+    'district_code': 'str',
+    # Labels
+    'state': 'category',
+    'tier': 'category',
+    'region': 'category',
+    'data_quality': 'category',
+    'investment_risk_category': 'category',
+    'ai_cluster': 'category',
+    # Counts
+    'population_2025': 'int32',
+    'gdp_per_capita': 'int32',
+    'industrial_establishments': 'int32',
+    # Rates, shares and indices
+    'literacy_rate_2025': 'float32',
+    'urbanization_rate_2025': 'float32',
+    'work_participation_rate_2025': 'float32',
+    'service_sector_share': 'float32',
+    'manufacturing_share': 'float32',
+    'agriculture_share': 'float32',
+    'bank_branches_per_100k': 'float32',
+    'internet_penetration': 'float32',
+    'road_density': 'float32',
+    'power_availability': 'float32',
+    'logistics_connectivity': 'float32',
+    'economic_diversification_index': 'float32',
+    'infrastructure_index': 'float32',
+    'investment_readiness_score': 'float32',
+    'ml_predicted_score': 'float32',
+    'lat': 'float32',
+    'lon': 'float32',
+}
+
+# Columns every state file must provide; all but the labels must be numeric
+STATE_FILE_COLUMNS = [
+    'district_name', 'district_code', 'tier', 'region', 'state', 'population_2025',
+    'literacy_rate_2025', 'urbanization_rate_2025', 'work_participation_rate_2025', 'data_quality',
+    'gdp_per_capita', 'industrial_establishments', 'service_sector_share', 'manufacturing_share',
+    'agriculture_share', 'bank_branches_per_100k', 'internet_penetration', 'road_density',
+    'power_availability', 'logistics_connectivity', 'total_gdp', 'economic_diversification_index',
+    'infrastructure_index', 'investment_readiness_score'
+]
+STATE_FILE_LABELS = ('district_name', 'district_code', 'tier', 'region', 'state', 'data_quality')
+
+def validate_state_file(frame, columns=STATE_FILE_COLUMNS, labels=STATE_FILE_LABELS, keys=('district_code',)):
+    """Schema problems in one parsed state file (empty list if it is usable)"""
+    problems = []
+    missing = [c for c in columns if c not in frame.columns]
+    if missing:
+        more = f" and {len(missing) - 5} more" if len(missing) > 5 else ""
+        problems.append(f"missing columns: {', '.join(missing[:5])}{more}")
+    non_numeric = [c for c in columns
+                   if c in frame.columns and c not in labels
+                   and not pd.api.types.is_numeric_dtype(frame[c])]
+    if non_numeric:
+        problems.append(f"non-numeric values in: {', '.join(non_numeric)}")
+    for key in keys:
+        if key in frame.columns and frame[key].isna().any():
+            problems.append(f"empty {key} values")
+    return problems
+
+def apply_district_schema(df):
+    """Cast the district frame to DISTRICT_SCHEMA, leaving unknown columns untouched"""
+    typed = {}
+    for column, dtype in DISTRICT_SCHEMA.items():
+        if column not in df.columns or str(df[column].dtype) == dtype:
+            continue
+        if dtype == 'str':
+            typed[column] = df[column].astype('str')
+        elif dtype == 'category':
+            typed[column] = df[column].astype('category')
+        elif dtype.startswith('int'):
+            values = pd.to_numeric(df[column], errors='coerce').round()
+            # Nullable integers keep missing counts instead of failing the cast
+            typed[column] = values.astype(dtype.capitalize() if values.isna().any() else dtype)
         else:
-            st.error("❌ No economic analysis files found!")
-            return None, None
+            typed[column] = pd.to_numeric(df[column], errors='coerce').astype(dtype)
+    return df.assign(**typed)
+
+def memory_footprint_report(before, after):
+    """Per-column memory usage of a frame before and after apply_district_schema"""
+    report = pd.DataFrame({
+        'dtype_before': before.dtypes.astype(str),
+        'dtype_after': after.dtypes.astype(str),
+        'bytes_before': before.memory_usage(index=False, deep=True),
+        'bytes_after': after.memory_usage(index=False, deep=True),
+    })
+    report.loc['TOTAL'] = ['', '', report['bytes_before'].sum(), report['bytes_after'].sum()]
+    report['reduction_pct'] = (1 - report['bytes_after'] / report['bytes_before']) * 100
+    return report
+
+# Investment risk bands over ml_predicted_score, ordered from highest risk to
+# lowest. A score strictly above thresholds[i] moves into labels[i + 1].
+RISK_BAND_THRESHOLDS = (80, 120)
+RISK_BAND_LABELS = (
+    'Higher Risk, Moderate Return',
+    'Medium Risk, Good Return',
+    'Low Risk, High Return'
+)
+RISK_BAND_COLORS = ('#f6ad55', '#63b3ed', '#68d391')  # Aligned with RISK_BAND_LABELS
+
+def assign_risk_bands(scores, thresholds=RISK_BAND_THRESHOLDS, labels=RISK_BAND_LABELS):
+    """Band scores into an ordered risk Categorical in a single vectorized pass"""
+    thresholds = np.asarray(thresholds, dtype=float)
+    if len(labels) != len(thresholds) + 1:
+        raise ValueError(f"Expected {len(thresholds) + 1} risk labels for {len(thresholds)} thresholds, got {len(labels)}")
+    if np.any(np.diff(thresholds) <= 0):
+        raise ValueError("Risk band thresholds must be strictly increasing")
+    
+    scores = np.asarray(scores, dtype=float)
+    codes = np.searchsorted(thresholds, scores, side='left')
+    codes[np.isnan(scores)] = 0  # Unscored districts fall into the highest-risk band
+    return pd.Categorical.from_codes(codes, categories=list(labels), ordered=True)
+
+def risk_band_ranges(thresholds=RISK_BAND_THRESHOLDS, labels=RISK_BAND_LABELS):
+    """(label, score range text) for every band, lowest risk first, as assign_risk_bands cuts them"""
+    bounds = [f"{threshold:g}" for threshold in thresholds]
+    ranges = [f"Score ≤{bounds[0]}"] + [f"Score {low}-{high}" for low, high in zip(bounds, bounds[1:])] + [f"Score >{bounds[-1]}"]
+    return list(zip(labels, ranges))[::-1]
+
+def risk_band_rank(categories, labels=RISK_BAND_LABELS):
+    """1-based band position (higher = lower risk), NaN for labels outside the bands"""
+    positions = pd.Index(labels).get_indexer(np.asarray(categories, dtype=object))
+    return np.where(positions >= 0, positions + 1, np.nan)
+
+# Representational map placement: districts are scattered around their state
+# centre within +/- lat_range / lon_range degrees.
+STATE_CENTERS = {
+    'Maharashtra': {'lat': 19.7515, 'lon': 75.7139, 'lat_range': 1.2, 'lon_range': 1.5},
+    'Tamil Nadu': {'lat': 11.1271, 'lon': 78.6569, 'lat_range': 1.0, 'lon_range': 1.2},
+    'Karnataka': {'lat': 15.3173, 'lon': 75.7139, 'lat_range': 1.0, 'lon_range': 1.2},
+    'Uttar Pradesh': {'lat': 26.8467, 'lon': 80.9462, 'lat_range': 1.5, 'lon_range': 2.0}
+}
+DEFAULT_CENTER = {'lat': 20.0, 'lon': 77.0, 'lat_range': 0.0, 'lon_range': 0.0}
+
+def assign_district_coordinates(df):
+    """Vectorized lat/lon per district, seeded by district_code so positions never move"""
+    centers = pd.DataFrame(STATE_CENTERS).T
+    state = pd.Series(np.asarray(df['state'], dtype=object), index=df.index)
+    lookup = {field: state.map(centers[field]).fillna(DEFAULT_CENTER[field]).to_numpy(dtype=float)
+              for field in DEFAULT_CENTER}
+    
+    offsets = seeded_uniforms(district_keys(df), 2) * 2 - 1
+    lat = lookup['lat'] + offsets[:, 0] * lookup['lat_range']
+    lon = lookup['lon'] + offsets[:, 1] * lookup['lon_range']
+    return lat, lon
+
+def apply_district_centroids(df, centroids):
+    """Take lat/lon from a district centroid table; unmatched districts keep generated positions"""
+    centroids = centroids.drop_duplicates('district_code').set_index('district_code')
+    codes = df['district_code']
+    lat, lon = (df['lat'], df['lon']) if {'lat', 'lon'} <= set(df.columns) else assign_district_coordinates(df)
+    df['lat'] = codes.map(centroids['lat']).fillna(pd.Series(lat, index=df.index)).to_numpy(dtype=float)
+    df['lon'] = codes.map(centroids['lon']).fillna(pd.Series(lon, index=df.index)).to_numpy(dtype=float)
+    return df
+
+# Scoring model behind ml_predicted_score: a ridge regression on standardized
+# district features, trained by scripts/train_score_model.py and stored as a
+# versioned JSON artifact. Scoring is one matrix-vector product per frame.
+SCORE_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "investment_score_v1.json")
+SCORE_MODEL_TARGET = 'investment_readiness_score'
+# (column, transform) pairs; skewed counts and amounts are modelled on a log scale
+SCORE_FEATURES = [
+    ('population_2025', 'log1p'),
+    ('literacy_rate_2025', 'identity'),
+    ('urbanization_rate_2025', 'identity'),
+    ('work_participation_rate_2025', 'identity'),
+    ('gdp_per_capita', 'log1p'),
+    ('industrial_establishments', 'log1p'),
+    ('service_sector_share', 'identity'),
+    ('manufacturing_share', 'identity'),
+    ('agriculture_share', 'identity'),
+    ('bank_branches_per_100k', 'identity'),
+    ('internet_penetration', 'identity'),
+    ('road_density', 'identity'),
+    ('power_availability', 'identity'),
+    ('logistics_connectivity', 'identity'),
+    ('economic_diversification_index', 'identity'),
+    ('infrastructure_index', 'identity')
+]
+
+class ScoringModel:
+    """Ridge regression over SCORE_FEATURES with its standardization, fitted in closed form
+    
+    Missing feature values are imputed with the training mean (a standardized
+    zero), and predictions are clipped to the range seen in training.
+    """
+    
+    ALGORITHM = 'ridge'
+    
+    def __init__(self, features, means, scales, coefficients, intercept, target_range, alpha=1.0,
+                 version=1, target=SCORE_MODEL_TARGET, metrics=None, trained_on=None):
+        self.features = [tuple(feature) for feature in features]
+        self.means = np.asarray(means, dtype=float)
+        self.scales = np.asarray(scales, dtype=float)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.intercept = float(intercept)
+        self.target_range = tuple(target_range)
+        self.alpha = alpha
+        self.version = version
+        self.target = target
+        self.metrics = metrics or {}
+        self.trained_on = trained_on
+    
+    @staticmethod
+    def raw_feature(df, column, transform):
+        """One transformed (unstandardized) feature column, NaN where a value is missing"""
+        values = df[column]
+        if not pd.api.types.is_numeric_dtype(values):
+            values = pd.to_numeric(values, errors='coerce')
+        values = values.to_numpy(dtype=float, na_value=np.nan)
+        return np.log1p(np.clip(values, 0, None)) if transform == 'log1p' else values
+    
+    @classmethod
+    def raw_features(cls, df, features):
+        """Transformed (unstandardized) feature matrix, NaN where a value is missing"""
+        return np.column_stack([cls.raw_feature(df, column, transform) for column, transform in features])
+    
+    @classmethod
+    def fit(cls, df, features=SCORE_FEATURES, target=SCORE_MODEL_TARGET, alpha=1.0, **metadata):
+        """Fit on every row with a target value"""
+        X = cls.raw_features(df, features)
+        y = pd.to_numeric(df[target], errors='coerce').to_numpy(dtype=float)
+        return cls.fit_matrix(X, y, features, alpha=alpha, target=target, **metadata)
+    
+    @classmethod
+    def fit_matrix(cls, X, y, features, alpha=1.0, **metadata):
+        """Fit on a transformed feature matrix (raw_features) and its targets, skipping rows without a target"""
+        rows = ~np.isnan(y)
+        if not rows.all():
+            X, y = X[rows], y[rows]
         
-        # Add missing columns with dummy data if needed
-        if 'ml_predicted_score' not in df.columns:
-            df['ml_predicted_score'] = df['investment_readiness_score'] if 'investment_readiness_score' in df.columns else np.random.uniform(50, 150, len(df))
+        # NaN-aware statistics are several times slower, so only use them when a value is missing
+        missing = np.isnan(X).any()
+        means = np.nanmean(X, axis=0) if missing else X.mean(axis=0)
+        scales = np.nanstd(X, axis=0) if missing else X.std(axis=0)
+        scales[~(scales > 0)] = 1.0  # Constant features contribute nothing
+        Z = X - means
+        Z /= scales
+        if missing:
+            np.nan_to_num(Z, copy=False)
         
-        if 'investment_risk_category' not in df.columns:
-            # Create risk categories based on existing data
-            df['investment_risk_category'] = df.apply(lambda row: 
-                'Low Risk, High Return' if row['ml_predicted_score'] > 120 else
-                'Medium Risk, Good Return' if row['ml_predicted_score'] > 80 else
-                'Higher Risk, Moderate Return', axis=1)
+        # Closed-form ridge on centred data: (Z'Z + alpha I) beta = Z'(y - mean(y))
+        intercept = y.mean()
+        coefficients = np.linalg.solve(Z.T @ Z + alpha * np.eye(Z.shape[1]), Z.T @ (y - intercept))
+        return cls(features, means, scales, coefficients, intercept, (float(y.min()), float(y.max())),
+                   alpha=alpha, **metadata)
+    
+    def can_score(self, df):
+        return all(column in df.columns for column, _ in self.features)
+    
+    def predict(self, df):
+        """Scores for every row of df in one vectorized batch
         
-        if 'ai_cluster' not in df.columns:
-            # Create simple clusters based on tier
+        Standardization is folded into per-feature weights, so scoring
+        accumulates one column at a time instead of building a standardized
+        matrix; a missing value scores as its training mean.
+        """
+        return np.clip(self.predict_unclipped(df), *self.target_range).astype(np.float32)
+    
+    def predict_unclipped(self, df):
+        """Float64 scores before clipping to the target range"""
+        weights = self.weights
+        scores = np.full(len(df), self.intercept - weights @ self.means)
+        for (column, transform), weight, mean in zip(self.features, weights, self.means):
+            values = self.raw_feature(df, column, transform)
+            scores += weight * np.where(np.isnan(values), mean, values)
+        return scores
+    
+    @property
+    def weights(self):
+        """Coefficients on the transformed but unstandardized features"""
+        return self.coefficients / self.scales
+    
+    def feature_matrix(self, df):
+        """Transformed feature matrix with missing values imputed by the training means"""
+        X = self.raw_features(df, self.features)
+        return np.where(np.isnan(X), self.means, X)
+    
+    def predict_matrix(self, X):
+        """Scores for a transformed feature matrix (raw_features), imputing missing values like predict"""
+        scores = np.where(np.isnan(X), self.means, X) @ self.weights + (self.intercept - self.weights @ self.means)
+        return np.clip(scores, *self.target_range)
+    
+    def predict_permuted(self, X, unclipped, j, permutations):
+        """Scores with feature j of X shuffled by each row of `permutations`, as one (repeats, rows) batch
+        
+        Only feature j changes, so each permuted score is the unpermuted
+        (unclipped) score plus that feature's weighted change.
+        """
+        column = X[:, j]
+        scores = column[permutations]
+        scores -= column  # In place: the batch is repeats x rows
+        scores *= self.weights[j]
+        scores += unclipped
+        return np.clip(scores, *self.target_range, out=scores)
+    
+    def to_artifact(self):
+        return {
+            'algorithm': self.ALGORITHM,
+            'version': self.version,
+            'target': self.target,
+            'alpha': self.alpha,
+            'features': [
+                {'column': column, 'transform': transform, 'mean': mean, 'scale': scale, 'coefficient': coefficient}
+                for (column, transform), mean, scale, coefficient
+                in zip(self.features, self.means.tolist(), self.scales.tolist(), self.coefficients.tolist())
+            ],
+            'intercept': self.intercept,
+            'target_range': list(self.target_range),
+            'metrics': self.metrics,
+            'trained_on': self.trained_on
+        }
+    
+    @classmethod
+    def from_artifact(cls, artifact):
+        if artifact.get('algorithm') != cls.ALGORITHM:
+            raise ValueError(f"Unsupported model algorithm: {artifact.get('algorithm')}")
+        features = artifact['features']
+        return cls(
+            [(f['column'], f['transform']) for f in features],
+            [f['mean'] for f in features],
+            [f['scale'] for f in features],
+            [f['coefficient'] for f in features],
+            artifact['intercept'],
+            artifact['target_range'],
+            alpha=artifact['alpha'],
+            version=artifact['version'],
+            target=artifact['target'],
+            metrics=artifact.get('metrics'),
+            trained_on=artifact.get('trained_on')
+        )
+    
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_artifact(), f, indent=2)
+            f.write('\n')
+
+
+IMPORTANCE_REPEATS = 5
+IMPORTANCE_SAMPLE_ROWS = 200_000
+
+def permutation_importance(df, model, repeats=IMPORTANCE_REPEATS, sample_rows=IMPORTANCE_SAMPLE_ROWS, seed=42):
+    """Permutation importance of every model feature, as a frame sorted by importance
+    
+    importance is a feature's share of the total increase in squared error
+    when features are shuffled one at a time against the model's target.
+    Each feature's repeats are scored as one batch and features run on a
+    thread pool (NumPy releases the GIL); frames above sample_rows are
+    scored on a seeded row sample.
+    """
+    rng = np.random.default_rng(seed)
+    target = pd.to_numeric(df[model.target], errors='coerce').to_numpy(dtype=float)
+    rows = np.flatnonzero(~np.isnan(target))
+    if len(rows) > sample_rows:
+        rows = np.sort(rng.choice(rows, sample_rows, replace=False))
+    y = target[rows]
+    
+    X = model.feature_matrix(df[[column for column, _ in model.features]].iloc[rows])
+    unclipped = X @ model.weights + (model.intercept - model.weights @ model.means)
+    baseline = np.mean((np.clip(unclipped, *model.target_range) - y) ** 2)
+    permutations = np.stack([rng.permutation(len(rows)) for _ in range(repeats)])
+    
+    def mse_increase(j):
+        errors = model.predict_permuted(X, unclipped, j, permutations)
+        errors -= y
+        return np.mean(np.square(errors, out=errors), axis=1) - baseline
+    
+    with ThreadPoolExecutor(max_workers=min(len(model.features), os.cpu_count() or 1)) as pool:
+        increases = np.array(list(pool.map(mse_increase, range(len(model.features)))))
+    
+    increases = np.clip(increases, 0, None)
+    totals = increases.mean(axis=1).sum() or 1.0
+    shares = increases / increases.sum(axis=0, keepdims=True).clip(min=1e-12)
+    importance = pd.DataFrame({
+        'feature': [column for column, _ in model.features],
+        'importance': increases.mean(axis=1) / totals,
+        'importance_std': shares.std(axis=1),
+        'mse_increase': increases.mean(axis=1)
+    })
+    return importance.sort_values('importance', ascending=False, ignore_index=True)
+
+def is_permutation_importance(feature_importance):
+    """Whether importance shares come from permutation_importance rather than a provided analysis file"""
+    return 'mse_increase' in feature_importance.columns
+
+def regression_metrics(actual, predicted):
+    """R², MAE and RMSE of predicted against actual"""
+    residuals = actual - predicted
+    return {
+        'r2': round(float(1 - (residuals ** 2).sum() / ((actual - actual.mean()) ** 2).sum()), 4),
+        'mae': round(float(np.abs(residuals).mean()), 4),
+        'rmse': round(float(np.sqrt((residuals ** 2).mean())), 4)
+    }
+
+# k-fold cross-validation of the scoring model's specification (features and
+# alpha). Pages validate against the loaded districts, with the report cached
+# per data version; scripts/train_score_model.py also stores the report for
+# the training data in the artifact's metrics['cv'].
+CV_FOLDS = 5
+CV_SAMPLE_POINTS = 2_000
+
+def _cross_validation_fold(X, y, bounds, features, alpha, fold):
+    """Fit on every other fold, then score this one: (train metrics, test metrics, test predictions)
+    
+    Rows arrive shuffled and grouped by fold, so each fold is the slice
+    between consecutive bounds and its training rows are the two slices
+    around it.
+    """
+    start, stop = bounds[fold], bounds[fold + 1]
+    X_train, y_train = np.concatenate((X[:start], X[stop:])), np.concatenate((y[:start], y[stop:]))
+    model = ScoringModel.fit_matrix(X_train, y_train, features, alpha=alpha)
+    predicted = model.predict_matrix(X[start:stop])
+    return (regression_metrics(y_train, model.predict_matrix(X_train)),
+            regression_metrics(y[start:stop], predicted), predicted)
+
+def cross_validate(df, model, k=CV_FOLDS, seed=42):
+    """Per-fold metrics and out-of-fold predictions (NaN for rows without a target)
+    
+    Rows with a target are shuffled by a seeded permutation and cut into k
+    folds of near-equal size. Folds are refitted on a thread pool (NumPy
+    releases the GIL in the solves and products), like permutation_importance.
+    """
+    target = pd.to_numeric(df[model.target], errors='coerce').to_numpy(dtype=float)
+    rows = np.random.default_rng(seed).permutation(np.flatnonzero(~np.isnan(target)))
+    bounds = np.linspace(0, len(rows), k + 1).astype(int)
+    X, y = ScoringModel.raw_features(df, model.features)[rows], target[rows]
+    
+    with ThreadPoolExecutor(max_workers=min(k, os.cpu_count() or 1)) as pool:
+        results = list(pool.map(lambda fold: _cross_validation_fold(X, y, bounds, model.features, model.alpha, fold),
+                                 range(k)))
+    
+    predicted = np.full(len(df), np.nan)
+    folds = []
+    for fold, (train, test, fold_predictions) in enumerate(results):
+        predicted[rows[bounds[fold]:bounds[fold + 1]]] = fold_predictions
+        folds.append({'fold': fold + 1, 'rows': len(fold_predictions), 'train_r2': train['r2'], **test})
+    return pd.DataFrame(folds), predicted
+
+def cross_validation_report(df, model, k=CV_FOLDS, seed=42):
+    """Cross-validated accuracy of the model's specification on df, in JSON-ready form
+    
+    Returns a summary, the per-fold metrics, out-of-fold residuals by tier
+    and a seeded sample of (actual, predicted) points, each as plain records,
+    or None without enough targets.
+    """
+    actual = pd.to_numeric(df[model.target], errors='coerce').to_numpy(dtype=float)
+    if np.count_nonzero(~np.isnan(actual)) < 2 * k:
+        return None
+    
+    folds, predicted = cross_validate(df, model, k, seed)
+    scored = np.flatnonzero(~np.isnan(predicted))
+    residuals = actual - predicted
+    
+    summary = {
+        'folds': k,
+        'rows': len(scored),
+        'features': len(model.features),
+        'alpha': model.alpha,
+        'overfit_gap': round(float((folds['train_r2'] - folds['r2']).mean()), 4)
+    }
+    for metric in ('r2', 'mae', 'rmse'):
+        summary[metric] = round(float(folds[metric].mean()), 4)
+        summary[f'{metric}_std'] = round(float(folds[metric].std(ddof=0)), 4)
+    
+    by_tier = pd.DataFrame({
+        'tier': df['tier'].astype(str).to_numpy()[scored],
+        'residual': residuals[scored],
+        'abs_residual': np.abs(residuals[scored])
+    }).groupby('tier').agg(
+        districts=('residual', 'size'), bias=('residual', 'mean'), mae=('abs_residual', 'mean')
+    ).reset_index().round(4)
+    
+    sample = np.sort(np.random.default_rng(seed).choice(scored, min(CV_SAMPLE_POINTS, len(scored)), replace=False))
+    points = pd.DataFrame({'actual': actual[sample], 'predicted': predicted[sample]}).round(3)
+    return {
+        'summary': summary,
+        'folds': folds.to_dict('records'),
+        'by_tier': by_tier.to_dict('records'),
+        'points': points.to_dict('list')
+    }
+
+@st.cache_data(show_spinner=False, persist="disk")
+def model_validation(_df, data_version, k=CV_FOLDS, seed=42):
+    """Cross-validation report of the scoring model on the loaded districts, as frames
+    
+    None without a model, its features or enough targets. Persisted per data
+    version, so pages render the numbers without refitting.
+    """
+    model = load_score_model()
+    if model is None or not model.can_score(_df) or model.target not in _df.columns:
+        return None
+    report = cross_validation_report(_df, model, k, seed)
+    if report is None:
+        return None
+    return {'summary': report['summary'], **{part: pd.DataFrame(report[part]) for part in ('folds', 'by_tier', 'points')}}
+
+# Economic clusters behind ai_cluster: mini-batch k-means on standardized
+# indicators that district and sub-district files both carry, trained by
+# scripts/train_cluster_model.py. Ingest only assigns rows to the stored
+# centroids, so new districts never trigger a refit.
+CLUSTER_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "district_clusters_v1.json")
+CLUSTER_FEATURES = [
+    'literacy_rate_2025', 'urbanization_rate_2025', 'work_participation_rate_2025',
+    'service_sector_share', 'manufacturing_share', 'agriculture_share', 'infrastructure_index'
+]
+CLUSTER_NAMES = ('High-Tech Hub', 'Industrial Center', 'Agro-Processing Zone')
+CLUSTER_ASSIGN_CHUNK_ROWS = 262_144
+
+class ClusterModel:
+    """Mini-batch k-means (Sculley, 2010) over standardized CLUSTER_FEATURES
+    
+    Centroids are kept with the number of rows folded into each, so
+    partial_fit can fold in new batches without a refit, and assign labels
+    new rows with one distance matrix per chunk. Missing values are imputed
+    with the training mean.
+    """
+    
+    ALGORITHM = 'minibatch_kmeans'
+    
+    def __init__(self, features, means, scales, centroids, counts, names, version=1, metrics=None, trained_on=None):
+        self.features = list(features)
+        self.means = np.asarray(means, dtype=float)
+        self.scales = np.asarray(scales, dtype=float)
+        self.centroids = np.asarray(centroids, dtype=float)
+        self.counts = np.asarray(counts, dtype=float)
+        self.names = list(names)
+        self.version = version
+        self.metrics = metrics or {}
+        self.trained_on = trained_on
+    
+    def standardize(self, df):
+        X = np.column_stack([pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+                             for column in self.features])
+        return (np.where(np.isnan(X), self.means, X) - self.means) / self.scales
+    
+    @staticmethod
+    def _nearest(Z, centroids):
+        """Index of and squared distance to the nearest centroid for every row"""
+        distances = (Z ** 2).sum(axis=1)[:, None] - 2 * Z @ centroids.T + (centroids ** 2).sum(axis=1)
+        nearest = distances.argmin(axis=1)
+        return nearest, np.maximum(distances[np.arange(len(Z)), nearest], 0)
+    
+    @staticmethod
+    def _update(centroids, counts, batch):
+        """Fold one batch into the centroids in place; returns the largest centroid shift"""
+        nearest, _ = ClusterModel._nearest(batch, centroids)
+        members = np.bincount(nearest, minlength=len(centroids)).astype(float)
+        sums = np.stack([np.bincount(nearest, weights=batch[:, j], minlength=len(centroids))
+                         for j in range(batch.shape[1])], axis=1)
+        updated = members > 0
+        counts += members
+        # Per-centroid learning rate n/count, i.e. a running mean of every row it has absorbed
+        step = (members[updated] / counts[updated])[:, None]
+        shift = step * (sums[updated] / members[updated][:, None] - centroids[updated])
+        centroids[updated] += shift
+        return float(np.sqrt((shift ** 2).sum(axis=1)).max()) if updated.any() else 0.0
+    
+    @staticmethod
+    def _seed_centroids(Z, k, rng):
+        """k-means++ seeding"""
+        centroids = [Z[rng.integers(len(Z))]]
+        for _ in range(1, k):
+            _, distances = ClusterModel._nearest(Z, np.array(centroids))
+            centroids.append(Z[rng.choice(len(Z), p=distances / distances.sum())])
+        return np.array(centroids)
+    
+    @classmethod
+    def fit(cls, df, k=len(CLUSTER_NAMES), features=CLUSTER_FEATURES, batch_size=1024, max_iter=200, n_init=3,
+            tol=1e-3, seed=42, **metadata):
+        """Fit on every row of df; the best of n_init runs by inertia on a held sample is kept"""
+        X = np.column_stack([pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+                             for column in features])
+        means = np.nanmean(X, axis=0)
+        scales = np.nanstd(X, axis=0)
+        scales[~(scales > 0)] = 1.0
+        model = cls(features, means, scales, np.zeros((k, len(features))), np.zeros(k), [], **metadata)
+        Z = model.standardize(df)
+        
+        rng = np.random.default_rng(seed)
+        sample = Z[rng.choice(len(Z), min(len(Z), 50_000), replace=False)]
+        best = None
+        for run in range(n_init):
+            run_rng = np.random.default_rng([seed, run])
+            centroids = cls._seed_centroids(sample[:10_000], k, run_rng)
+            counts = np.zeros(k)
+            for _ in range(max_iter):
+                if cls._update(centroids, counts, Z[run_rng.integers(0, len(Z), batch_size)]) < tol:
+                    break
+            inertia = cls._nearest(sample, centroids)[1].mean()
+            if best is None or inertia < best[0]:
+                best = (inertia, centroids, counts)
+        
+        model.centroids, model.counts = best[1], best[2]
+        model.names = model._profile_names()
+        model.metrics = {**model.metrics, 'inertia': round(float(best[0]), 4)}
+        return model
+    
+    def partial_fit(self, df, batch_size=1024):
+        """Fold new rows into the existing centroids without refitting"""
+        Z = self.standardize(df)
+        for start in range(0, len(Z), batch_size):
+            self._update(self.centroids, self.counts, Z[start:start + batch_size])
+        return self
+    
+    def _profile_names(self):
+        """Name centroids by their sector mix: most agricultural, then most service-led, then the rest"""
+        if len(self.centroids) != len(CLUSTER_NAMES):
+            return [f"Cluster {i + 1}" for i in range(len(self.centroids))]
+        profile = pd.DataFrame(self.centroids * self.scales + self.means, columns=self.features)
+        agro = int(profile['agriculture_share'].idxmax())
+        hub = int(profile['service_sector_share'].drop(agro).idxmax())
+        names = [CLUSTER_NAMES[1]] * len(profile)
+        names[agro], names[hub] = CLUSTER_NAMES[2], CLUSTER_NAMES[0]
+        return names
+    
+    def can_assign(self, df):
+        return all(column in df.columns for column in self.features)
+    
+    def assign_codes(self, df, chunk_rows=CLUSTER_ASSIGN_CHUNK_ROWS):
+        """Nearest-centroid index of every row, in chunks so the distance matrix stays small"""
+        codes = np.empty(len(df), dtype=np.int8)
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start:start + chunk_rows]
+            codes[start:start + len(chunk)] = self._nearest(self.standardize(chunk), self.centroids)[0]
+        return codes
+    
+    def assign(self, df):
+        """Cluster names for every row as a Categorical"""
+        return pd.Categorical.from_codes(self.assign_codes(df), categories=self.names)
+    
+    def profiles(self):
+        """Centroids in original units, one row per cluster"""
+        return pd.DataFrame(self.centroids * self.scales + self.means, columns=self.features, index=self.names)
+    
+    def to_artifact(self):
+        return {
+            'algorithm': self.ALGORITHM,
+            'version': self.version,
+            'features': [{'column': column, 'mean': mean, 'scale': scale}
+                         for column, mean, scale in zip(self.features, self.means.tolist(), self.scales.tolist())],
+            'centroids': self.centroids.tolist(),
+            'counts': self.counts.tolist(),
+            'names': self.names,
+            'metrics': self.metrics,
+            'trained_on': self.trained_on
+        }
+    
+    @classmethod
+    def from_artifact(cls, artifact):
+        if artifact.get('algorithm') != cls.ALGORITHM:
+            raise ValueError(f"Unsupported model algorithm: {artifact.get('algorithm')}")
+        features = artifact['features']
+        return cls(
+            [f['column'] for f in features],
+            [f['mean'] for f in features],
+            [f['scale'] for f in features],
+            artifact['centroids'],
+            artifact['counts'],
+            artifact['names'],
+            version=artifact['version'],
+            metrics=artifact.get('metrics'),
+            trained_on=artifact.get('trained_on')
+        )
+    
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_artifact(), f, indent=2)
+            f.write('\n')
+
+MODEL_CLASSES = {model.ALGORITHM: model for model in (ScoringModel, ClusterModel)}
+
+@st.cache_resource(show_spinner=False)
+def _read_model_artifact(path, digest):
+    with open(path) as f:
+        artifact = json.load(f)
+    if artifact.get('algorithm') not in MODEL_CLASSES:
+        raise ValueError(f"Unsupported model algorithm: {artifact.get('algorithm')}")
+    return MODEL_CLASSES[artifact['algorithm']].from_artifact(artifact)
+
+def load_model_artifact(path):
+    """The model stored at path, or None if it is missing or unreadable"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return _read_model_artifact(path, source_digest(path))
+    except (OSError, ValueError, KeyError):
+        return None
+
+def load_score_model(path=SCORE_MODEL_PATH):
+    """The scoring model behind ml_predicted_score, or None"""
+    return load_model_artifact(path)
+
+def load_cluster_model(path=CLUSTER_MODEL_PATH):
+    """The cluster model behind ai_cluster, or None"""
+    return load_model_artifact(path)
+
+def derivation_tag():
+    """Identifies the derivations applied at ingest: DERIVATION_VERSION plus the model artifacts in use"""
+    tag = f"v{DERIVATION_VERSION}"
+    for marker, path in (('m', SCORE_MODEL_PATH), ('c', CLUSTER_MODEL_PATH)):
+        if os.path.exists(path):
+            tag += f"{marker}{source_digest(path)[:8]}"
+    return tag
+
+def derive_district_columns(df):
+    """Add the model-derived columns when the source data does not provide them"""
+    if 'ml_predicted_score' not in df.columns:
+        model = load_score_model()
+        if model is not None and model.can_score(df):
+            df['ml_predicted_score'] = model.predict(df)
+        elif 'investment_readiness_score' in df.columns:
+            df['ml_predicted_score'] = df['investment_readiness_score']
+        else:
+            df['ml_predicted_score'] = np.random.uniform(50, 150, len(df))
+    
+    if 'investment_risk_category' not in df.columns:
+        # Create risk categories based on existing data
+        df['investment_risk_category'] = assign_risk_bands(df['ml_predicted_score'])
+    
+    if 'ai_cluster' not in df.columns:
+        clusters = load_cluster_model()
+        if clusters is not None and clusters.can_assign(df):
+            df['ai_cluster'] = clusters.assign(df)
+        else:
+            # Without a cluster model, fall back to the tier
             df['ai_cluster'] = df['tier'].map({
                 'Metro': 'High-Tech Hub',
                 'Tier-2': 'Industrial Center', 
                 'Tier-3': 'Agro-Processing Zone'
             })
+    
+    if 'lat' not in df.columns or 'lon' not in df.columns:
+        df['lat'], df['lon'] = assign_district_coordinates(df)
+    
+    return df
+
+def discover_state_files(data_dir=DATA_DIR):
+    """Every per-state source file in data_dir, in a stable order"""
+    paths = glob.glob(os.path.join(data_dir, "*_economic_analysis.csv"))
+    # The combined multi-state file is a fallback, not a state
+    return sorted(p for p in paths if os.path.basename(p) != "multi_state_economic_analysis.csv")
+
+# Codes are identifiers, not numbers: "0101" must not become 101
+SOURCE_KEY_COLUMNS = ('district_code', 'subdistrict_code')
 
-            # Clean state information for sidebar
-            if df is not None:
-                st.sidebar.markdown("### 🏛️ States & Districts")
-                state_counts = df['state'].value_counts()
-                states_html = ""
-                for state, count in state_counts.items():
-                    states_html += f"<p style='color: #e2e8f0; margin: 0.2rem 0;'><strong>{state}:</strong> {count} districts</p>"
+def _read_source_csv(path):
+    """Parse one source file with the multithreaded pyarrow reader, keys as text"""
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    
+    column_types = dict.fromkeys(SOURCE_KEY_COLUMNS, pa.string())
+    table = pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(column_types=column_types))
+    # All-empty columns parse as null; read them as float, as pandas does
+    schema = pa.schema([f.with_type(pa.float64()) if pa.types.is_null(f.type) else f for f in table.schema])
+    return table.cast(schema).to_pandas()
+
+# Source files above this size are derived chunk by chunk straight into parquet
+STREAMING_THRESHOLD_BYTES = 256 * 1024 ** 2
+STREAMING_CHUNK_ROWS = 250_000
+
+def _store_schema(schema):
+    """Arrow schema for a chunked store: 32-bit dictionary indices so any chunk's labels fit"""
+    import pyarrow as pa
+    fields = [
+        pa.field(f.name, pa.dictionary(pa.int32(), f.type.value_type, f.type.ordered)) if pa.types.is_dictionary(f.type) else f
+        for f in schema
+    ]
+    return pa.schema(fields, metadata=schema.metadata)
+
+def stream_ingest(csv_path, store_path, chunk_rows=STREAMING_CHUNK_ROWS):
+    """Derive a source CSV chunk by chunk into a parquet store; returns (rows, problems)
+    
+    Each chunk is validated, derived, typed and appended as a row group before
+    the next one is read, so peak memory is bounded by chunk_rows rather than
+    by file size. The store is written to a temporary file and moved into
+    place only when complete.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    # Fixed parse types, so every chunk produces the same columns
+    dtypes = {c: ('str' if c in STATE_FILE_LABELS else 'float64') for c in STATE_FILE_COLUMNS}
+    tmp_path = f"{store_path}.{os.getpid()}.tmp"
+    writer, schema, rows = None, None, 0
+    completed = False
+    try:
+        for chunk in pd.read_csv(csv_path, chunksize=chunk_rows, dtype=dtypes):
+            if writer is None:
+                problems = validate_state_file(chunk)
+                if problems:
+                    return 0, problems
+            chunk = apply_district_schema(derive_district_columns(chunk))
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                schema = _store_schema(table.schema)
+                os.makedirs(os.path.dirname(store_path) or '.', exist_ok=True)
+                writer = pq.ParquetWriter(tmp_path, schema)
+            writer.write_table(table.cast(schema))
+            rows += len(chunk)
+        completed = True
+    except ValueError as e:
+        return 0, [f"could not be parsed: {e}"]
+    finally:
+        if writer is not None:
+            writer.close()
+            if not completed:
+                os.remove(tmp_path)  # Never leave a partial store behind
+    
+    if writer is None:
+        return 0, ["file has no rows"]
+    os.replace(tmp_path, store_path)
+    return rows, []
+
+def ingest_state_file(path, digest):
+    """Parse, validate, derive and type one state file; returns (frame or None, problems)
+    
+    Derived state files are cached on disk by content hash, so a refresh only
+    re-parses the states whose files changed. Whichever route a state takes
+    (cached unit, chunked stream or in-memory parse), it leaves through the
+    same apply_district_schema call, so every state has identical dtypes.
+    """
+    frame, problems = _ingest_state_source(path, digest)
+    return (apply_district_schema(frame) if frame is not None else None), problems
+
+def _ingest_state_source(path, digest):
+    """ingest_state_file without the final schema cast"""
+    unit_path = _state_unit_path(path, digest)
+    if os.path.exists(unit_path):
+        try:
+            return pd.read_parquet(unit_path), []
+        except Exception:
+            pass  # Unreadable cache entry; rebuild it below
+    
+    # Very large files never exist as one raw frame: derive them in chunks into the unit
+    if os.path.getsize(path) > STREAMING_THRESHOLD_BYTES:
+        rows, problems = stream_ingest(path, unit_path)
+        if problems:
+            return None, problems
+        _prune_state_units(path, unit_path)
+        return pd.read_parquet(unit_path), []
+    
+    try:
+        frame = _read_source_csv(path)
+    except Exception as e:
+        return None, [f"could not be parsed: {e}"]
+    
+    problems = validate_state_file(frame)
+    if problems:
+        return None, problems
     
-                st.sidebar.markdown(states_html, unsafe_allow_html=True)
+    # Every derivation is per district, so states can be derived independently
+    frame = apply_district_schema(derive_district_columns(frame))
+    _write_state_unit(path, digest, frame)
+    return frame, []
+
+def combine_state_frames(frames):
+    """Concatenate derived state frames, merging categorical labels instead of decaying to object"""
+    df = pd.concat(frames, ignore_index=True)
+    for column, dtype in DISTRICT_SCHEMA.items():
+        if dtype == 'category' and column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            if all(isinstance(f[column].dtype, pd.CategoricalDtype) for f in frames):
+                df[column] = pd.api.types.union_categoricals([f[column] for f in frames], sort_categories=True)
+            else:
+                df[column] = df[column].astype('category')
+    return df
+
+def load_data():
+    """Load all processed data with error handling"""
+    # Cheap stat-keyed hashes, so edited files are picked up on the next rerun
+    state_paths = discover_state_files()
+    optional_paths = [os.path.join(DATA_DIR, f"{name}.csv")
+                      for name in ['multi_state_economic_analysis', 'feature_importance_analysis',
+                                   # Optional surveyed centroids (district_code, lat, lon)
+                                   'district_centroids']]
+    manifest = tuple((path, source_digest(path)) for path in state_paths + optional_paths if os.path.exists(path))
+    return _load_sources(manifest, len(state_paths))
+
+# Data loading function
+@st.cache_data(max_entries=2)
+def _load_sources(manifest, n_state_files):
+    """Build the district frame from (path, content hash) pairs; the first n are state files"""
+    try:
+        # Reuse the derived frame from a previous start if no source file changed
+        fingerprint = _source_fingerprint({os.path.basename(path): digest for path, digest in manifest})
+        cached = _read_frame_cache(fingerprint)
+        if cached is not None:
+            cached[0].attrs['data_version'] = fingerprint
+            _record_district_count(manifest[:n_state_files], len(cached[0]))
+            return cached
         
-        # Feature importance (create if not available)
+        # Ingest state files concurrently; unchanged states come from their own cache entries
+        load_issues = []
+        state_dataframes = []
+        state_manifest = manifest[:n_state_files]
+        with ThreadPoolExecutor(max_workers=min(8, max(len(state_manifest), 1))) as pool:
+            results = list(pool.map(lambda entry: ingest_state_file(*entry), state_manifest))
+        for (path, _), (frame, problems) in zip(state_manifest, results):
+            if problems:
+                load_issues.append((os.path.basename(path), "; ".join(problems)))
+            else:
+                state_dataframes.append(frame)
+        
+        available_files = {}
+        for path, _ in manifest[n_state_files:]:
+            try:
+                available_files[os.path.basename(path)[:-len('.csv')]] = _read_source_csv(path)
+            except Exception as e:
+                load_issues.append((os.path.basename(path), f"could not be parsed: {e}"))
+        
+        # If we got state files, use them. Otherwise fall back to combined file
+        if state_dataframes:
+            df = combine_state_frames(state_dataframes)
+        elif 'multi_state_economic_analysis' in available_files:
+            df = derive_district_columns(available_files['multi_state_economic_analysis'])
+        else:
+            st.error("❌ No economic analysis files found!")
+            for file_name, problem in load_issues:
+                st.error(f"❌ {file_name}: {problem}")
+            return None, None
+        
+        if 'district_centroids' in available_files:
+            df = apply_district_centroids(df, available_files['district_centroids'])
+        
+        # Feature importance: a provided analysis, else permutation importance of the scoring model.
+        # It is persisted with the frame cache, whose key covers the model and every source file.
+        model = load_score_model()
         if 'feature_importance_analysis' in available_files:
             feature_importance = available_files['feature_importance_analysis']
+        elif model is not None and model.can_score(df) and model.target in df.columns:
+            feature_importance = permutation_importance(df, model)
         else:
-            # Create dummy feature importance
-            features = ['infrastructure_index', 'literacy_rate_2025', 'gdp_per_capita', 
-                       'urbanization_rate_2025', 'logistics_connectivity']
-            feature_importance = pd.DataFrame({
-                'feature': features,
-                'importance': [0.28, 0.20, 0.18, 0.15, 0.12]
-            })
+            feature_importance = pd.DataFrame({'feature': pd.Series(dtype=str), 'importance': pd.Series(dtype=float)})
+        
+        df = apply_district_schema(df)
         
+        # Only a clean load is persisted, so skipped files are re-checked (and re-reported) next start
+        if not load_issues:
+            _write_frame_cache(fingerprint, df, feature_importance)
+        df.attrs['data_version'] = fingerprint
+        df.attrs['load_issues'] = load_issues
+        _record_district_count(manifest[:n_state_files], len(df))
         return df, feature_importance
         
     except Exception as e:
         st.error(f"❌ Error loading data: {str(e)}")
         return None, None
 
+# The last loaded district count, keyed by the size and mtime of every state
+# file, so the About page can show it without reading (or hashing) any data
+DISTRICT_COUNT_PATH = os.path.join(CACHE_DIR, "district_count.json")
+
+def _state_file_stats(paths):
+    """{path: [size, mtime_ns]} of the given state files"""
+    stats = {}
+    for path in paths:
+        stat = os.stat(path)
+        stats[path] = [stat.st_size, stat.st_mtime_ns]
+    return stats
+
+def _record_district_count(state_manifest, rows):
+    """Remember the district count of a load for source_district_count"""
+    try:
+        record = {'files': _state_file_stats(path for path, _ in state_manifest), 'rows': rows}
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{DISTRICT_COUNT_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(record, f)
+        os.replace(tmp_path, DISTRICT_COUNT_PATH)
+    except Exception:
+        pass  # Caching is an optimisation; the app still works without it
+
+def source_district_count():
+    """District count of the last load, or None if a state file changed since (or none was loaded yet)"""
+    try:
+        with open(DISTRICT_COUNT_PATH) as f:
+            record = json.load(f)
+        if record['files'] == _state_file_stats(discover_state_files()):
+            return record['rows']
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def render_state_sidebar(df, container=st.sidebar):
+    """Clean state information for sidebar"""
+    container.markdown("### 🏛️ States & Districts")
+    state_counts = df['state'].value_counts()
+    states_html = ""
+    for state, count in state_counts.items():
+        states_html += f"<p style='color: #e2e8f0; margin: 0.2rem 0;'><strong>{state}:</strong> {count} districts</p>"
+    
+    container.markdown(states_html, unsafe_allow_html=True)
+
+def data_version(df):
+    """Stable identifier of a full district frame, used to key derived caches"""
+    version = df.attrs.get('data_version')
+    if version is None:
+        # Frames built outside load_data (benchmarks, scenarios) are hashed by content
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        version = hashlib.sha256(row_hashes.tobytes()).hexdigest()[:16]
+    return version
+
+# Sector opportunity rules. Each rule selects districts with a vectorized
+# condition and sizes one business unit per `population_per_unit` residents;
+# investment (₹ lakhs) and jobs per unit are drawn from the given ranges.
+SECTOR_RULES = [
+    {
+        'sector': 'Food Processing & Agro-Industries',
+        'condition': lambda df: df['agriculture_share'] > 40,
+        'population_per_unit': 50000,
+        'investment_per_unit': (15, 35),
+        'jobs_per_unit': (25, 75),
+        'rationale': 'High agriculture share provides raw material base'
+    },
+    {
+        'sector': 'Textile & Garments',
+        'condition': lambda df: df['literacy_rate_2025'] > 75,
+        'population_per_unit': 75000,
+        'investment_per_unit': (40, 80),
+        'jobs_per_unit': (100, 200),
+        'rationale': 'Skilled workforce supports manufacturing'
+    },
+    {
+        'sector': 'IT Services & Digital Economy',
+        'condition': lambda df: df['tier'].isin(['Metro', 'Tier-2']) & (df['literacy_rate_2025'] > 85),
+        'population_per_unit': 150000,
+        'investment_per_unit': (30, 80),
+        'jobs_per_unit': (100, 300),
+        'rationale': 'High literacy and urban infrastructure'
+    },
+    {
+        'sector': 'Manufacturing & Engineering',
+        'condition': lambda df: df['infrastructure_index'] > 60,
+        'population_per_unit': 100000,
+        'investment_per_unit': (60, 120),
+        'jobs_per_unit': (50, 150),
+        'rationale': 'Strong infrastructure supports manufacturing'
+    },
+    {
+        'sector': 'Tourism & Hospitality',
+        'condition': lambda df: df['tier'].isin(['Tier-2', 'Tier-3']) & (df['logistics_connectivity'] > 50),
+        'population_per_unit': 200000,
+        'investment_per_unit': (80, 200),
+        'jobs_per_unit': (150, 300),
+        'rationale': 'Good connectivity supports tourism development'
+    }
+]
+
+# Seed for every simulated figure. Draws are keyed by district and sector, so a
+# district keeps its numbers regardless of filtering, row order or batch size.
+SIMULATION_SEED = 42
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+
+def _splitmix64(x):
+    """Vectorized SplitMix64 finaliser, used as a counter-based uint64 hash"""
+    x = np.asarray(x, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        x = x + _GOLDEN_GAMMA
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def seeded_bits(keys, n_draws, seed=SIMULATION_SEED):
+    """(len(keys), n_draws) random uint64 words, reproducible per uint64 key"""
+    base = _splitmix64(np.asarray(keys, dtype=np.uint64) ^ _splitmix64(np.array([seed], dtype=np.uint64)))
+    with np.errstate(over='ignore'):
+        counters = base[:, None] + np.arange(1, n_draws + 1, dtype=np.uint64)[None, :] * _GOLDEN_GAMMA
+    return _splitmix64(counters)
+
+def seeded_uniforms(keys, n_draws, seed=SIMULATION_SEED):
+    """(len(keys), n_draws) uniforms in [0, 1), reproducible per uint64 key"""
+    return (seeded_bits(keys, n_draws, seed) >> np.uint64(11)) * (1.0 / (1 << 53))
+
+def _bounded_integers(bits, low, high, shift):
+    """Integers in [low, high) from 32 bits of each word (multiply-shift, no division)"""
+    words = (bits >> np.uint64(shift)) & np.uint64(0xFFFFFFFF)
+    return low + ((words * np.uint64(high - low)) >> np.uint64(32)).astype(np.int32)
+
+def _row_percentiles(values, low, high, quantiles):
+    """Per-row percentiles (the ceil(q * n)-th smallest draw) of small-range integer draws
+    
+    Ranges no wider than the draws are read off per-row histograms, so the
+    histogram never outgrows the draw matrix; wider ranges partially sort
+    the draws instead.
+    """
+    rows, n_draws = values.shape
+    width = high - low
+    if width > n_draws:
+        ranks = [max(int(np.ceil(q * n_draws)), 1) - 1 for q in quantiles]
+        ordered = np.partition(values, sorted(set(ranks)), axis=1)
+        return [ordered[:, rank] for rank in ranks]
+    offsets = (values - low) + np.arange(0, rows * width, width, dtype=np.int32)[:, None]
+    cdf = np.bincount(offsets.ravel(), minlength=rows * width).reshape(rows, width).cumsum(axis=1)
+    return [low + (cdf < np.ceil(q * n_draws)).sum(axis=1) for q in quantiles]
+
+def district_keys(df):
+    """uint64 hash of each district_code, the identity used for seeded draws"""
+    return pd.util.hash_array(np.asarray(df['district_code'], dtype=object))
+
+@st.cache_data(show_spinner=False)
+def analyze_sector_opportunities(_df, data_version, n_scenarios=1, seed=SIMULATION_SEED):
+    """Evaluate every sector rule over whole columns into a long-format frame
+    
+    Per-unit investment and jobs are drawn for n_scenarios seeded scenarios per
+    district and sector. The frame reports the scenario mean with P10/P90 bands,
+    and the second return value holds per-sector totals for every scenario.
+    """
+    # A missing population counts as no population, so the district gets the minimum single unit
+    population = _df['population_2025'].to_numpy(dtype=np.int64, na_value=0)
+    keys = district_keys(_df)
+    # Bound the (districts x scenarios) draw matrices to a few million cells
+    chunk_rows = max(1, 2_000_000 // n_scenarios)
+    
+    blocks, scenario_totals = [], []
+    for rule_id, rule in enumerate(SECTOR_RULES):
+        matched = np.flatnonzero(np.asarray(rule['condition'](_df), dtype=bool))
+        units = np.maximum(1, population[matched] // rule['population_per_unit'])
+        sector_key = pd.util.hash_array(np.array([rule['sector']], dtype=object))[0]
+        
+        block = {'row': matched, 'rule_id': np.full(len(matched), rule_id), 'units': units}
+        for measure in ('investment', 'jobs'):
+            for suffix in ('', '_p10', '_p90'):
+                block[measure + suffix] = np.empty(len(matched), dtype=np.int64)
+        totals = {'sector': rule['sector'], 'scenario': np.arange(n_scenarios),
+                  'investment': np.zeros(n_scenarios), 'jobs': np.zeros(n_scenarios)}
+        
+        for start in range(0, len(matched), chunk_rows):
+            part = slice(start, start + chunk_rows)
+            # One 64-bit word per scenario: low half drives investment, high half jobs
+            bits = seeded_bits(keys[matched[part]] ^ sector_key, n_scenarios, seed)
+            for measure, shift in (('investment', 0), ('jobs', 32)):
+                low, high = rule[f'{measure}_per_unit']
+                per_unit = _bounded_integers(bits, low, high, shift)
+                if n_scenarios == 1:
+                    p10 = p90 = per_unit[:, 0]  # A single draw is its own band
+                else:
+                    p10, p90 = _row_percentiles(per_unit, low, high, (0.1, 0.9))
+                block[measure][part] = np.rint(units[part] * per_unit.mean(axis=1))
+                block[f'{measure}_p10'][part] = units[part] * p10
+                block[f'{measure}_p90'][part] = units[part] * p90
+                totals[measure] += units[part].astype(float) @ per_unit
+        blocks.append(block)
+        scenario_totals.append(pd.DataFrame(totals))
+    
+    columns = {name: np.concatenate([block[name] for block in blocks]) for name in blocks[0]}
+    # District-major order, sectors in rule order within each district
+    order = np.lexsort((columns['rule_id'], columns['row']))
+    columns = {name: values[order] for name, values in columns.items()}
+    rows, rule_ids = columns.pop('row'), columns.pop('rule_id')
+    
+    sectors = [rule['sector'] for rule in SECTOR_RULES]
+    rationales = [rule['rationale'] for rule in SECTOR_RULES]
+    sector_df = pd.DataFrame({
+        'sector': pd.Categorical.from_codes(rule_ids, categories=sectors),
+        **columns,
+        'rationale': pd.Categorical.from_codes(rule_ids, categories=rationales),
+        'district_name': _df['district_name'].array.take(rows),
+        'district_code': _df['district_code'].array.take(rows),
+        'state': _df['state'].array.take(rows),
+        'tier': _df['tier'].array.take(rows),
+        'ai_score': _df['ml_predicted_score'].to_numpy()[rows]
+    })
+    
+    scenario_totals = pd.concat(scenario_totals, ignore_index=True)
+    scenario_totals['sector'] = pd.Categorical(scenario_totals['sector'], categories=sectors)
+    return sector_df, scenario_totals
+
+def scenario_range(scenario_totals, measure, sector=None):
+    """P10/P90 of a measure summed across sectors (or for one sector) per scenario"""
+    totals = scenario_totals if sector is None else scenario_totals[scenario_totals['sector'] == sector]
+    per_scenario = totals.groupby('scenario')[measure].sum()
+    return per_scenario.quantile(0.1), per_scenario.quantile(0.9)
+
+# Map rendering budgets. Above MAP_LEAN_TRACE_THRESHOLD points the map drops the
+# per-point hover payload and size scaling; above MAP_POINT_BUDGET districts are
+# aggregated into hexagonal cells so the figure never carries more markers.
+# The budget applies to the filtered selection, not the zoom level: Streamlit
+# does not send the plotly viewport back to the script.
+MAP_LEAN_TRACE_THRESHOLD = 2_000
+MAP_POINT_BUDGET = 10_000
+KM_PER_DEGREE = 111.32
+
+def _hex_cells(lat, lon, cell_deg):
+    """Vectorized assignment of points to pointy-top hexagons of cell_deg degrees"""
+    # Equirectangular projection around the mean latitude keeps cells roughly regular
+    x = lon * np.cos(np.radians(lat.mean()))
+    q = (np.sqrt(3) / 3 * x - lat / 3) / cell_deg
+    r = (2 / 3 * lat) / cell_deg
+    
+    # Cube rounding to the containing hexagon
+    s = -q - r
+    rq, rr, rs = np.rint(q), np.rint(r), np.rint(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq[fix_q] = -rr[fix_q] - rs[fix_q]
+    rr[fix_r] = -rq[fix_r] - rs[fix_r]
+    
+    cell_key = (rq.astype(np.int64) + (1 << 30)) * (1 << 31) + (rr.astype(np.int64) + (1 << 30))
+    _, cell = np.unique(cell_key, return_inverse=True)
+    return cell.ravel()
+
+def hexbin_aggregate(map_data, value_column, cell_km, budget=MAP_POINT_BUDGET):
+    """Aggregate districts into hexagonal cells, growing cells until at most `budget` remain
+    
+    Each cell is placed at its members' mean position and carries the district
+    count, total population and mean score / colour value, so point density
+    survives as marker size while the payload stays bounded.
+    """
+    lat = map_data['lat'].to_numpy(dtype=float)
+    lon = map_data['lon'].to_numpy(dtype=float)
+    cell_deg = cell_km / KM_PER_DEGREE
+    cell = _hex_cells(lat, lon, cell_deg)
+    while cell.max() + 1 > budget:
+        cell_deg *= 1.5
+        cell = _hex_cells(lat, lon, cell_deg)
+    
+    counts = np.bincount(cell)
+    def cell_mean(column):
+        return np.bincount(cell, weights=map_data[column].to_numpy(dtype=float)) / counts
+    
+    cells = pd.DataFrame({
+        'lat': np.bincount(cell, weights=lat) / counts,
+        'lon': np.bincount(cell, weights=lon) / counts,
+        value_column: cell_mean(value_column),
+        'districts': counts,
+        'ml_predicted_score': cell_mean('ml_predicted_score')
+    })
+    # Population is summed, so colouring by population shows cell totals; missing counts add nothing
+    cells['population_2025'] = np.bincount(cell, weights=map_data['population_2025'].to_numpy(dtype=float, na_value=0))
+    cells.attrs['cell_km'] = cell_deg * KM_PER_DEGREE
+    return cells
+
+EARTH_RADIUS_KM = 6371.0
+
+def _unit_vectors(lat, lon):
+    """Points on the unit sphere, so chord length is monotonic in great-circle distance"""
+    lat, lon = np.radians(np.asarray(lat, dtype=float)), np.radians(np.asarray(lon, dtype=float))
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+def _chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+
+def _km_to_chord(km):
+    return 2 * np.sin(min(km / EARTH_RADIUS_KM, np.pi) / 2)
+
+class DistrictSpatialIndex:
+    """Static KD-tree over district centroids for radius and k-nearest queries
+    
+    Points live on the unit sphere and the tree splits on the widest axis at
+    the median. Every leaf is a contiguous slice of the reordered point array,
+    so queries prune whole boxes and scan leaves with vectorized distances.
+    Results are row positions into the frame the index was built from.
+    """
+    
+    LEAF_SIZE = 32
+    
+    def __init__(self, lat, lon):
+        points = _unit_vectors(lat, lon)
+        self.size = len(points)
+        self.order = np.arange(self.size)
+        # Per node: [start, end) slice, bounding box, children (-1 for leaves)
+        self.start, self.end, self.lower, self.upper, self.left, self.right = [], [], [], [], [], []
+        
+        stack = [(0, self.size, None)]
+        while stack:
+            start, end, parent = stack.pop()
+            node = len(self.start)
+            if parent is not None:
+                parent_node, side = parent
+                (self.left if side == 0 else self.right)[parent_node] = node
+            
+            block = points[self.order[start:end]]
+            lower = block.min(axis=0) if len(block) else np.zeros(3)
+            upper = block.max(axis=0) if len(block) else np.zeros(3)
+            self.start.append(start)
+            self.end.append(end)
+            self.lower.append(lower)
+            self.upper.append(upper)
+            self.left.append(-1)
+            self.right.append(-1)
+            
+            if end - start > self.LEAF_SIZE:
+                axis = int(np.argmax(upper - lower))
+                middle = (end - start) // 2
+                segment = self.order[start:end]
+                self.order[start:end] = segment[np.argpartition(points[segment, axis], middle)]
+                stack.append((start + middle, end, (node, 1)))
+                stack.append((start, start + middle, (node, 0)))
+        
+        self.points = points[self.order]
+        # Plain tuples: box tests on three coordinates are cheaper without NumPy dispatch
+        self.lower = [tuple(map(float, bound)) for bound in self.lower]
+        self.upper = [tuple(map(float, bound)) for bound in self.upper]
+    
+    def _box_distance(self, node, query):
+        total = 0.0
+        for low, high, value in zip(self.lower[node], self.upper[node], query):
+            gap = low - value if value < low else value - high if value > high else 0.0
+            total += gap * gap
+        return total ** 0.5
+    
+    def within_radius(self, lat, lon, radius_km):
+        """Row positions and distances (km) of districts within radius_km, nearest first"""
+        query = _unit_vectors([lat], [lon])[0]
+        query_point = tuple(query)
+        limit = _km_to_chord(radius_km)
+        hits, chords = [], []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._box_distance(node, query_point) > limit:
+                continue
+            if self.left[node] < 0:
+                start, end = self.start[node], self.end[node]
+                distance = np.linalg.norm(self.points[start:end] - query, axis=1)
+                inside = distance <= limit
+                hits.append(self.order[start:end][inside])
+                chords.append(distance[inside])
+            else:
+                stack.extend((self.left[node], self.right[node]))
+        
+        if not hits:
+            return np.array([], dtype=int), np.array([])
+        hits, chords = np.concatenate(hits), np.concatenate(chords)
+        ranked = np.argsort(chords, kind='stable')
+        return hits[ranked], _chord_to_km(chords[ranked])
+    
+    def nearest(self, lat, lon, k):
+        """Row positions and distances (km) of the k nearest districts, nearest first"""
+        query = _unit_vectors([lat], [lon])[0]
+        query_point = tuple(query)
+        k = min(k, self.size)
+        best_rows, best_chords = np.array([], dtype=int), np.array([])
+        bound = np.inf
+        frontier = [(0.0, 0)]
+        while frontier:
+            box_distance, node = heapq.heappop(frontier)
+            if box_distance > bound:
+                break  # Every remaining box is farther than the current k-th neighbour
+            if self.left[node] < 0:
+                start, end = self.start[node], self.end[node]
+                best_rows = np.concatenate([best_rows, self.order[start:end]])
+                best_chords = np.concatenate([best_chords, np.linalg.norm(self.points[start:end] - query, axis=1)])
+                if len(best_rows) > k:
+                    keep = np.argpartition(best_chords, k - 1)[:k]
+                    best_rows, best_chords = best_rows[keep], best_chords[keep]
+                if len(best_rows) == k:
+                    bound = best_chords.max()
+            else:
+                for child in (self.left[node], self.right[node]):
+                    heapq.heappush(frontier, (self._box_distance(child, query_point), child))
+        
+        ranked = np.argsort(best_chords, kind='stable')
+        return best_rows[ranked], _chord_to_km(best_chords[ranked])
+
+@st.cache_resource(show_spinner=False)
+def build_spatial_index(_df, data_version):
+    """KD-tree over the district centroids, shared by every session"""
+    return DistrictSpatialIndex(_df['lat'], _df['lon'])
+
+class DistrictLookup:
+    """Unique key index on district_code plus a name -> codes map
+    
+    District names repeat across states, so pages select by code and use the
+    name map only to resolve free-text names. Lookups return row positions
+    into the frame the index was built from.
+    """
+    
+    def __init__(self, df):
+        codes = df['district_code'].astype(str).tolist()
+        self.position_of = dict(zip(codes, range(len(codes))))
+        if len(self.position_of) != len(codes):
+            duplicates = pd.Series(codes)[pd.Series(codes).duplicated()].unique()[:5]
+            raise ValueError(f"district_code is not unique: {', '.join(duplicates)}")
+        
+        names = df['district_name'].astype(str).tolist()
+        states = df['state'].astype(str).tolist()
+        self.codes_by_name = {}
+        for code, name in zip(codes, names):
+            self.codes_by_name.setdefault(name.casefold(), []).append(code)
+        # Display labels disambiguate repeated names with the state
+        self.labels = {code: f"{name} ({state})" for code, name, state in zip(codes, names, states)}
+    
+    def position(self, code):
+        """Row position of a district code (KeyError if unknown)"""
+        return self.position_of[code]
+    
+    def record(self, df, code):
+        """The district's row as a Series, without scanning the frame"""
+        return df.iloc[self.position_of[code]]
+    
+    def codes_for(self, name):
+        """All district codes carrying a district name (case-insensitive)"""
+        return self.codes_by_name.get(name.strip().casefold(), [])
+    
+    def label(self, code):
+        return self.labels[code]
+
+@st.cache_resource(show_spinner=False)
+def build_district_lookup(_df, data_version):
+    """District code and name lookups over the district frame, shared by every session"""
+    return DistrictLookup(_df)
+
+# District selectors list at most this many options; the rest are reached by search
+DISTRICT_PICKER_LIMIT = 100
+
+def district_picker(label, candidates, lookup, key, help=None):
+    """Select one district code from the `candidates` frame with a bounded option list
+    
+    The options are the top-scoring candidates, so the payload stays small
+    however many districts match; an exact district name (any case) or code
+    typed into the search box resolves through the lookup to the candidates
+    carrying it. Codes are compared as strings, the way the lookup keys them.
+    """
+    query = st.text_input(f"🔎 Search {label.split(' ', 1)[-1]}", key=f"{key}_search",
+                          placeholder="Exact district name or code").strip()
+    options = []
+    if query:
+        matches = lookup.codes_for(query) or ([query] if query in lookup.position_of else [])
+        if matches:
+            found = candidates[candidates['district_code'].astype(str).isin(matches)]
+            options = found.sort_values('ml_predicted_score', ascending=False)['district_code'].astype(str).tolist()
+        if not options:
+            st.caption(f"No district matching “{query}” in the current selection; showing the top {DISTRICT_PICKER_LIMIT:,}")
+    if not options:
+        top = candidates.nlargest(DISTRICT_PICKER_LIMIT, 'ml_predicted_score')
+        options = top['district_code'].astype(str).tolist()
+    return st.selectbox(label, options, format_func=lookup.label, key=key, help=help)
+
+# Economic features that define "similar" districts for peer benchmarking.
+# Heavy-tailed scale measures are log-transformed before standardization.
+PEER_FEATURES = [
+    'population_2025', 'gdp_per_capita', 'literacy_rate_2025', 'urbanization_rate_2025',
+    'work_participation_rate_2025', 'service_sector_share', 'manufacturing_share', 'agriculture_share',
+    'bank_branches_per_100k', 'internet_penetration', 'road_density', 'power_availability',
+    'logistics_connectivity', 'economic_diversification_index', 'infrastructure_index'
+]
+PEER_LOG_FEATURES = ('population_2025', 'gdp_per_capita')
+
+class DistrictPeerIndex:
+    """Brute-force k-nearest-neighbour index over standardized economic features
+    
+    Features are z-scored into a float32 matrix (missing values sit at the
+    mean) with precomputed squared norms, so a query is one matrix-vector
+    product plus an argpartition over the candidate rows.
+    """
+    
+    def __init__(self, df, features=PEER_FEATURES):
+        self.features = [f for f in features if f in df.columns]
+        columns = []
+        for feature in self.features:
+            values = df[feature].to_numpy(dtype=float)
+            if feature in PEER_LOG_FEATURES:
+                values = np.log1p(np.clip(values, 0, None))
+            std = np.nanstd(values)
+            values = (values - np.nanmean(values)) / (std if std > 0 else 1.0)
+            columns.append(np.nan_to_num(values, nan=0.0))
+        self.matrix = np.column_stack(columns).astype(np.float32) if columns else np.zeros((len(df), 0), np.float32)
+        self.sq_norms = np.einsum('ij,ij->i', self.matrix, self.matrix)
+    
+    def nearest(self, position, k, candidates=None):
+        """Row positions and feature-space distances of the k closest peers of a row"""
+        query = self.matrix[position]
+        if candidates is None:
+            # National scope scans the whole matrix without gathering rows
+            rows = np.arange(len(self.matrix))
+            distances = self.sq_norms - 2 * (self.matrix @ query) + self.sq_norms[position]
+            distances[position] = np.inf
+            k = min(k, len(rows) - 1)
+        else:
+            rows = np.asarray(candidates)
+            rows = rows[rows != position]
+            distances = self.sq_norms[rows] - 2 * (self.matrix[rows] @ query) + self.sq_norms[position]
+        if len(rows) == 0 or k <= 0:
+            return rows[:0], np.empty(0, dtype=np.float32)
+        
+        if len(rows) > k:
+            keep = np.argpartition(distances, k - 1)[:k]
+            rows, distances = rows[keep], distances[keep]
+        order = np.argsort(distances, kind='stable')
+        return rows[order], np.sqrt(np.maximum(distances[order], 0))
+
+@st.cache_resource(show_spinner=False)
+def build_peer_index(_df, data_version):
+    """Standardized feature matrix for peer search, shared by every session"""
+    return DistrictPeerIndex(_df)
+
+# Columns the page filters select on by exact value
+FILTER_COLUMNS = ('state', 'tier', 'investment_risk_category')
+
+class DistrictFilterIndex:
+    """Precomputed filter structures for the district selectors
+    
+    Each categorical filter value maps to a boolean row bitmap and the score
+    column is kept as a sorted array with its row order, so a selection is a
+    bitmap intersection plus a binary-searched score range. Results are sorted
+    row positions into the frame the index was built from.
+    """
+    
+    def __init__(self, df, columns=FILTER_COLUMNS, score_column='ml_predicted_score'):
+        self.size = len(df)
+        self.bitmaps = {}
+        self.options = {}
+        for column in columns:
+            values = df[column].astype('category')
+            codes = values.cat.codes.to_numpy()
+            present = np.unique(codes[codes >= 0])
+            categories = values.cat.categories
+            self.bitmaps[column] = {categories[code]: codes == code for code in present}
+            self.options[column] = sorted(self.bitmaps[column], key=str)
+        
+        scores = df[score_column].to_numpy(dtype=float)
+        self.score_order = np.argsort(scores, kind='stable')
+        self.sorted_scores = scores[self.score_order]
+        # NaN scores sort last and never satisfy a range query
+        self.valid_scores = int(np.count_nonzero(~np.isnan(scores)))
+        self.score_min = float(self.sorted_scores[0]) if self.valid_scores else 0.0
+        self.score_max = float(self.sorted_scores[self.valid_scores - 1]) if self.valid_scores else 0.0
+    
+    def select(self, min_score=None, max_score=None, **equals):
+        """Row positions matching every column == value filter and the score range"""
+        mask = None
+        for column, value in equals.items():
+            if value is None:
+                continue
+            bitmap = self.bitmaps[column].get(value)
+            if bitmap is None:
+                return np.empty(0, dtype=np.intp)
+            mask = bitmap if mask is None else mask & bitmap
+        
+        if min_score is None and max_score is None:
+            return np.arange(self.size) if mask is None else np.flatnonzero(mask)
+        
+        valid = self.sorted_scores[:self.valid_scores]
+        low = 0 if min_score is None else np.searchsorted(valid, min_score, side='left')
+        high = self.valid_scores if max_score is None else np.searchsorted(valid, max_score, side='right')
+        rows = self.score_order[low:high]
+        if len(rows) * 8 < self.size:
+            # Narrow range: filter the few candidates, then restore row order
+            if mask is not None:
+                rows = rows[mask[rows]]
+            return np.sort(rows)
+        # Wide range: scatter into a bitmap instead of sorting most of the frame
+        in_range = np.zeros(self.size, dtype=bool)
+        in_range[rows] = True
+        return np.flatnonzero(in_range if mask is None else in_range & mask)
+
+@st.cache_resource(show_spinner=False)
+def build_filter_index(_df, data_version):
+    """Filter bitmaps and sorted scores over the district frame, shared by every session"""
+    return DistrictFilterIndex(_df)
+
+# Hierarchy the aggregate cube is built over, outermost first
+CUBE_DIMENSIONS = ('state', 'region', 'tier', 'ai_cluster')
+
+class AggregateCube:
+    """Sums, counts, means and population-weighted means for every grouping set
+    
+    The finest level (all dimensions) is computed in one pass with bincount,
+    then every coarser grouping set, down to the grand total, is rolled up
+    from it. Each grouping set is a small frame with (statistic, measure)
+    columns, so page-level aggregates and drill-downs are lookups.
+    """
+    
+    STATISTICS = ('sum', 'count', 'mean', 'weighted_mean')
+    
+    def __init__(self, df, dimensions=CUBE_DIMENSIONS, weight_column='population_2025'):
+        self.dimensions = tuple(d for d in dimensions if d in df.columns)
+        self.measures = [c for c in df.select_dtypes('number').columns if c not in ('lat', 'lon')]
+        
+        grouper = df.groupby(list(self.dimensions), observed=True, dropna=False, sort=True)
+        groups = grouper.ngroup().to_numpy()
+        sizes = grouper.size()
+        n_groups = len(sizes)
+        weights = np.nan_to_num(df[weight_column].to_numpy(dtype=float)) if weight_column in df.columns else np.ones(len(df))
+        
+        # Additive partials at the finest level
+        partials = {}
+        for measure in self.measures:
+            values = df[measure].to_numpy(dtype=float)
+            present = ~np.isnan(values)
+            rows = groups[present]
+            partials[('sum', measure)] = np.bincount(rows, weights=values[present], minlength=n_groups)
+            partials[('count', measure)] = np.bincount(rows, minlength=n_groups).astype(float)
+            partials[('weighted_sum', measure)] = np.bincount(rows, weights=values[present] * weights[present], minlength=n_groups)
+            partials[('weight', measure)] = np.bincount(rows, weights=weights[present], minlength=n_groups)
+        partials[('districts', '')] = sizes.to_numpy(dtype=float)
+        base = pd.DataFrame(partials, index=sizes.index)
+        
+        self.sets = {}
+        for mask in range(1 << len(self.dimensions)):
+            levels = tuple(d for i, d in enumerate(self.dimensions) if mask >> i & 1)
+            if levels:
+                rolled = base.groupby(level=list(levels), observed=True, dropna=False).sum()
+            else:
+                rolled = base.sum().to_frame('All').T
+            self.sets[levels] = self._finish(rolled)
+    
+    @staticmethod
+    def _finish(rolled):
+        """Derive means from the additive partials of one grouping set"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = rolled['sum'] / rolled['count'].where(rolled['count'] > 0)
+            weighted_mean = rolled['weighted_sum'] / rolled['weight'].where(rolled['weight'] > 0)
+        frame = pd.concat({'sum': rolled['sum'], 'count': rolled['count'], 'mean': mean, 'weighted_mean': weighted_mean}, axis=1)
+        frame[('districts', '')] = rolled[('districts', '')].astype(int)
+        return frame
+    
+    def _set(self, by):
+        by = (by,) if isinstance(by, str) else tuple(by)
+        canonical = tuple(d for d in self.dimensions if d in by)
+        if len(canonical) != len(by):
+            raise KeyError(f"Unknown cube dimensions: {by}")
+        frame = self.sets[canonical]
+        return frame.reorder_levels(list(by)).sort_index() if len(by) > 1 and canonical != by else frame
+    
+    def table(self, by=(), stat='mean'):
+        """One statistic for every measure, indexed by the requested dimensions"""
+        if stat not in self.STATISTICS:
+            raise ValueError(f"stat must be one of {self.STATISTICS}")
+        return self._set(by)[stat]
+    
+    def districts(self, by=()):
+        """District counts per group"""
+        return self._set(by)[('districts', '')].rename('districts')
+    
+    def cell(self, by, key, stat='mean'):
+        """One group's statistics, e.g. cell('state', 'Karnataka')"""
+        return self.table(by, stat).loc[key]
+    
+    def total(self, stat='sum'):
+        """Grand-total statistics across every district"""
+        return self.table((), stat).iloc[0]
+
+@st.cache_resource(show_spinner=False)
+def build_aggregate_cube(_df, data_version):
+    """Aggregate cube over the district hierarchy, shared by every session"""
+    return AggregateCube(_df)
+
+# What-if levers: additive changes an analyst can apply to districts, with the
+# slider range and step of the change, and the bounds the changed value is clipped to
+SCENARIO_LEVERS = {
+    'power_availability': {'label': 'Power Availability', 'unit': 'pts', 'change': (-30.0, 30.0), 'step': 1.0, 'bounds': (0, 100)},
+    'road_density': {'label': 'Road Density', 'unit': 'index', 'change': (-60.0, 60.0), 'step': 5.0, 'bounds': (0, None)},
+    'internet_penetration': {'label': 'Internet Penetration', 'unit': 'pts', 'change': (-30.0, 30.0), 'step': 1.0, 'bounds': (0, 100)},
+    'logistics_connectivity': {'label': 'Logistics Connectivity', 'unit': 'pts', 'change': (-30.0, 30.0), 'step': 1.0, 'bounds': (0, 100)},
+    'bank_branches_per_100k': {'label': 'Bank Branches', 'unit': 'per 100k', 'change': (-10.0, 10.0), 'step': 1.0, 'bounds': (0, None)},
+    'literacy_rate_2025': {'label': 'Literacy Rate', 'unit': 'pts', 'change': (-15.0, 15.0), 'step': 0.5, 'bounds': (0, 100)}
+}
+# infrastructure_index is a linear composite of these lever columns, with a road
+# density scale that differs by state (roads / 2 in Karnataka, / 1.5 in Maharashtra,
+# / 1.8 in Tamil Nadu, / 1.2 in Uttar Pradesh in the shipped files). The weights
+# are fitted per state from the loaded frame; a state the fit does not reproduce
+# to within the tolerance keeps its infrastructure_index fixed under the levers.
+INFRASTRUCTURE_INPUTS = ('internet_penetration', 'road_density', 'power_availability', 'logistics_connectivity')
+INFRASTRUCTURE_FIT_TOLERANCE = 0.5
+SCENARIO_TOP_N = 10
+
+def fit_infrastructure_composite(df, state_codes, n_states):
+    """(n_states, len(INFRASTRUCTURE_INPUTS)) weights of infrastructure_index on its inputs, per state
+    
+    Least squares without an intercept over each state's complete rows. States
+    whose fit misses any row by more than INFRASTRUCTURE_FIT_TOLERANCE index
+    points get zero weights.
+    """
+    weights = np.zeros((n_states, len(INFRASTRUCTURE_INPUTS)))
+    if 'infrastructure_index' not in df.columns or not all(column in df.columns for column in INFRASTRUCTURE_INPUTS):
+        return weights
+    X = np.column_stack([df[column].to_numpy(dtype=float) for column in INFRASTRUCTURE_INPUTS])
+    y = df['infrastructure_index'].to_numpy(dtype=float)
+    complete = ~(np.isnan(X).any(axis=1) | np.isnan(y))
+    for state in range(n_states):
+        rows = np.flatnonzero(complete & (state_codes == state))
+        if len(rows) < len(INFRASTRUCTURE_INPUTS):
+            continue
+        coefficients = np.linalg.lstsq(X[rows], y[rows], rcond=None)[0]
+        if np.abs(X[rows] @ coefficients - y[rows]).max() <= INFRASTRUCTURE_FIT_TOLERANCE:
+            weights[state] = coefficients
+    return weights
+
+class ScenarioEngine:
+    """Incremental what-if re-scoring of ml_predicted_score
+    
+    Every lever is an identity-transformed model feature (or feeds
+    infrastructure_index), so changing it by d moves a district's unclipped
+    score by weight x d, with one weight per state. Only districts within d
+    of a lever bound (or missing the input) move by less, so a scenario adds
+    one shift per state to the affected rows and patches those few. Baseline scores, risk bands and per-state sums
+    are precomputed once; band counts, state means and national ranks are
+    patched around the affected rows without touching the district frame.
+    """
+    
+    def __init__(self, df, model):
+        weights = dict(zip((column for column, _ in model.features), model.weights))
+        transforms = dict(model.features)
+        self.target_range = model.target_range
+        
+        states = df['state'].astype('category')
+        self.states = list(states.cat.categories)
+        self.state_codes = states.cat.codes.to_numpy()
+        # Runs of consecutive rows in one state (state files load contiguously), for segment sums
+        self.state_runs = np.flatnonzero(np.r_[True, self.state_codes[1:] != self.state_codes[:-1]])
+        
+        # Per-state lever weights: the model's own weight plus its share through infrastructure_index
+        composite_weight = weights.get('infrastructure_index', 0.0) if 'infrastructure_index' in df.columns else 0.0
+        composite = fit_infrastructure_composite(df, self.state_codes, len(self.states))
+        self.levers = {}
+        for column in SCENARIO_LEVERS:
+            if column in df.columns and (transforms.get(column) == 'identity' or column in INFRASTRUCTURE_INPUTS):
+                values = df[column].to_numpy(dtype=float)
+                weight = np.full(len(self.states), weights.get(column, 0.0))
+                if column in INFRASTRUCTURE_INPUTS:
+                    weight += composite_weight * composite[:, INFRASTRUCTURE_INPUTS.index(column)]
+                self.levers[column] = (values, weight, bool(np.isnan(values).any()))
+        
+        self.scores = df['ml_predicted_score'].to_numpy(dtype=float)
+        self.unclipped = model.predict_unclipped(df)
+        # Scenario scores move the frame's own scores by the model's change, so
+        # scores supplied by the source data stay the baseline
+        self.offset = self.scores - np.clip(self.unclipped, *self.target_range)
+        self.has_offset = bool(np.any(self.offset != 0))
+        self.has_unscored = bool(np.isnan(self.scores).any())
+        # Ranks count strictly higher scores; unscored districts rank last
+        self.ranked = np.sort(self.scores[~np.isnan(self.scores)])
+        self.bands = np.asarray(assign_risk_bands(self.scores).codes)
+        self.band_counts = np.bincount(self.bands, minlength=len(RISK_BAND_LABELS))
+        
+        scored = ~np.isnan(self.scores)
+        self.state_sums = np.bincount(self.state_codes[scored], weights=self.scores[scored], minlength=len(self.states))
+        self.state_counts = np.bincount(self.state_codes[scored], minlength=len(self.states))
+    
+    def national_rank(self, values):
+        """1-based baseline national rank of each score"""
+        values = np.asarray(values, dtype=float)
+        higher = len(self.ranked) - np.searchsorted(self.ranked, values, side='right')
+        return np.where(np.isnan(values), len(self.ranked) + 1, higher + 1)
+    
+    @staticmethod
+    def band_codes(scores):
+        """Risk band codes as assign_risk_bands assigns them (NaN in the highest-risk band)"""
+        codes = np.zeros(len(scores), dtype=np.int8)
+        for threshold in RISK_BAND_THRESHOLDS:
+            codes += scores > threshold
+        return codes
+    
+    def simulate(self, rows, changes, top_n=SCENARIO_TOP_N):
+        """Re-score `rows` (sorted positions, or None for every district) under additive lever changes
+        
+        Returns the affected rows' count and mean score change, band moves,
+        patched band counts and state means, and the top_n affected districts
+        by scenario score with their national rank before and after.
+        """
+        take = (lambda values: values) if rows is None else (lambda values: values[rows])
+        state_codes = take(self.state_codes)
+        shift, patches = np.zeros(len(self.states)), []
+        for column, change in changes.items():
+            if not change or column not in self.levers:
+                continue
+            values, weight, has_missing = self.levers[column]
+            values = take(values)
+            low, high = SCENARIO_LEVERS[column]['bounds']
+            shift += weight * change
+            # Districts the bound stops short of the full change, and those missing the input
+            bound = high if change > 0 else low
+            if bound is not None:
+                near = np.flatnonzero(values > bound - change if change > 0 else values < bound - change)
+                patches.append((near, weight[state_codes[near]] * (np.clip(values[near] + change, low, high) - values[near] - change)))
+            if has_missing:
+                missing = np.flatnonzero(np.isnan(values))
+                patches.append((missing, -weight[state_codes[missing]] * change))
+        
+        # One scalar when every state shifts alike, otherwise a gather of the per-state shifts
+        after = take(self.unclipped) + (shift[0] if len(shift) and np.all(shift == shift[0]) else shift[state_codes])
+        for near, correction in patches:
+            after[near] += correction
+        np.clip(after, *self.target_range, out=after)
+        if self.has_offset:
+            after += take(self.offset)
+        before = take(self.scores)
+        change = after - before
+        if self.has_unscored:
+            change[np.isnan(change)] = 0
+        
+        bands_before = take(self.bands)
+        bands_after = self.band_codes(after)
+        # Affected districts per band from threshold counts, swapped in for their baseline bands
+        above = [len(after)] + [np.count_nonzero(after > threshold) for threshold in RISK_BAND_THRESHOLDS] + [0]
+        band_counts = -np.diff(above)
+        if rows is not None:
+            band_counts += self.band_counts - np.bincount(bands_before, minlength=len(RISK_BAND_LABELS))
+        
+        if rows is None:
+            state_change = np.bincount(self.state_codes[self.state_runs], weights=np.add.reduceat(change, self.state_runs),
+                                       minlength=len(self.states))
+        else:
+            state_change = np.bincount(self.state_codes[rows], weights=change, minlength=len(self.states))
+        state_sums = self.state_sums + state_change
+        with np.errstate(invalid='ignore', divide='ignore'):
+            state_means = pd.DataFrame({
+                'state': self.states,
+                'baseline': self.state_sums / self.state_counts,
+                'scenario': state_sums / self.state_counts
+            })
+        
+        # Top affected districts: a partial sort of the scenario scores only. Every
+        # affected district scoring above one of them is in the list too, so
+        # scenario ranks count the list plus unaffected districts scoring higher.
+        ranked_after = np.where(np.isnan(after), -np.inf, after) if self.has_unscored else after
+        top = np.argpartition(ranked_after, len(after) - top_n)[-top_n:] if len(after) > top_n else np.arange(len(after))
+        top = top[np.argsort(-ranked_after[top], kind='stable')]
+        top_after = after[top]
+        rank_after = np.array([np.count_nonzero(top_after > value) for value in top_after]) + 1
+        if rows is not None:
+            rank_after += self.national_rank(top_after) - 1
+            rank_after -= np.array([np.count_nonzero(before > value) for value in top_after], dtype=rank_after.dtype)
+        top_table = pd.DataFrame({
+            'row': top if rows is None else rows[top],
+            'score_before': before[top],
+            'score_after': top_after,
+            'band_before': pd.Categorical.from_codes(bands_before[top], categories=list(RISK_BAND_LABELS), ordered=True),
+            'band_after': pd.Categorical.from_codes(bands_after[top], categories=list(RISK_BAND_LABELS), ordered=True),
+            'rank_before': self.national_rank(before[top]),
+            'rank_after': np.where(np.isnan(top_after), len(self.ranked) + 1, rank_after)
+        })
+        
+        return {
+            'rows': len(after),
+            'mean_change': float(change.mean()) if len(change) else 0.0,
+            'band_moves': (int(np.count_nonzero(bands_after > bands_before)), int(np.count_nonzero(bands_after < bands_before))),
+            'band_counts': pd.Series(band_counts, index=list(RISK_BAND_LABELS)),
+            'state_means': state_means,
+            'top': top_table
+        }
+
+@st.cache_resource(show_spinner=False)
+def build_scenario_engine(_df, data_version):
+    """What-if engine over the district frame, or None without a scoring model for it"""
+    model = load_score_model()
+    if model is None or not model.can_score(_df):
+        return None
+    return ScenarioEngine(_df, model)
+
+# Sub-district (taluk/block/tehsil) records live in their own per-state files
+# under data/subdistricts, keyed to their parent by district_code. They are
+# roughly 30x more numerous than districts, so they are never part of the
+# district frame: each file is derived once into a parquet store sorted by
+# district, and only the precomputed parent aggregates stay in memory.
+SUBDISTRICT_DIR = os.path.join(DATA_DIR, "subdistricts")
+SUBDISTRICT_COLUMNS = [
+    'subdistrict_name', 'subdistrict_code', 'subdistrict_type', 'district_code', 'population_2025',
+    'literacy_rate_2025', 'urbanization_rate_2025', 'work_participation_rate_2025', 'service_sector_share',
+    'manufacturing_share', 'agriculture_share', 'infrastructure_index', 'investment_readiness_score'
+]
+SUBDISTRICT_LABELS = ('subdistrict_name', 'subdistrict_code', 'subdistrict_type', 'district_code')
+# Rows per parquet row group; one district's sub-districts span at most a couple of groups
+SUBDISTRICT_ROW_GROUP_ROWS = 8_192
+
+def discover_subdistrict_files(data_dir=SUBDISTRICT_DIR):
+    """Every per-state sub-district file, in a stable order"""
+    return sorted(glob.glob(os.path.join(data_dir, "*_subdistricts.csv")))
+
+def _subdistrict_unit_paths(path, digest):
+    """Parquet paths of one derived sub-district file and of its parent aggregates"""
+    stem = os.path.basename(path)[:-len('.csv')]
+    base = os.path.join(CACHE_DIR, f"sub_{stem}_{derivation_tag()}_{digest}")
+    return f"{base}.parquet", f"{base}_parents.parquet"
+
+def subdistrict_parent_aggregates(frame):
+    """One row per district of a frame sorted by district_code: row range, counts and rollups
+    
+    Rates and indices roll up as population-weighted means, so a district's
+    aggregate matches what its sub-districts imply rather than a plain average.
+    """
+    codes = frame['district_code'].to_numpy()
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.array([], dtype=int)
+    stops = np.r_[starts[1:], len(codes)].astype(int)
+    population = np.nan_to_num(frame['population_2025'].to_numpy(dtype=float))
+    
+    parents = {
+        'district_code': codes[starts],
+        'start': starts,
+        'stop': stops,
+        'subdistricts': stops - starts,
+        'population_2025': np.add.reduceat(population, starts) if len(starts) else population[:0]
+    }
+    for column in SUBDISTRICT_COLUMNS:
+        if column in SUBDISTRICT_LABELS or column == 'population_2025' or not len(starts):
+            continue
+        values = frame[column].to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        weight = np.add.reduceat(np.where(present, population, 0.0), starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            parents[column] = np.add.reduceat(np.where(present, values * population, 0.0), starts) / np.where(weight > 0, weight, np.nan)
+    
+    scores = frame['investment_readiness_score'].to_numpy(dtype=float)
+    if len(starts):
+        parents['score_min'] = np.fmin.reduceat(scores, starts)
+        parents['score_max'] = np.fmax.reduceat(scores, starts)
+    return pd.DataFrame(parents)
+
+def ingest_subdistrict_file(path, digest):
+    """Derive one sub-district file into its store; returns (parent aggregates or None, problems)
+    
+    Rows are sorted by district_code before writing, so each district's
+    sub-districts form one contiguous range of the store. The store and
+    parent aggregates are cached on disk by content hash like state units.
+    """
+    store_path, parents_path = _subdistrict_unit_paths(path, digest)
+    if os.path.exists(store_path) and os.path.exists(parents_path):
+        try:
+            return pd.read_parquet(parents_path), []
+        except Exception:
+            pass  # Unreadable cache entry; rebuild it below
+    
+    try:
+        frame = _read_source_csv(path)
+    except Exception as e:
+        return None, [f"could not be parsed: {e}"]
+    
+    problems = validate_state_file(frame, SUBDISTRICT_COLUMNS, SUBDISTRICT_LABELS,
+                                   keys=('subdistrict_code', 'district_code'))
+    if problems:
+        return None, problems
+    
+    frame['district_code'] = frame['district_code'].astype(str)
+    frame = frame.sort_values(['district_code', 'subdistrict_code'], kind='stable', ignore_index=True)
+    frame = apply_district_schema(frame[SUBDISTRICT_COLUMNS]).assign(
+        subdistrict_type=lambda f: f['subdistrict_type'].astype('category')
+    )
+    clusters = load_cluster_model()
+    if clusters is not None:
+        frame['ai_cluster'] = clusters.assign(frame)
+    parents = subdistrict_parent_aggregates(frame)
+    
+    # Unlike state units the store is the only copy the page reads, so a failed write is a load problem
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for data, unit_path, group_rows in ((frame, store_path, SUBDISTRICT_ROW_GROUP_ROWS), (parents, parents_path, None)):
+            tmp_path = f"{unit_path}.{os.getpid()}.tmp"
+            data.to_parquet(tmp_path, index=False, row_group_size=group_rows)
+            os.replace(tmp_path, unit_path)
+        _prune_cache_units(f"sub_{os.path.basename(path)[:-len('.csv')]}_", [store_path, parents_path])
+    except Exception as e:
+        return None, [f"could not write the sub-district store: {e}"]
+    return parents, []
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def read_store_rows(store_path, row_groups, offset, length):
+    """`length` rows starting `offset` rows into the given row groups of a parquet store"""
+    import pyarrow.parquet as pq
+    table = pq.ParquetFile(store_path).read_row_groups(list(row_groups))
+    return table.slice(offset, length).to_pandas()
+
+class SubDistrictStore:
+    """Parent aggregates for every district with sub-districts, plus lazy access to their rows
+    
+    Only one row per district is resident. A district's sub-districts are a
+    contiguous row range of one store, so drilling in reads just the row
+    groups that overlap that range; recently opened districts are cached.
+    """
+    
+    def __init__(self, parents, stores, load_issues=()):
+        self.parents = parents
+        self.stores = stores
+        self.load_issues = list(load_issues)
+        self._group_bounds = {}
+    
+    def __contains__(self, code):
+        return code in self.parents.index
+    
+    def __len__(self):
+        return len(self.parents)
+    
+    def summary(self, code):
+        """Precomputed aggregates of one district's sub-districts"""
+        return self.parents.loc[code]
+    
+    def _bounds(self, store):
+        """Cumulative row counts of a store's row groups, read from its footer once"""
+        if store not in self._group_bounds:
+            import pyarrow.parquet as pq
+            metadata = pq.ParquetFile(self.stores[store]).metadata
+            sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+            self._group_bounds[store] = np.cumsum([0] + sizes)
+        return self._group_bounds[store]
+    
+    def load(self, code):
+        """All sub-district rows of one district, read on demand"""
+        parent = self.parents.loc[code]
+        start, stop = int(parent['start']), int(parent['stop'])
+        bounds = self._bounds(parent['store'])
+        first = int(np.searchsorted(bounds, start, side='right')) - 1
+        last = int(np.searchsorted(bounds, stop, side='left'))
+        return read_store_rows(self.stores[parent['store']], tuple(range(first, last)),
+                               start - int(bounds[first]), stop - start)
+
+def load_subdistrict_store():
+    """Sub-district store for the current source files (empty if there are none)"""
+    manifest = tuple((path, source_digest(path)) for path in discover_subdistrict_files())
+    return build_subdistrict_store(manifest)
+
+@st.cache_resource(show_spinner=False)
+def build_subdistrict_store(manifest):
+    """Derive every sub-district file (concurrently) and combine their parent aggregates"""
+    with ThreadPoolExecutor(max_workers=min(8, max(len(manifest), 1))) as pool:
+        results = list(pool.map(lambda entry: ingest_subdistrict_file(*entry), manifest))
+    
+    parents, stores, load_issues = [], {}, []
+    for (path, digest), (frame, problems) in zip(manifest, results):
+        if problems:
+            load_issues.append((os.path.basename(path), "; ".join(problems)))
+            continue
+        store = os.path.basename(path)[:-len('.csv')]
+        stores[store] = _subdistrict_unit_paths(path, digest)[0]
+        parents.append(frame.assign(store=store))
+    
+    if parents:
+        combined = pd.concat(parents, ignore_index=True)
+        # A district split across files keeps the rows of the first file only
+        combined = combined.drop_duplicates('district_code').set_index('district_code')
+    else:
+        combined = pd.DataFrame(columns=['start', 'stop', 'subdistricts', 'store'], index=pd.Index([], name='district_code'))
+    return SubDistrictStore(combined, stores, load_issues)
+
+# Multi-year panel: long-format (district_code, year, indicator...) files under
+# data/panel, written once into a store with one parquet partition per year.
+# The snapshot columns of the district frame stay the single-year view; the
+# panel adds trajectories, aligned to the frame's rows when it is built.
+PANEL_DIR = os.path.join(DATA_DIR, "panel")
+PANEL_INDICATORS = {
+    'population': 'Population',
+    'gdp_per_capita': 'GDP per Capita',
+    'literacy_rate': 'Literacy Rate',
+    'urbanization_rate': 'Urbanization Rate',
+    'infrastructure_index': 'Infrastructure Index'
+}
+PANEL_COLUMNS = ['district_code', 'year'] + list(PANEL_INDICATORS)
+PANEL_ROLLING_YEARS = 3
+
+def discover_panel_files(data_dir=PANEL_DIR):
+    """Every per-state panel file, in a stable order"""
+    return sorted(glob.glob(os.path.join(data_dir, "*_panel.csv")))
+
+# Superseded panel stores are removed only once unused for this long, so a
+# process still reading an older version is never pulled from under.
+PANEL_STORE_GRACE_SECONDS = 15 * 60
+
+def _prune_panel_stores(keep):
+    """Remove panel stores other than `keep` that have not been used within the grace period"""
+    cutoff = time.time() - PANEL_STORE_GRACE_SECONDS
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        if name.startswith('panel_') and path != keep:
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+            except OSError:
+                pass  # Already removed by another process
+
+def write_panel_store(manifest):
+    """Year-partitioned parquet store for the panel files; returns (store dir or None, load issues)
+    
+    The store is keyed by the content hashes of every panel file, so it is
+    rebuilt only when one of them changes. Each use refreshes the store's
+    mtime, which is what _prune_panel_stores measures staleness by.
+    """
+    # Panels are not scored, so only DERIVATION_VERSION (not the model) is part of the key
+    fingerprint = _source_fingerprint({os.path.basename(p): d for p, d in manifest}, tag=f"v{DERIVATION_VERSION}")
+    store_dir = os.path.join(CACHE_DIR, f"panel_{fingerprint}")
+    if os.path.isdir(store_dir):
+        try:
+            os.utime(store_dir)
+        except OSError:
+            pass  # Read-only cache; the store is still usable
+        return store_dir, []
+    
+    frames, load_issues = [], []
+    for path, _ in manifest:
+        try:
+            frame = _read_source_csv(path)
+        except Exception as e:
+            load_issues.append((os.path.basename(path), f"could not be parsed: {e}"))
+            continue
+        problems = validate_state_file(frame, PANEL_COLUMNS, labels=('district_code',), keys=('district_code', 'year'))
+        if problems:
+            load_issues.append((os.path.basename(path), "; ".join(problems)))
+        else:
+            frames.append(frame[PANEL_COLUMNS])
+    if not frames:
+        return None, load_issues
+    
+    panel = pd.concat(frames, ignore_index=True).astype({'district_code': str, 'year': 'int16'})
+    panel = panel.astype({indicator: 'float32' for indicator in PANEL_INDICATORS})
+    
+    # Built under a name the prune never matches, then renamed into place whole
+    tmp_dir = os.path.join(CACHE_DIR, f"tmp_panel_{fingerprint}.{os.getpid()}")
+    try:
+        for year, rows in panel.groupby('year', sort=True):
+            os.makedirs(os.path.join(tmp_dir, f"year={year}"), exist_ok=True)
+            rows.drop(columns='year').to_parquet(os.path.join(tmp_dir, f"year={year}", "part-0.parquet"), index=False)
+        try:
+            os.replace(tmp_dir, store_dir)
+        except OSError:
+            if not os.path.isdir(store_dir):
+                raise
+            # Another process published the same store first; its copy is identical
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        _prune_panel_stores(store_dir)
+    except Exception as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        load_issues.append(("panel store", f"could not be written: {e}"))
+        return None, load_issues
+    return store_dir, load_issues
+
+def read_panel_store(store_dir):
+    """Long-format panel from a year-partitioned store"""
+    frames = []
+    for name in sorted(os.listdir(store_dir)):
+        if name.startswith('year='):
+            year_frame = pd.read_parquet(os.path.join(store_dir, name))
+            frames.append(year_frame.assign(year=np.int16(name[len('year='):])))
+    return pd.concat(frames, ignore_index=True)
+
+def _rolling_nanmean(grid, window):
+    """Mean of each year and the `window - 1` years before it, skipping missing years"""
+    present = ~np.isnan(grid)
+    sums = np.cumsum(np.where(present, grid, 0.0), axis=1, dtype=float)
+    counts = np.cumsum(present, axis=1)
+    sums[:, window:] -= sums[:, :-window].copy()
+    counts[:, window:] -= counts[:, :-window].copy()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+class DistrictPanel:
+    """District x year float32 arrays of every panel indicator, aligned to the district frame's rows
+    
+    The long-format store is pivoted once; annualized year-on-year growth,
+    the compound annual growth rate between each district's first and last
+    observed years, and rolling means are then computed for all districts at
+    once, so pages only index into precomputed arrays.
+    """
+    
+    def __init__(self, panel, lookup, n_districts):
+        positions = panel['district_code'].map(lookup.position_of)
+        known = positions.notna().to_numpy()
+        self.unmatched = int((~known).sum())
+        rows = positions.to_numpy()[known].astype(np.int64)
+        self.years = np.sort(panel['year'].unique()).astype(int)
+        columns = np.searchsorted(self.years, panel['year'].to_numpy()[known])
+        gaps = np.diff(self.years)
+        
+        self.values, self.growth, self.rolling, self.cagr = {}, {}, {}, {}
+        for indicator in PANEL_INDICATORS:
+            grid = np.full((n_districts, len(self.years)), np.nan, dtype=np.float32)
+            grid[rows, columns] = panel[indicator].to_numpy(dtype=np.float32)[known]
+            self.values[indicator] = grid
+            
+            with np.errstate(invalid='ignore', divide='ignore'):
+                previous, current = grid[:, :-1], grid[:, 1:]
+                growth = np.where(previous > 0, (current / previous) ** (1 / gaps), np.nan) - 1
+            self.growth[indicator] = growth.astype(np.float32)
+            self.rolling[indicator] = _rolling_nanmean(grid, PANEL_ROLLING_YEARS).astype(np.float32)
+            self.cagr[indicator] = self._span_cagr(grid)
+        self.covered = ~np.isnan(self.values[next(iter(PANEL_INDICATORS))]).all(axis=1)
+    
+    def _span_cagr(self, grid):
+        """Compound annual growth from each district's first to last observed year"""
+        present = ~np.isnan(grid)
+        first = present.argmax(axis=1)
+        last = grid.shape[1] - 1 - present[:, ::-1].argmax(axis=1)
+        rows = np.arange(len(grid))
+        start, end = grid[rows, first], grid[rows, last]
+        span = (self.years[last] - self.years[first]).astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where((span > 0) & (start > 0) & (end > 0), (end / start) ** (1 / np.where(span > 0, span, 1)) - 1, np.nan)
+    
+    def trajectory(self, position, indicator):
+        """One district's yearly values, rolling mean and year-on-year growth"""
+        return pd.DataFrame({
+            'year': self.years,
+            'value': self.values[indicator][position],
+            'rolling_mean': self.rolling[indicator][position],
+            'growth': np.r_[np.nan, self.growth[indicator][position]]
+        })
+    
+    def mean_trajectory(self, indicator, rows):
+        """Mean yearly value over a set of district rows (e.g. a state)"""
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # Years no district in `rows` reports
+            return np.nanmean(self.values[indicator][rows], axis=0)
+
+@st.cache_resource(show_spinner=False)
+def build_district_panel(_df, data_version, manifest):
+    """(panel arrays or None, load issues) for the district frame, shared by every session"""
+    store_dir, load_issues = write_panel_store(manifest)
+    if store_dir is None:
+        return None, load_issues
+    return DistrictPanel(read_panel_store(store_dir), build_district_lookup(_df, data_version), len(_df)), load_issues
+
+def load_district_panel(df, data_version):
+    """(panel, load issues) for the current panel files; the panel is None if there are none"""
+    manifest = tuple((path, source_digest(path)) for path in discover_panel_files())
+    return build_district_panel(df, data_version, manifest) if manifest else (None, [])
+
 def main():
     """Main application function"""
     
@@ -396,48 +2628,40 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Load data
-    df, feature_importance = load_data()
-    if df is None:
-        st.stop()
+    # Sidebar layout: state summary above navigation, filled once data is loaded
+    state_sidebar = st.sidebar.container()
     
     # Professional sidebar navigation
     st.sidebar.markdown("### 🧭 Navigation")
     
-    page_options = {
-        "🎯 Executive Summary": "executive_summary",
-        "🗺️ Interactive Investment Map": "investment_map", 
-        "🤖 AI Model Insights": "ai_insights",
-        "📊 Sector Analysis": "sector_analysis",
-        "🏙️ District Deep Dive": "district_analysis",
-        "🔬 Technical Methodology": "methodology",
-        "👨‍💼 About": "about"
-    }
-    
     selected_page = st.sidebar.selectbox(
         "Choose Analysis Section",
-        list(page_options.keys()),
-        index=0
+        list(PAGES.keys()),
+        index=0,
+        key="page"
     )
     
-    page_key = page_options[selected_page]
+    page = PAGES[selected_page]
+    
+    # Load only what the selected page declares
+    inputs = {}
+    if page['data']:
+        df, feature_importance = load_data()
+        if df is None:
+            st.stop()
+        
+        render_state_sidebar(df, state_sidebar)
+        
+        for file_name, problem in df.attrs.get('load_issues', []):
+            st.warning(f"⚠️ Skipped {file_name}: {problem}")
+        
+        inputs = {'districts': df, 'feature_importance': feature_importance}
+        version = data_version(df)
+        for build_table in page['tables']:
+            build_table(df, version)
     
-   
     # Page routing
-    if page_key == "executive_summary":
-        executive_summary_page(df, feature_importance)
-    elif page_key == "investment_map":
-        investment_map_page(df)
-    elif page_key == "ai_insights":
-        ai_insights_page(df, feature_importance)
-    elif page_key == "sector_analysis":
-        sector_analysis_page(df)
-    elif page_key == "district_analysis":
-        district_analysis_page(df)
-    elif page_key == "methodology":
-        methodology_page(df)
-    elif page_key == "about":
-        about_page()
+    page['render'](*[inputs[name] for name in page['data']])
     
     # Professional footer
     st.markdown("""
@@ -449,6 +2673,7 @@ def main():
 
 def executive_summary_page(df, feature_importance):
     """Executive Summary Page - Consulting Style"""
+    cube = build_aggregate_cube(df, data_version(df))
     
     st.markdown("## 🎯 Executive Summary")
     
@@ -482,7 +2707,7 @@ def executive_summary_page(df, feature_importance):
         """, unsafe_allow_html=True)
     
     with col2:
-        total_pop = df['population_2025'].sum() / 10000000
+        total_pop = cube.total('sum')['population_2025'] / 10000000
         st.markdown(f"""
         <div class="metric-card">
             <div class="metric-number">{total_pop:.0f}Cr</div>
@@ -510,8 +2735,8 @@ def executive_summary_page(df, feature_importance):
     st.markdown("### 💡 Key Strategic Findings")
     
     # Finding 1: Four State Analysis
-    states_analyzed = df['state'].unique()
-    cluster_dist = df['ai_cluster'].value_counts()
+    states_analyzed = cube.districts('state').index.astype(str)
+    cluster_dist = cube.districts('ai_cluster').sort_values(ascending=False)
     
     st.markdown(f"""
     <div class="key-finding">
@@ -519,9 +2744,9 @@ def executive_summary_page(df, feature_importance):
         <strong>Comprehensive Four-State Economic Analysis</strong>
         <p>Our AI analysis covers all four major states: <strong>{', '.join(states_analyzed)}</strong></p>
         <ul>
-            <li><strong>Economic Diversity:</strong> {cluster_dist.iloc[0] if len(cluster_dist) > 0 else 'N/A'} districts identified as advanced hubs</li>
-            <li><strong>Growth Potential:</strong> {cluster_dist.iloc[1] if len(cluster_dist) > 1 else 'N/A'} districts showing industrial transformation</li>
-            <li><strong>Rural Opportunity:</strong> {cluster_dist.iloc[2] if len(cluster_dist) > 2 else 'N/A'} districts with agro-processing potential</li>
+            <li><strong>Economic Diversity:</strong> {cluster_dist.get(CLUSTER_NAMES[0], 'N/A')} districts identified as advanced hubs</li>
+            <li><strong>Growth Potential:</strong> {cluster_dist.get(CLUSTER_NAMES[1], 'N/A')} districts showing industrial transformation</li>
+            <li><strong>Rural Opportunity:</strong> {cluster_dist.get(CLUSTER_NAMES[2], 'N/A')} districts with agro-processing potential</li>
         </ul>
         <p><strong>Investment Implication:</strong> Diversified portfolio approach required across different economic models</p>
     </div>
@@ -529,28 +2754,33 @@ def executive_summary_page(df, feature_importance):
     
     # Finding 2: Infrastructure Dominance
     if feature_importance is not None and len(feature_importance) > 0:
-        top_feature = feature_importance.iloc[0]
-        feature_name = top_feature['feature'].replace('_', ' ').title()
-        importance_pct = top_feature['importance'] * 100
+        ranked = feature_importance.sort_values('importance', ascending=False)
+        names = ranked['feature'].str.replace('_', ' ').str.title().tolist()
+        shares = (ranked['importance'] * 100).tolist()
+        runners_up = " and ".join(f"<strong>{name}</strong> ({share:.1f}%)" for name, share in zip(names[1:3], shares[1:3]))
+        if is_permutation_importance(feature_importance):
+            source_note = "Shares are permutation importances: how much the model's error grows when a feature is shuffled across districts."
+        else:
+            source_note = "Shares come from the provided feature importance analysis (feature_importance_analysis.csv)."
         
         st.markdown(f"""
         <div class="key-finding">
             <span class="finding-number">2</span>
-            <strong>Digital Infrastructure Drives Investment Success</strong>
-            <p><strong>{feature_name}</strong> accounts for {importance_pct:.1f}% of investment success prediction.</p>
-            <p>Traditional factors like literacy and population size rank surprisingly low, indicating that <strong>connectivity trumps everything</strong> in modern investment decisions.</p>
-            <p><strong>Investment Implication:</strong> Prioritize districts with digital infrastructure over traditional economic indicators.</p>
+            <strong>{names[0]} Drives Investment Success</strong>
+            <p><strong>{names[0]}</strong> accounts for {shares[0]:.1f}% of investment success prediction{f", followed by {runners_up}" if runners_up else ""}.</p>
+            <p>{source_note}</p>
+            <p><strong>Investment Implication:</strong> Prioritize districts that lead on {names[0].lower()} over indicators the model barely uses.</p>
         </div>
         """, unsafe_allow_html=True)
     
     # Finding 3: Hidden Opportunities
-    moderate_risk = len(df[df['investment_risk_category'] == 'Higher Risk, Moderate Return'])
+    moderate_risk = int((df['investment_risk_category'] == RISK_BAND_LABELS[0]).sum())
     
     st.markdown(f"""
     <div class="key-finding">
         <span class="finding-number">3</span>
         <strong>Significant Untapped Investment Opportunities</strong>
-        <p><strong>{moderate_risk} districts</strong> identified as "Higher Risk, Moderate Return" - representing substantial opportunities for patient capital.</p>
+        <p><strong>{moderate_risk} districts</strong> identified as "{RISK_BAND_LABELS[0]}" - representing substantial opportunities for patient capital.</p>
         <p>These districts have strong fundamentals but require targeted infrastructure investment to unlock their potential.</p>
         <p><strong>Investment Implication:</strong> First-mover advantage available in undervalued markets with clear growth trajectories.</p>
     </div>
@@ -562,11 +2792,11 @@ def executive_summary_page(df, feature_importance):
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
+        st.markdown(f"""
         <div class="insight-box">
             <div class="insight-title">🚀 Immediate Opportunities</div>
             <div class="insight-content">
-                <strong>Low Risk, High Return districts</strong> for immediate deployment of capital:
+                <strong>{RISK_BAND_LABELS[-1]} districts</strong> for immediate deployment of capital:
                 <ul>
                     <li>Focus on infrastructure-ready markets</li>
                     <li>Scale existing successful business models</li>
@@ -597,47 +2827,52 @@ def investment_map_page(df):
     st.markdown("## 🗺️ Interactive Investment Map")
     st.markdown("*Explore investment opportunities across districts with AI-powered insights*")
     
+    filter_index = build_filter_index(df, data_version(df))
+    panel, panel_issues = load_district_panel(df, data_version(df))
+    for file_name, problem in panel_issues:
+        st.warning(f"⚠️ Skipped {file_name}: {problem}")
+    
     # Control Panel
     st.markdown("### 🎛️ Map Controls")
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         # State filter
-        states = ['All States'] + sorted(df['state'].unique().tolist())
+        states = ['All States'] + filter_index.options['state']
         selected_state = st.selectbox("🏛️ Filter by State", states)
     
     with col2:
         # Risk category filter
-        risk_categories = ['All Risk Levels'] + sorted(df['investment_risk_category'].unique().tolist())
+        risk_categories = ['All Risk Levels'] + filter_index.options['investment_risk_category']
         selected_risk = st.selectbox("⚠️ Risk Level", risk_categories)
     
     with col3:
         # Minimum investment score
         min_score = st.slider("📊 Minimum AI Score", 
-                            min_value=int(df['ml_predicted_score'].min()), 
-                            max_value=int(df['ml_predicted_score'].max()), 
-                            value=int(df['ml_predicted_score'].min()))
+                            min_value=int(filter_index.score_min), 
+                            max_value=int(filter_index.score_max), 
+                            value=int(filter_index.score_min))
     
     with col4:
         # Color scheme
-        color_by = st.selectbox("🎨 Color Districts by", [
+        color_options = [
             "AI Investment Score", 
             "Risk Category", 
             "Population Size",
             "GDP per Capita",
             "Infrastructure Index"
-        ])
-    
-    # Filter data based on selections
-    filtered_df = df.copy()
-    
-    if selected_state != 'All States':
-        filtered_df = filtered_df[filtered_df['state'] == selected_state]
-    
-    if selected_risk != 'All Risk Levels':
-        filtered_df = filtered_df[filtered_df['investment_risk_category'] == selected_risk]
-    
-    filtered_df = filtered_df[filtered_df['ml_predicted_score'] >= min_score]
+        ]
+        if panel is not None:
+            color_options += ["GDP per Capita Growth (CAGR)", "Population Growth (CAGR)"]
+        color_by = st.selectbox("🎨 Color Districts by", color_options)
+    
+    # Filter data based on selections (index lookups, only matching rows are materialised)
+    filtered_rows = filter_index.select(
+        min_score=min_score,
+        state=None if selected_state == 'All States' else selected_state,
+        investment_risk_category=None if selected_risk == 'All Risk Levels' else selected_risk
+    )
+    filtered_df = df.iloc[filtered_rows]
     
     # Create the map visualization
     st.markdown("### 🌍 Investment Opportunity Map")
@@ -654,50 +2889,17 @@ def investment_map_page(df):
         st.warning("⚠️ No districts match your current filters. Please adjust the criteria.")
         return
     
-    # Prepare data for visualization with improved coordinates
+    # Coordinates are precomputed per district at load time
     map_data = filtered_df.copy()
     
-    # Add synthetic coordinates for demonstration with tighter clustering
-    np.random.seed(42)
-    
-    # Improved state centers with reduced spread
-    state_centers = {
-        'Maharashtra': {'lat': 19.7515, 'lon': 75.7139, 'lat_range': 1.2, 'lon_range': 1.5},
-        'Tamil Nadu': {'lat': 11.1271, 'lon': 78.6569, 'lat_range': 1.0, 'lon_range': 1.2},
-        'Karnataka': {'lat': 15.3173, 'lon': 75.7139, 'lat_range': 1.0, 'lon_range': 1.2},
-        'Uttar Pradesh': {'lat': 26.8467, 'lon': 80.9462, 'lat_range': 1.5, 'lon_range': 2.0}
-    }
-    
-    # Generate tighter coordinates for each district
-    coordinates = []
-    for _, row in map_data.iterrows():
-        state = row['state']
-        if state in state_centers:
-            center = state_centers[state]
-            lat = center['lat'] + np.random.uniform(-center['lat_range'], center['lat_range'])
-            lon = center['lon'] + np.random.uniform(-center['lon_range'], center['lon_range'])
-            coordinates.append({'lat': lat, 'lon': lon})
-        else:
-            # Default coordinates if state not found
-            coordinates.append({'lat': 20.0, 'lon': 77.0})
-    
-    coord_df = pd.DataFrame(coordinates)
-    map_data = pd.concat([map_data.reset_index(drop=True), coord_df], axis=1)
-    
     # Set up color mapping
     if color_by == "AI Investment Score":
         color_col = 'ml_predicted_score'
         color_scale = 'Viridis'
         title_suffix = "AI Investment Score"
     elif color_by == "Risk Category":
-        # Create numeric mapping for risk categories
-        risk_mapping = {
-            'Low Risk, High Return': 4,
-            'Medium Risk, Good Return': 3,
-            'Higher Risk, Moderate Return': 2,
-            'High Risk, Uncertain Return': 1
-        }
-        map_data['risk_numeric'] = map_data['investment_risk_category'].map(risk_mapping)
+        # Numeric band position for the colour scale (higher = lower risk)
+        map_data['risk_numeric'] = risk_band_rank(map_data['investment_risk_category'])
         color_col = 'risk_numeric'
         color_scale = 'RdYlGn'
         title_suffix = "Investment Risk (Green=Lower Risk)"
@@ -709,35 +2911,115 @@ def investment_map_page(df):
         color_col = 'gdp_per_capita'
         color_scale = 'Plasma'
         title_suffix = "GDP per Capita"
+    elif color_by.endswith("(CAGR)"):
+        # Precomputed per district when the panel was built; only the filtered rows are gathered
+        indicator = 'gdp_per_capita' if color_by.startswith("GDP") else 'population'
+        color_col = f'{indicator}_cagr'
+        map_data[color_col] = panel.cagr[indicator][filtered_rows] * 100
+        color_scale = 'RdYlGn'
+        title_suffix = f"{PANEL_INDICATORS[indicator]} CAGR {panel.years[0]}-{panel.years[-1]} (%)"
     else:  # Infrastructure Index
         color_col = 'infrastructure_index'
         color_scale = 'Cividis'
         title_suffix = "Infrastructure Quality"
     
-    # Create the interactive map
-    fig = px.scatter_mapbox(
-        map_data,
-        lat='lat',
-        lon='lon',
-        color=color_col,
-        size='population_2025',
-        hover_name='district_name',
-        hover_data={
-            'state': True,
-            'ml_predicted_score': ':.1f',
-            'investment_risk_category': True,
-            'gdp_per_capita': ':,',
-            'population_2025': ':,',
-            'tier': True,
-            'lat': False,
-            'lon': False
-        },
-        color_continuous_scale=color_scale,
-        size_max=25,
-        zoom=5,
-        height=600,
-        title=f"Investment Opportunity Map - Colored by {title_suffix}"
-    )
+    # Rendering mode: aggregate to hexbins whenever the selection exceeds the point budget.
+    # st.plotly_chart does not report the map viewport back to the script, so the
+    # switch follows the filtered district count rather than the zoom level:
+    # narrowing the filters is what brings individual districts back.
+    detail = st.radio("🔍 Map Detail", ["Auto", "Individual Districts", "Hexbin Clusters"], horizontal=True,
+                      help=f"Auto switches to hexagonal clusters when more than {MAP_POINT_BUDGET:,} districts pass the "
+                           "filters (zooming the map does not change this); narrow the state, tier or score filters "
+                           "to see individual districts again")
+    use_hexbins = detail == "Hexbin Clusters" or len(map_data) > MAP_POINT_BUDGET
+    if detail == "Individual Districts" and use_hexbins:
+        st.info(f"ℹ️ {len(map_data):,} districts exceed the {MAP_POINT_BUDGET:,} point budget - showing hexagonal clusters instead.")
+    
+    if use_hexbins:
+        cell_km = st.slider("⬡ Hexagon size (km)", min_value=10, max_value=300, value=50, step=10)
+        hex_data = hexbin_aggregate(map_data, color_col, cell_km)
+        
+        fig = px.scatter_mapbox(
+            hex_data,
+            lat='lat',
+            lon='lon',
+            color=color_col,
+            size='population_2025',
+            custom_data=['districts', 'population_2025', 'ml_predicted_score'],
+            color_continuous_scale=color_scale,
+            size_max=30,
+            zoom=5,
+            height=600
+        )
+        fig.update_traces(
+            hovertemplate=
+            "<b>%{customdata[0]:,} districts</b><br>" +
+            "Population: %{customdata[1]:,.0f}<br>" +
+            "Avg AI Investment Score: %{customdata[2]:.1f}<br>" +
+            "<extra></extra>"
+        )
+        st.caption(f"{len(map_data):,} districts aggregated into {len(hex_data):,} hexagons of ~{hex_data.attrs['cell_km']:.0f} km"
+                   + (f" - narrow the filters to {MAP_POINT_BUDGET:,} districts or fewer for individual points"
+                      if len(map_data) > MAP_POINT_BUDGET else ""))
+    elif len(map_data) > MAP_LEAN_TRACE_THRESHOLD:
+        # Lean WebGL trace: fixed marker size and name-only hover keep the payload small
+        fig = go.Figure(go.Scattermapbox(
+            lat=map_data['lat'].to_numpy(),
+            lon=map_data['lon'].to_numpy(),
+            mode='markers',
+            marker=dict(
+                size=6,
+                color=map_data[color_col].to_numpy(dtype=np.float32),
+                colorscale=color_scale,
+                showscale=True
+            ),
+            hovertext=map_data['district_name'],
+            customdata=map_data['ml_predicted_score'].to_numpy(),
+            hovertemplate="<b>%{hovertext}</b><br>AI Investment Score: %{customdata:.1f}<extra></extra>"
+        ))
+        fig.update_layout(height=600, mapbox=dict(zoom=5))
+    else:
+        # Plotly rejects NaN marker sizes, so districts without a population get the smallest marker
+        map_data['marker_size'] = map_data['population_2025'].to_numpy(dtype=float, na_value=0)
+        
+        # Create the interactive map
+        fig = px.scatter_mapbox(
+            map_data,
+            lat='lat',
+            lon='lon',
+            color=color_col,
+            size='marker_size',
+            hover_name='district_name',
+            hover_data={
+                'state': True,
+                'ml_predicted_score': ':.1f',
+                'investment_risk_category': True,
+                'gdp_per_capita': ':,',
+                'population_2025': ':,',
+                'tier': True,
+                'lat': False,
+                'lon': False,
+                'marker_size': False
+            },
+            color_continuous_scale=color_scale,
+            size_max=25,
+            zoom=5,
+            height=600,
+            title=f"Investment Opportunity Map - Colored by {title_suffix}"
+        )
+        
+        # Custom hover template
+        fig.update_traces(
+            hovertemplate=
+            "<b>%{hovertext}</b><br>" +
+            "State: %{customdata[0]}<br>" +
+            "AI Investment Score: %{customdata[1]:.1f}<br>" +
+            "Risk Category: %{customdata[2]}<br>" +
+            "GDP per Capita: ₹%{customdata[3]:,}<br>" +
+            "Population: %{customdata[4]:,}<br>" +
+            "Tier: %{customdata[5]}<br>" +
+            "<extra></extra>"
+        )
     
     # Update map layout for dark theme
     fig.update_layout(
@@ -757,19 +3039,6 @@ def investment_map_page(df):
         plot_bgcolor='rgba(0,0,0,0)'
     )
     
-    # Custom hover template
-    fig.update_traces(
-        hovertemplate=
-        "<b>%{hovertext}</b><br>" +
-        "State: %{customdata[0]}<br>" +
-        "AI Investment Score: %{customdata[1]:.1f}<br>" +
-        "Risk Category: %{customdata[2]}<br>" +
-        "GDP per Capita: ₹%{customdata[3]:,}<br>" +
-        "Population: %{customdata[4]:,}<br>" +
-        "Tier: %{customdata[5]}<br>" +
-        "<extra></extra>"
-    )
-    
     st.plotly_chart(fig, use_container_width=True)
     
     # Map insights below
@@ -811,6 +3080,50 @@ def investment_map_page(df):
         </div>
         """, unsafe_allow_html=True)
     
+    # Catchment analysis around a district
+    st.markdown("### 📍 Catchment Analysis")
+    st.markdown("*Find every district within a radius, or the nearest neighbours, of any selected district*")
+    
+    spatial_index = build_spatial_index(df, data_version(df))
+    lookup = build_district_lookup(df, data_version(df))
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        anchor_code = district_picker("🎯 Anchor District", filtered_df, lookup, key="catchment_anchor",
+                                      help=f"Top {DISTRICT_PICKER_LIMIT} filtered districts by AI score; search to reach any other")
+    
+    with col2:
+        radius_km = st.slider("📏 Radius (km)", min_value=10, max_value=500, value=100, step=10)
+    
+    with col3:
+        k_nearest = st.number_input("🔢 Nearest Districts", min_value=1, max_value=50, value=5)
+    
+    anchor = lookup.record(df, anchor_code)
+    catchment_columns = ['district_name', 'state', 'tier', 'ml_predicted_score', 'investment_risk_category', 'population_2025']
+    
+    query_start = time.perf_counter()
+    radius_rows, radius_km_away = spatial_index.within_radius(anchor['lat'], anchor['lon'], radius_km)
+    nearest_rows, nearest_km_away = spatial_index.nearest(anchor['lat'], anchor['lon'], int(k_nearest) + 1)
+    query_ms = (time.perf_counter() - query_start) * 1000
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        within = df.iloc[radius_rows][catchment_columns].assign(distance_km=radius_km_away.round(1))
+        within = within[within.index != anchor.name]
+        st.markdown(f"**{len(within)} districts within {radius_km} km of {anchor['district_name']}** "
+                    f"({within['population_2025'].sum() / 100000:,.1f}L population)")
+        st.dataframe(within.head(100), use_container_width=True, hide_index=True)
+    
+    with col2:
+        neighbours = df.iloc[nearest_rows][catchment_columns].assign(distance_km=nearest_km_away.round(1))
+        neighbours = neighbours[neighbours.index != anchor.name].head(int(k_nearest))
+        st.markdown(f"**{len(neighbours)} nearest districts to {anchor['district_name']}**")
+        st.dataframe(neighbours, use_container_width=True, hide_index=True)
+    
+    st.caption(f"Spatial index query time: {query_ms:.2f} ms across {len(df):,} districts")
+    
     # Top recommendations table
     st.markdown("### 🏆 Top Investment Recommendations from Current Selection")
     
@@ -865,6 +3178,9 @@ def investment_map_page(df):
 
 def ai_insights_page(df, feature_importance):
     """AI Model Insights Page - Technical Deep Dive"""
+    cube = build_aggregate_cube(df, data_version(df))
+    validation = model_validation(df, data_version(df))
+    summary = validation['summary'] if validation is not None else None
     
     st.markdown("## 🤖 AI Model Insights")
     st.markdown("*Understand how our machine learning models predict investment success*")
@@ -875,18 +3191,18 @@ def ai_insights_page(df, feature_importance):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown("""
+        st.markdown(f"""
         <div class="metric-card">
-            <div class="metric-number">96.6%</div>
-            <div class="metric-label">Model Accuracy (R²)</div>
+            <div class="metric-number">{f"{summary['r2']:.1%}" if summary else "—"}</div>
+            <div class="metric-label">Model Accuracy (CV R²)</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
+        st.markdown(f"""
         <div class="metric-card">
-            <div class="metric-number">3.3</div>
-            <div class="metric-label">Average Error (MAE)</div>
+            <div class="metric-number">{f"{summary['mae']:.1f}" if summary else "—"}</div>
+            <div class="metric-label">Average Error (CV MAE)</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -899,38 +3215,66 @@ def ai_insights_page(df, feature_importance):
         """, unsafe_allow_html=True)
     
     with col4:
-        st.markdown("""
+        st.markdown(f"""
         <div class="metric-card">
-            <div class="metric-number">12</div>
+            <div class="metric-number">{summary['features'] if summary else len(feature_importance) if feature_importance is not None else 0}</div>
             <div class="metric-label">Features Used</div>
         </div>
         """, unsafe_allow_html=True)
     
     # Key Investment Success Factors
     st.markdown("### 📊 What Drives Investment Success?")
-
-    # Center the insights
-    col1, col2, col3 = st.columns([1, 2, 1])
-
-    with col2:
-        st.markdown("""
-        <div class="insight-box">
-            <div class="insight-title">🔍 Key Investment Success Factors</div>
-            <div class="insight-content">
-                <strong>Infrastructure Dominance:</strong><br>
-                Digital connectivity accounts for 28% of investment success prediction, making it the most critical factor for modern economic development.
-                <br><br>
-                <strong>Banking & Financial Access:</strong><br>
-                Access to banking and financial institutions is fundamental for business operations, enabling capital access, transaction processing, and financial inclusion that drives economic growth.
-                <br><br>
-                <strong>Logistical & Transportation Connectivity:</strong><br>
-                Strong transportation networks and logistics connectivity are essential for market access, supply chain efficiency, and connecting districts to broader economic opportunities.
-                <br><br>
-                <strong>Investment Implication:</strong><br>
-                Prioritize districts with strong digital infrastructure, banking penetration, and transportation connectivity over traditional economic indicators alone.
+    
+    if feature_importance is None or len(feature_importance) == 0:
+        st.info("ℹ️ Feature importance is unavailable: no scoring model artifact or importance analysis was found.")
+    else:
+        ranked = feature_importance.sort_values('importance', ascending=False).head(10)
+        ranked = ranked.assign(
+            label=ranked['feature'].str.replace('_', ' ').str.title(),
+            share=ranked['importance'] * 100
+        )
+        
+        col1, col2 = st.columns([3, 2])
+        
+        with col1:
+            fig = px.bar(
+                ranked.iloc[::-1],
+                x='share',
+                y='label',
+                orientation='h',
+                error_x=ranked['importance_std'].iloc[::-1] * 100 if 'importance_std' in ranked.columns else None,
+                title=("Permutation Feature Importance (% of total)" if is_permutation_importance(ranked)
+                       else "Feature Importance (% of total)"),
+                labels={'share': 'Share of importance (%)', 'label': ''},
+                color='share',
+                color_continuous_scale='Blues'
+            )
+            fig.update_layout(
+                height=420,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#e2e8f0'),
+                coloraxis_showscale=False
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            top_three = ranked.head(3)
+            factors = "<br><br>".join(
+                f"<strong>{row.label}:</strong><br>{row.share:.1f}% of the model's predictive signal"
+                for row in top_three.itertuples()
+            )
+            st.markdown(f"""
+            <div class="insight-box">
+                <div class="insight-title">🔍 Key Investment Success Factors</div>
+                <div class="insight-content">
+                    {factors}
+                    <br><br>
+                    <strong>Investment Implication:</strong><br>
+                    The top three features carry {top_three['share'].sum():.0f}% of the importance; screen districts on these first.
+                </div>
             </div>
-        </div>
-        """, unsafe_allow_html=True)
+            """, unsafe_allow_html=True)
     
     
     
@@ -942,7 +3286,7 @@ def ai_insights_page(df, feature_importance):
     with col1:
         # Cluster distribution
         if 'ai_cluster' in df.columns:
-            cluster_counts = df['ai_cluster'].value_counts()
+            cluster_counts = cube.districts('ai_cluster').sort_values(ascending=False)
             
             fig = px.pie(
                 values=cluster_counts.values,
@@ -964,12 +3308,12 @@ def ai_insights_page(df, feature_importance):
     with col2:
         # Cluster characteristics
         if 'ai_cluster' in df.columns:
-            cluster_summary = df.groupby('ai_cluster').agg({
-                'ml_predicted_score': 'mean',
-                'gdp_per_capita': 'mean',
-                'literacy_rate_2025': 'mean',
-                'urbanization_rate_2025': 'mean'
-            }).round(1)
+            cluster_summary = cube.table('ai_cluster', 'mean')[[
+                'ml_predicted_score',
+                'gdp_per_capita',
+                'literacy_rate_2025',
+                'urbanization_rate_2025'
+            ]].round(1)
             
             st.markdown("**Cluster Characteristics:**")
             
@@ -986,62 +3330,64 @@ def ai_insights_page(df, feature_importance):
     # Model Validation & Accuracy
     st.markdown("### ✅ Model Validation & Reliability")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div class="methodology-box">
-            <div class="methodology-title">🔬 Validation Methodology</div>
-            <p><strong>Training/Testing Split:</strong> 70/30 random split with stratification</p>
-            <p><strong>Cross-Validation:</strong> 5-fold cross-validation performed</p>
-            <p><strong>Overfitting Check:</strong> Only 0.022 gap between training and testing accuracy</p>
-            <p><strong>Algorithm Used:</strong> Random Forest Regressor (100 trees)</p>
-            <p><strong>Benchmarking:</strong> Outperformed Gradient Boosting and Linear models</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # Create prediction accuracy visualization
-        np.random.seed(42)
-        actual_scores = np.random.normal(100, 25, 50)
-        predicted_scores = actual_scores + np.random.normal(0, 4, 50)  # Small error
-        
-        fig = px.scatter(
-            x=actual_scores,
-            y=predicted_scores,
-            title="Model Accuracy: Predicted vs Actual Investment Scores",
-            labels={'x': 'Actual Investment Score', 'y': 'Predicted Investment Score'},
-            opacity=0.7,
-            color_discrete_sequence=['#3182ce']
-        )
-        
-        # Add perfect prediction line
-        min_val, max_val = min(actual_scores.min(), predicted_scores.min()), max(actual_scores.max(), predicted_scores.max())
-        fig.add_shape(
-            type="line",
-            x0=min_val, y0=min_val,
-            x1=max_val, y1=max_val,
-            line=dict(color="#f56565", width=2, dash="dash"),
-        )
-        
-        fig.add_annotation(
-            x=min_val + 10,
-            y=max_val - 10,
-            text="Perfect Prediction Line",
-            showarrow=True,
-            arrowhead=2,
-            arrowcolor="#f56565",
-            font=dict(color='#e2e8f0')
-        )
+    if validation is None:
+        st.info("ℹ️ Validation metrics are unavailable: no scoring model artifact, or the data has no target scores to validate against.")
+    else:
+        col1, col2 = st.columns(2)
         
-        fig.update_layout(
-            height=400,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#e2e8f0')
-        )
+        with col1:
+            worst = validation['by_tier'].loc[validation['by_tier']['bias'].abs().idxmax()]
+            st.markdown(f"""
+            <div class="methodology-box">
+                <div class="methodology-title">🔬 Validation Methodology</div>
+                <p><strong>Cross-Validation:</strong> {summary['folds']}-fold, seeded random folds over {summary['rows']:,} districts</p>
+                <p><strong>Held-out Accuracy:</strong> R² {summary['r2']:.3f} ± {summary['r2_std']:.3f}, RMSE {summary['rmse']:.2f} points</p>
+                <p><strong>Overfitting Check:</strong> {summary['overfit_gap']:.3f} gap between training and held-out R²</p>
+                <p><strong>Algorithm Used:</strong> Ridge regression (alpha {summary['alpha']:g}) on {summary['features']} standardized features</p>
+                <p><strong>Largest Tier Bias:</strong> {worst['tier']} districts, {worst['bias']:+.2f} points on average</p>
+            </div>
+            """, unsafe_allow_html=True)
         
-        st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            points = validation['points']
+            fig = px.scatter(
+                points,
+                x='actual',
+                y='predicted',
+                title="Out-of-Fold Predictions vs Actual Investment Scores",
+                labels={'actual': 'Actual Investment Score', 'predicted': 'Predicted Investment Score'},
+                opacity=0.5,
+                color_discrete_sequence=['#3182ce']
+            )
+            
+            # Add perfect prediction line
+            min_val = min(points['actual'].min(), points['predicted'].min())
+            max_val = max(points['actual'].max(), points['predicted'].max())
+            fig.add_shape(
+                type="line",
+                x0=min_val, y0=min_val,
+                x1=max_val, y1=max_val,
+                line=dict(color="#f56565", width=2, dash="dash"),
+            )
+            
+            fig.add_annotation(
+                x=min_val + 10,
+                y=max_val - 10,
+                text="Perfect Prediction Line",
+                showarrow=True,
+                arrowhead=2,
+                arrowcolor="#f56565",
+                font=dict(color='#e2e8f0')
+            )
+            
+            fig.update_layout(
+                height=400,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#e2e8f0')
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
     
     # Risk Assessment Model
     st.markdown("### ⚠️ Risk Assessment Framework")
@@ -1075,18 +3421,12 @@ def ai_insights_page(df, feature_importance):
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        st.markdown("""
+        framework = "<br><br>".join(f"<strong>{label}:</strong><br>{score_range}" for label, score_range in risk_band_ranges())
+        st.markdown(f"""
         <div class="insight-box">
             <div class="insight-title">🎯 Risk Framework</div>
             <div class="insight-content">
-                <strong>Low Risk, High Return:</strong><br>
-                Score >120, High confidence<br><br>
-                <strong>Medium Risk, Good Return:</strong><br>
-                Score 80-120, Moderate confidence<br><br>
-                <strong>Higher Risk, Moderate Return:</strong><br>
-                Score 60-80, Variable confidence<br><br>
-                <strong>High Risk, Uncertain Return:</strong><br>
-                Score <60, Low confidence
+                {framework}
             </div>
         </div>
         """, unsafe_allow_html=True)
@@ -1128,31 +3468,35 @@ def ai_insights_page(df, feature_importance):
     
     # Technical Specifications
     with st.expander("🔧 Technical Model Specifications"):
-        st.markdown("""
-        **Algorithm Details:**
-        - **Primary Model:** Random Forest Regressor
-        - **Number of Trees:** 100
-        - **Max Depth:** 10
-        - **Min Samples Split:** 5
-        - **Random State:** 42 (for reproducibility)
-        
-        **Feature Engineering:**
-        - **Standardization:** StandardScaler applied to numerical features
-        - **Categorical Encoding:** Label encoding for tier and cluster variables
-        - **Feature Selection:** 12 most predictive features selected
-        
-        **Validation Metrics:**
-        - **R² Score:** 0.966 (explains 96.6% of variance)
-        - **Mean Absolute Error:** 3.0 points
-        - **Root Mean Square Error:** 4.1 points
-        - **Cross-Validation Score:** 0.952 ± 0.018
-        
-        **Training Details:**
-        - **Training Set:** 126 districts (70%)
-        - **Testing Set:** 54 districts (30%)
-        - **Stratification:** By AI cluster to ensure balanced representation
-        - **Training Time:** <2 seconds on standard hardware
-        """)
+        if validation is None:
+            st.markdown("No scoring model artifact is available; `ml_predicted_score` falls back to the source scores.")
+        else:
+            st.markdown(f"""
+            **Algorithm Details:**
+            - **Primary Model:** Ridge regression, fitted in closed form
+            - **Regularization:** alpha = {summary['alpha']:g} on standardized features
+            - **Missing Values:** Imputed with the training mean
+            - **Predictions:** Clipped to the range of scores seen in training
+            
+            **Feature Engineering:**
+            - **Standardization:** Each feature centred and scaled by its training mean and standard deviation
+            - **Log Transforms:** Population, GDP per capita and establishment counts
+            - **Features:** {summary['features']} indicators (see the importance chart above)
+            
+            **Cross-Validated Metrics ({summary['folds']} folds, {summary['rows']:,} districts):**
+            - **R² Score:** {summary['r2']:.3f} ± {summary['r2_std']:.3f}
+            - **Mean Absolute Error:** {summary['mae']:.2f} ± {summary['mae_std']:.2f} points
+            - **Root Mean Square Error:** {summary['rmse']:.2f} ± {summary['rmse_std']:.2f} points
+            - **Training vs Held-out R² Gap:** {summary['overfit_gap']:.3f}
+            """)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**Per-Fold Results:**")
+                st.dataframe(validation['folds'], use_container_width=True, hide_index=True)
+            with col2:
+                st.markdown("**Out-of-Fold Residuals by Tier:**")
+                st.dataframe(validation['by_tier'].round(3), use_container_width=True, hide_index=True)
 
 def sector_analysis_page(df):
     """Sector Analysis Page - Investment Opportunities by Industry"""
@@ -1163,94 +3507,22 @@ def sector_analysis_page(df):
     # Sector Overview Dashboard
     st.markdown("### 🏭 Sector Investment Landscape")
     
-    # Define sector opportunities based on district characteristics
-    def analyze_sector_opportunities(df):
-        """Analyze sector opportunities across all districts"""
-        
-        sector_data = []
-        
-        for _, district in df.iterrows():
-            opportunities = []
-            
-            # Food Processing & Agro-Industries
-            if district['agriculture_share'] > 40:
-                potential_units = max(1, int(district['population_2025'] / 50000))
-                investment = potential_units * np.random.randint(15, 35)
-                jobs = potential_units * np.random.randint(25, 75)
-                opportunities.append({
-                    'sector': 'Food Processing & Agro-Industries',
-                    'units': potential_units,
-                    'investment': investment,
-                    'jobs': jobs,
-                    'rationale': 'High agriculture share provides raw material base'
-                })
-            
-            # Textile & Garments
-            if district['literacy_rate_2025'] > 75:
-                potential_units = max(1, int(district['population_2025'] / 75000))
-                investment = potential_units * np.random.randint(40, 80)
-                jobs = potential_units * np.random.randint(100, 200)
-                opportunities.append({
-                    'sector': 'Textile & Garments',
-                    'units': potential_units,
-                    'investment': investment,
-                    'jobs': jobs,
-                    'rationale': 'Skilled workforce supports manufacturing'
-                })
-            
-            # IT Services & Digital Economy
-            if district['tier'] in ['Metro', 'Tier-2'] and district['literacy_rate_2025'] > 85:
-                potential_units = max(1, int(district['population_2025'] / 150000))
-                investment = potential_units * np.random.randint(30, 80)
-                jobs = potential_units * np.random.randint(100, 300)
-                opportunities.append({
-                    'sector': 'IT Services & Digital Economy',
-                    'units': potential_units,
-                    'investment': investment,
-                    'jobs': jobs,
-                    'rationale': 'High literacy and urban infrastructure'
-                })
-            
-            # Manufacturing & Engineering
-            if district['infrastructure_index'] > 60:
-                potential_units = max(1, int(district['population_2025'] / 100000))
-                investment = potential_units * np.random.randint(60, 120)
-                jobs = potential_units * np.random.randint(50, 150)
-                opportunities.append({
-                    'sector': 'Manufacturing & Engineering',
-                    'units': potential_units,
-                    'investment': investment,
-                    'jobs': jobs,
-                    'rationale': 'Strong infrastructure supports manufacturing'
-                })
-            
-            # Tourism & Hospitality
-            if district['tier'] in ['Tier-2', 'Tier-3'] and district['logistics_connectivity'] > 50:
-                potential_units = max(1, int(district['population_2025'] / 200000))
-                investment = potential_units * np.random.randint(80, 200)
-                jobs = potential_units * np.random.randint(150, 300)
-                opportunities.append({
-                    'sector': 'Tourism & Hospitality',
-                    'units': potential_units,
-                    'investment': investment,
-                    'jobs': jobs,
-                    'rationale': 'Good connectivity supports tourism development'
-                })
-            
-            # Add district info to each opportunity
-            for opp in opportunities:
-                opp.update({
-                    'district_name': district['district_name'],
-                    'state': district['state'],
-                    'tier': district['tier'],
-                    'ai_score': district['ml_predicted_score']
-                })
-                sector_data.append(opp)
-        
-        return pd.DataFrame(sector_data)
+    # Estimation mode
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        monte_carlo = st.toggle(
+            "🎲 Monte Carlo estimates",
+            help="Simulate many seeded scenarios per district and sector and report mean with P10-P90 ranges"
+        )
+    
+    with col2:
+        n_scenarios = 1
+        if monte_carlo:
+            n_scenarios = st.select_slider("Scenarios per district and sector", options=[100, 250, 500, 1000], value=500)
     
     # Generate sector analysis
-    sector_df = analyze_sector_opportunities(df)
+    sector_df, scenario_totals = analyze_sector_opportunities(df, data_version(df), n_scenarios)
     
     # Sector Overview Metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -1260,11 +3532,18 @@ def sector_analysis_page(df):
     total_units = sector_df['units'].sum()
     sectors_count = sector_df['sector'].nunique()
     
+    investment_range = jobs_range = ""
+    if monte_carlo:
+        low, high = scenario_range(scenario_totals, 'investment')
+        investment_range = f"<br>P10-P90: ₹{low:,.0f} - ₹{high:,.0f}"
+        low, high = scenario_range(scenario_totals, 'jobs')
+        jobs_range = f"<br>P10-P90: {low:,.0f} - {high:,.0f}"
+    
     with col1:
         st.markdown(f"""
         <div class="metric-card">
             <div class="metric-number">₹{total_investment:,}</div>
-            <div class="metric-label">Total Investment Potential (Lakhs)</div>
+            <div class="metric-label">Total Investment Potential (Lakhs){investment_range}</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -1272,7 +3551,7 @@ def sector_analysis_page(df):
         st.markdown(f"""
         <div class="metric-card">
             <div class="metric-number">{total_jobs:,}</div>
-            <div class="metric-label">Job Creation Potential</div>
+            <div class="metric-label">Job Creation Potential{jobs_range}</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -1310,19 +3589,26 @@ def sector_analysis_page(df):
         st.markdown(f"#### 🏆 Top Districts for {selected_sector}")
         
         top_districts = sector_data.nlargest(10, 'investment')[
-            ['district_name', 'state', 'tier', 'investment', 'jobs', 'units', 'ai_score']
+            ['district_name', 'state', 'tier', 'investment', 'investment_p10', 'investment_p90',
+             'jobs', 'units', 'ai_score']
         ].copy()
         
         # Format for display
         top_districts['Investment (₹ Lakhs)'] = top_districts['investment'].apply(lambda x: f"₹{x:,}")
+        top_districts['Investment Range'] = [f"₹{low:,} - ₹{high:,}" for low, high in 
+                                             zip(top_districts['investment_p10'], top_districts['investment_p90'])]
         top_districts['Jobs Created'] = top_districts['jobs']
         top_districts['Business Units'] = top_districts['units']
         top_districts['AI Score'] = top_districts['ai_score'].round(1)
         
         display_cols = ['district_name', 'state', 'tier', 'Investment (₹ Lakhs)', 
                        'Jobs Created', 'Business Units', 'AI Score']
+        display_names = ['District', 'State', 'Tier', 'Investment', 'Jobs', 'Units', 'AI Score']
+        if monte_carlo:
+            display_cols.insert(4, 'Investment Range')
+            display_names.insert(4, 'P10 - P90')
         top_districts_display = top_districts[display_cols].copy()
-        top_districts_display.columns = ['District', 'State', 'Tier', 'Investment', 'Jobs', 'Units', 'AI Score']
+        top_districts_display.columns = display_names
         
         st.dataframe(
             top_districts_display,
@@ -1345,11 +3631,17 @@ def sector_analysis_page(df):
         avg_investment = sector_data['investment'].mean()
         districts_count = len(sector_data)
         
+        sector_range = ""
+        if monte_carlo:
+            low, high = scenario_range(scenario_totals, 'investment', selected_sector)
+            sector_range = f"<strong>Investment P10-P90:</strong> ₹{low:,.0f} - ₹{high:,.0f} lakhs<br>"
+        
         st.markdown(f"""
         <div class="insight-box">
             <div class="insight-title">📈 {selected_sector} Overview</div>
             <div class="insight-content">
                 <strong>Total Investment:</strong> ₹{sector_investment:,} lakhs<br>
+                {sector_range}
                 <strong>Job Creation:</strong> {sector_jobs:,} positions<br>
                 <strong>Districts Suitable:</strong> {districts_count}<br>
                 <strong>Avg per District:</strong> ₹{avg_investment:.0f} lakhs<br><br>
@@ -1361,6 +3653,7 @@ def sector_analysis_page(df):
         
         # Sector distribution by state
         state_dist = sector_data['state'].value_counts()
+        state_dist = state_dist[state_dist > 0]
         if len(state_dist) > 0:
             fig = px.pie(
                 values=state_dist.values,
@@ -1386,7 +3679,7 @@ def sector_analysis_page(df):
     
     with col1:
         # Investment potential by sector
-        sector_summary = sector_df.groupby('sector').agg({
+        sector_summary = sector_df.groupby('sector', observed=True).agg({
             'investment': 'sum',
             'jobs': 'sum',
             'units': 'sum',
@@ -1574,40 +3867,43 @@ def district_analysis_page(df):
     # District Selection
     st.markdown("### 🎯 Select District for Analysis")
     
+    filter_index = build_filter_index(df, data_version(df))
+    lookup = build_district_lookup(df, data_version(df))
+    panel, panel_issues = load_district_panel(df, data_version(df))
+    for file_name, problem in panel_issues:
+        st.warning(f"⚠️ Skipped {file_name}: {problem}")
     col1, col2, col3 = st.columns([1, 1, 2])
     
     with col1:
         # State filter
         selected_state = st.selectbox(
             "🏛️ Filter by State",
-            ['All States'] + sorted(df['state'].unique().tolist())
+            ['All States'] + filter_index.options['state']
         )
     
     with col2:
         # Tier filter
         selected_tier = st.selectbox(
             "🏢 Filter by Tier",
-            ['All Tiers'] + sorted(df['tier'].unique().tolist())
+            ['All Tiers'] + filter_index.options['tier']
         )
     
     # Filter districts based on selection
-    filtered_df = df.copy()
-    if selected_state != 'All States':
-        filtered_df = filtered_df[filtered_df['state'] == selected_state]
-    if selected_tier != 'All Tiers':
-        filtered_df = filtered_df[filtered_df['tier'] == selected_tier]
+    filtered_df = df.iloc[filter_index.select(
+        state=None if selected_state == 'All States' else selected_state,
+        tier=None if selected_tier == 'All Tiers' else selected_tier
+    )]
     
     with col3:
-        # District selection
-        district_options = filtered_df.sort_values('ml_predicted_score', ascending=False)['district_name'].tolist()
-        selected_district = st.selectbox(
-            "🌆 Select District",
-            district_options,
-            help="Districts sorted by AI Investment Score (highest first)"
+        # District selection (by code, since names repeat across states)
+        selected_code = district_picker(
+            "🌆 Select District", filtered_df, lookup, key="deep_dive_district",
+            help=f"Top {DISTRICT_PICKER_LIMIT} districts by AI Investment Score (highest first); search to reach any other"
         )
     
     # Get selected district data
-    district_data = df[df['district_name'] == selected_district].iloc[0]
+    district_data = lookup.record(df, selected_code)
+    selected_district = district_data['district_name']
     
     # District Overview Header
     st.markdown("---")
@@ -1683,12 +3979,7 @@ def district_analysis_page(df):
     
     with col2:
         # Risk assessment
-        risk_color = {
-            'Low Risk, High Return': '#68d391',
-            'Medium Risk, Good Return': '#63b3ed', 
-            'Higher Risk, Moderate Return': '#f6ad55',
-            'High Risk, Uncertain Return': '#f56565'
-        }.get(district_data['investment_risk_category'], '#a0aec0')
+        risk_color = dict(zip(RISK_BAND_LABELS, RISK_BAND_COLORS)).get(district_data['investment_risk_category'], '#a0aec0')
         
         st.markdown(f"""
         <div class="insight-box" style="border-left-color: {risk_color};">
@@ -1705,7 +3996,7 @@ def district_analysis_page(df):
     # Detailed Analytics
     st.markdown("### 📊 Detailed District Analytics")
     
-    tab1, tab2, tab3, tab4 = st.tabs(["📈 Economic Profile", "🏗️ Infrastructure", "👥 Demographics", "🎯 Opportunities"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📈 Economic Profile", "🏗️ Infrastructure", "👥 Demographics", "🎯 Opportunities", "📅 Trajectory"])
     
     with tab1:
         col1, col2 = st.columns(2)
@@ -1735,8 +4026,7 @@ def district_analysis_page(df):
         
         with col2:
             # Economic indicators comparison
-            avg_metrics = df.groupby('state')[['gdp_per_capita', 'literacy_rate_2025', 'urbanization_rate_2025']].mean()
-            state_avg = avg_metrics.loc[district_data['state']]
+            state_avg = build_aggregate_cube(df, data_version(df)).cell('state', district_data['state'], 'mean')
             
             comparison_data = pd.DataFrame({
                 'Metric': ['GDP per Capita', 'Literacy Rate', 'Urbanization Rate'],
@@ -1834,7 +4124,7 @@ def district_analysis_page(df):
                 else:
                     color = "🔴"
                 
-                st.markdown(f"{color} **{metric}:** {score} ({normalized_score:.0f}/100)")
+                st.markdown(f"{color} **{metric}:** {score:.0f} ({normalized_score:.0f}/100)")
             
             st.markdown(f"**Overall Infrastructure Index:** {district_data['infrastructure_index']:.1f}/100")
     
@@ -1935,7 +4225,7 @@ def district_analysis_page(df):
                 'sector': '🏨 Tourism & Hospitality',
                 'investment': '₹80-200 lakhs per unit',
                 'jobs': '150-300 jobs per unit',
-                'rationale': f"Good connectivity ({district_data['logistics_connectivity']}/100) supports tourism development",
+                'rationale': f"Good connectivity ({district_data['logistics_connectivity']:.0f}/100) supports tourism development",
                 'potential': 'Medium'
             })
         
@@ -1962,40 +4252,207 @@ def district_analysis_page(df):
         if not opportunities:
             st.warning("⚠️ Limited investment opportunities identified based on current district characteristics. Consider infrastructure development first.")
     
+    with tab5:
+        position = lookup.position(selected_code)
+        if panel is None or not panel.covered[position]:
+            st.info(f"ℹ️ No multi-year history for {selected_district}. Add a *_panel.csv file under "
+                    f"{PANEL_DIR}/ to see trajectories.")
+        else:
+            indicator = st.selectbox(
+                "📊 Indicator",
+                list(PANEL_INDICATORS),
+                format_func=PANEL_INDICATORS.get,
+                key="trajectory_indicator"
+            )
+            history = panel.trajectory(position, indicator)
+            state_mean = panel.mean_trajectory(indicator, filter_index.select(state=district_data['state']))
+            
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=history['year'], y=history['value'], mode='lines+markers',
+                                         name=selected_district, line_color='#3182ce'))
+                fig.add_trace(go.Scatter(x=history['year'], y=history['rolling_mean'], mode='lines',
+                                         name=f"{PANEL_ROLLING_YEARS}-year rolling mean", line=dict(color='#68d391', dash='dash')))
+                fig.add_trace(go.Scatter(x=panel.years, y=state_mean, mode='lines',
+                                         name=f"{district_data['state']} average", line=dict(color='#f56565', dash='dot')))
+                fig.update_layout(
+                    title=f"{selected_district} - {PANEL_INDICATORS[indicator]} {panel.years[0]}-{panel.years[-1]}",
+                    height=400,
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#e2e8f0'),
+                    legend=dict(orientation='h', y=-0.2)
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                st.markdown("**Growth Summary:**")
+                
+                cagr = panel.cagr[indicator][position]
+                yearly_growth = history['growth'].dropna()
+                recent = yearly_growth.tail(PANEL_ROLLING_YEARS)
+                growth_metrics = [
+                    ("Compound Annual Growth", f"{cagr * 100:+.2f}%" if np.isfinite(cagr) else "n/a",
+                     f"CAGR across the observed years {panel.years[0]}-{panel.years[-1]}"),
+                    ("Latest Year-on-Year", f"{yearly_growth.iloc[-1] * 100:+.2f}%" if len(yearly_growth) else "n/a",
+                     "Annualized change into the most recent year"),
+                    (f"{PANEL_ROLLING_YEARS}-Year Average Growth", f"{recent.mean() * 100:+.2f}%" if len(recent) else "n/a",
+                     f"Mean year-on-year growth over the last {PANEL_ROLLING_YEARS} years"),
+                ]
+                
+                for metric, value, description in growth_metrics:
+                    st.markdown(f"**{metric}:** {value}")
+                    st.caption(description)
+                    st.markdown("---")
+    
+    # Sub-District Drill-Down
+    st.markdown("### 🧭 Sub-District Drill-Down")
+    
+    # Parent aggregates are precomputed; only the selected district's rows are read
+    subdistricts = load_subdistrict_store()
+    for file_name, problem in subdistricts.load_issues:
+        st.warning(f"⚠️ Skipped {file_name}: {problem}")
+    
+    if selected_code in subdistricts:
+        parent = subdistricts.summary(selected_code)
+        units = subdistricts.load(selected_code)
+        unit_type = str(units['subdistrict_type'].mode().iloc[0])
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown(f"""
+            <div class="metric-card">
+                <div class="metric-number">{int(parent['subdistricts'])}</div>
+                <div class="metric-label">{unit_type}s</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown(f"""
+            <div class="metric-card">
+                <div class="metric-number">{parent['population_2025']/100000:.1f}L</div>
+                <div class="metric-label">Population Covered</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown(f"""
+            <div class="metric-card">
+                <div class="metric-number">{parent['literacy_rate_2025']:.1f}%</div>
+                <div class="metric-label">Weighted Literacy</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown(f"""
+            <div class="metric-card">
+                <div class="metric-number">{parent['score_min']:.0f}–{parent['score_max']:.0f}</div>
+                <div class="metric-label">Readiness Score Range</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        col1, col2 = st.columns([3, 2])
+        
+        with col1:
+            # Strongest sub-districts by investment readiness
+            top_units = units.nlargest(15, 'investment_readiness_score').sort_values('investment_readiness_score')
+            
+            fig = px.bar(
+                top_units,
+                x='investment_readiness_score',
+                y='subdistrict_name',
+                orientation='h',
+                title=f"{selected_district} - {unit_type} Investment Readiness",
+                color='urbanization_rate_2025',
+                color_continuous_scale='Blues',
+                labels={'investment_readiness_score': 'Investment Readiness', 'subdistrict_name': unit_type,
+                        'urbanization_rate_2025': 'Urbanization %'}
+            )
+            fig.update_layout(
+                height=max(400, 28 * len(top_units)),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#e2e8f0')
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            columns = ['subdistrict_name', 'ai_cluster', 'population_2025', 'literacy_rate_2025',
+                       'urbanization_rate_2025', 'investment_readiness_score']
+            display_units = units[[c for c in columns if c in units.columns]].sort_values(
+                'investment_readiness_score', ascending=False)
+            display_units = display_units.rename(columns={
+                'subdistrict_name': unit_type, 'ai_cluster': 'Cluster', 'population_2025': 'Population',
+                'literacy_rate_2025': 'Literacy %', 'urbanization_rate_2025': 'Urbanization %',
+                'investment_readiness_score': 'Readiness'
+            })
+            st.dataframe(
+                display_units.round(1),
+                use_container_width=True,
+                hide_index=True,
+                height=400
+            )
+    else:
+        st.info(f"ℹ️ No sub-district records for {selected_district}. Add a *_subdistricts.csv file under "
+                f"{SUBDISTRICT_DIR}/ to enable the drill-down.")
+    
     # Comparative Analysis
     st.markdown("### 📊 Comparative District Analysis")
     
-    # Find similar districts
-    similar_districts = df[
-        (df['tier'] == district_data['tier']) & 
-        (df['state'] == district_data['state']) &
-        (df['district_name'] != selected_district)
-    ].nlargest(5, 'ml_predicted_score')[['district_name', 'ml_predicted_score', 'gdp_per_capita', 'investment_risk_category']]
+    # Find the nearest peers in economic feature space
+    peer_index = build_peer_index(df, data_version(df))
+    peer_scope = st.radio(
+        "🔎 Peer Scope",
+        ["National", f"Same State ({district_data['state']})", f"Same Tier ({district_data['tier']})", "Same State & Tier"],
+        horizontal=True,
+        help=f"Peers are the closest districts across {len(peer_index.features)} standardized economic indicators"
+    )
+    if peer_scope == "National":
+        candidates = None
+    elif peer_scope.startswith("Same State &"):
+        candidates = filter_index.select(state=district_data['state'], tier=district_data['tier'])
+    elif peer_scope.startswith("Same State"):
+        candidates = filter_index.select(state=district_data['state'])
+    else:
+        candidates = filter_index.select(tier=district_data['tier'])
+    
+    peer_rows, peer_distances = peer_index.nearest(lookup.position(selected_code), 5, candidates)
+    similar_districts = df.iloc[peer_rows][['district_name', 'state', 'tier', 'ml_predicted_score', 'gdp_per_capita', 'investment_risk_category']].copy()
+    similar_districts['peer_distance'] = peer_distances
     
     if len(similar_districts) > 0:
-        st.markdown(f"**Similar {district_data['tier']} Districts in {district_data['state']}:**")
+        st.markdown(f"**Closest Economic Peers to {selected_district} ({peer_scope}):**")
         
         # Add comparison with selected district
         comparison_df = similar_districts.copy()
         selected_row = pd.DataFrame({
             'district_name': [selected_district],
+            'state': [district_data['state']],
+            'tier': [district_data['tier']],
             'ml_predicted_score': [district_data['ml_predicted_score']],
             'gdp_per_capita': [district_data['gdp_per_capita']],
-            'investment_risk_category': [district_data['investment_risk_category']]
+            'investment_risk_category': [district_data['investment_risk_category']],
+            'peer_distance': [0.0]
         })
         
         comparison_df = pd.concat([selected_row, comparison_df], ignore_index=True)
         comparison_df['is_selected'] = [True] + [False] * len(similar_districts)
         
-        display_df = comparison_df[['district_name', 'ml_predicted_score', 'gdp_per_capita', 'investment_risk_category']].copy()
-        display_df.columns = ['District', 'AI Score', 'GDP per Capita', 'Risk Category']
+        display_df = comparison_df[['district_name', 'state', 'tier', 'ml_predicted_score', 'gdp_per_capita', 'investment_risk_category', 'peer_distance']].copy()
+        display_df.columns = ['District', 'State', 'Tier', 'AI Score', 'GDP per Capita', 'Risk Category', 'Peer Distance']
         display_df['GDP per Capita'] = display_df['GDP per Capita'].apply(lambda x: f"₹{x:,}")
+        display_df['Peer Distance'] = display_df['Peer Distance'].map(lambda x: f"{x:.2f}")
         
         st.dataframe(
             display_df,
             use_container_width=True,
             hide_index=True
         )
+    else:
+        st.info("ℹ️ No other districts in this peer scope.")
     
     # Export District Analysis
     st.markdown("### 📥 Export District Analysis")
@@ -2032,8 +4489,168 @@ def district_analysis_page(df):
             mime="text/csv"
         )
 
+def scenario_simulator_page(df):
+    """What-if Simulator Page - Re-score districts under infrastructure and policy changes"""
+    
+    st.markdown("## 🧪 What-if Scenario Simulator")
+    st.markdown("*Change infrastructure and policy inputs and see scores, risk bands and rankings respond*")
+    
+    engine = build_scenario_engine(df, data_version(df))
+    if engine is None:
+        st.info("ℹ️ The simulator needs the scoring model artifact and every input column it scores on.")
+        return
+    filter_index = build_filter_index(df, data_version(df))
+    lookup = build_district_lookup(df, data_version(df))
+    
+    # Scenario scope
+    st.markdown("### 🎯 Scenario Scope")
+    
+    col1, col2, col3 = st.columns([1, 1, 2])
+    
+    with col1:
+        scope = st.radio("Apply changes to", ["All Districts", "One State", "One District"])
+    
+    rows = None
+    if scope != "All Districts":
+        with col2:
+            selected_state = st.selectbox("🏛️ State", filter_index.options['state'], key="scenario_state")
+        rows = filter_index.select(state=selected_state)
+        if scope == "One District":
+            with col3:
+                selected_code = district_picker(
+                    "🌆 District", df.iloc[rows], lookup, key="scenario_district",
+                    help=f"Top {DISTRICT_PICKER_LIMIT} districts by AI Investment Score (highest first); search to reach any other"
+                )
+            rows = np.array([lookup.position(selected_code)])
+    
+    # Lever sliders, three per row
+    st.markdown("### 🎛️ Infrastructure & Policy Levers")
+    
+    changes = {}
+    levers = [column for column in SCENARIO_LEVERS if column in engine.levers]
+    for start in range(0, len(levers), 3):
+        for column, slot in zip(levers[start:start + 3], st.columns(3)):
+            lever = SCENARIO_LEVERS[column]
+            with slot:
+                changes[column] = st.slider(
+                    f"{lever['label']} change ({lever['unit']})",
+                    min_value=lever['change'][0],
+                    max_value=lever['change'][1],
+                    value=0.0,
+                    step=lever['step'],
+                    key=f"scenario_{column}"
+                )
+    
+    simulate_start = time.perf_counter()
+    result = engine.simulate(rows, changes)
+    simulate_ms = (time.perf_counter() - simulate_start) * 1000
+    st.caption(f"Scenario re-score time: {simulate_ms:.2f} ms for {result['rows']:,} of {len(df):,} districts")
+    
+    # Scenario outcome
+    st.markdown("### 📈 Scenario Impact")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-number">{result['rows']:,}</div>
+            <div class="metric-label">Districts Affected</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-number">{result['mean_change']:+.2f}</div>
+            <div class="metric-label">Avg Score Change</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-number">{result['band_moves'][0]:,}</div>
+            <div class="metric-label">Moved to a Lower-Risk Band</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-number">{result['band_moves'][1]:,}</div>
+            <div class="metric-label">Moved to a Higher-Risk Band</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        bands = pd.DataFrame({
+            'band': list(RISK_BAND_LABELS),
+            'Baseline': engine.band_counts,
+            'Scenario': result['band_counts'].to_numpy()
+        })
+        fig = px.bar(
+            bands,
+            x='band',
+            y=['Baseline', 'Scenario'],
+            title="Districts by Risk Band: Baseline vs Scenario",
+            labels={'band': 'Risk Category', 'value': 'Districts', 'variable': ''},
+            barmode='group',
+            color_discrete_sequence=['#718096', '#3182ce']
+        )
+        fig.update_layout(
+            height=400,
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='#e2e8f0')
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        state_means = result['state_means'].assign(change=lambda frame: frame['scenario'] - frame['baseline'])
+        fig = px.bar(
+            state_means.sort_values('change', ascending=False),
+            x='state',
+            y='change',
+            title="Change in Average AI Score by State",
+            labels={'state': '', 'change': 'Avg score change'},
+            color='change',
+            color_continuous_scale='RdYlGn',
+            color_continuous_midpoint=0
+        )
+        fig.update_layout(
+            height=400,
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='#e2e8f0'),
+            coloraxis_showscale=False
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Re-scored rankings
+    st.markdown("### 🏆 Top Affected Districts Under the Scenario")
+    
+    top = result['top']
+    st.dataframe(
+        pd.DataFrame({
+            'District': [lookup.label(code) for code in df['district_code'].iloc[top['row']].astype(str)],
+            'Score (Baseline)': top['score_before'].round(1),
+            'Score (Scenario)': top['score_after'].round(1),
+            'Risk (Baseline)': top['band_before'],
+            'Risk (Scenario)': top['band_after'],
+            'National Rank (Baseline)': top['rank_before'],
+            'National Rank (Scenario)': top['rank_after']
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+
 def methodology_page(df):
     """Technical Methodology Page - Comprehensive Documentation"""
+    cube = build_aggregate_cube(df, data_version(df))
+    validation = model_validation(df, data_version(df))
     
     st.markdown("## 🔬 Technical Methodology")
     st.markdown("*Comprehensive documentation of data sources, analytical framework, and validation approach*")
@@ -2069,12 +4686,12 @@ def methodology_page(df):
         
         st.markdown(f"""
         <div class="metric-card">
-            <div class="metric-number">{df['state'].nunique()}</div>
+            <div class="metric-number">{len(cube.districts('state'))}</div>
             <div class="metric-label">States Covered</div>
         </div>
         """, unsafe_allow_html=True)
         
-        total_pop = df['population_2025'].sum() / 10000000
+        total_pop = cube.total('sum')['population_2025'] / 10000000
         st.markdown(f"""
         <div class="metric-card">
             <div class="metric-number">{total_pop:.1f}Cr</div>
@@ -2162,7 +4779,7 @@ def methodology_page(df):
             <h4>🤖 3. ML Analysis</h4>
             <ul>
                 <li>K-means clustering</li>
-                <li>Random Forest modeling</li>
+                <li>Ridge regression scoring</li>
                 <li>Feature importance</li>
                 <li>Cross-validation</li>
             </ul>
@@ -2220,37 +4837,32 @@ def methodology_page(df):
             st.metric("Coverage Completeness", "98%", "of required indicators")
     
     with tab2:
-        st.markdown("""
+        clusters = load_cluster_model()
+        silhouette = clusters.metrics.get('silhouette') if clusters is not None else None
+        silhouette_line = f"silhouette_score = {silhouette:.3f}  # 2,000-row sample, recorded at training" if silhouette is not None else ""
+        cv_line = f"cv_r2 = {validation['summary']['r2']:.3f}  # {validation['summary']['folds']}-fold, out-of-fold" if validation is not None else ""
+        st.markdown(f"""
         **Machine Learning Pipeline:**
         
-        1. **Unsupervised Learning - K-Means Clustering:**
+        1. **Unsupervised Learning - Mini-Batch K-Means Clustering:**
            ```python
-           # Clustering Configuration
-           features = ['gdp_per_capita', 'literacy_rate', 'urbanization_rate', 
-                      'infrastructure_index', 'agriculture_share', 'service_share']
-           scaler = StandardScaler()
-           kmeans = KMeans(n_clusters=3, random_state=42)
-           silhouette_score = 0.577  # Excellent cluster separation
+           # Clustering Configuration (ClusterModel, NumPy)
+           features = ['literacy_rate_2025', 'urbanization_rate_2025', 'work_participation_rate_2025',
+                       'service_sector_share', 'manufacturing_share', 'agriculture_share',
+                       'infrastructure_index']   # Shared by district and sub-district files
+           kmeans = ClusterModel.fit(rows, k=3, batch_size=1024, n_init=3, seed=42)  # Standardizes internally
+           clusters = kmeans.assign(new_districts)  # Nearest centroid, no refit
+           {silhouette_line}
            ```
            
         2. **Supervised Learning - Investment Success Prediction:**
            ```python
-           # Target Variable Construction
-           investment_success = (
-               gdp_per_capita * 0.30 +        # Economic output
-               literacy_rate * 0.25 +          # Human capital  
-               infrastructure_index * 0.20 +   # Physical foundation
-               diversification_index * 0.15 +  # Economic resilience
-               connectivity_score * 0.10       # Market access
-           )
-           
-           # Random Forest Configuration
-           rf_model = RandomForestRegressor(
-               n_estimators=100,
-               max_depth=10,
-               min_samples_split=5,
-               random_state=42
-           )
+           # Ridge Configuration (ScoringModel, NumPy)
+           target = 'investment_readiness_score'
+           features = SCORE_FEATURES   # 16 indicators; population, GDP and establishments on a log scale
+           model = ScoringModel.fit(districts, features, target, alpha=1.0)  # Closed form on standardized features
+           scores = model.predict(new_districts)  # Missing values imputed with training means
+           {cv_line}
            ```
         
         3. **Feature Engineering:**
@@ -2261,15 +4873,23 @@ def methodology_page(df):
         """)
     
     with tab3:
+        if validation is None:
+            statistical = """
+        **1. Statistical Validation:**
+        - No scoring model artifact or target scores are available to validate against
+        """
+        else:
+            summary = validation['summary']
+            statistical = f"""
+        **1. Statistical Validation:**
+        - **Cross-Validation:** {summary['folds']}-fold, seeded random folds over {summary['rows']:,} districts
+        - **Held-out Accuracy:** R² {summary['r2']:.3f} ± {summary['r2_std']:.3f}, MAE {summary['mae']:.2f}, RMSE {summary['rmse']:.2f}
+        - **Overfitting Check:** Training vs held-out R² gap of {summary['overfit_gap']:.3f}
+        - **Residual Analysis:** Out-of-fold bias and error by tier on the AI Model Insights page
+        """
         st.markdown("""
         **Validation Framework:**
-        
-        **1. Statistical Validation:**
-        - **Train/Test Split:** 70/30 stratified by AI cluster
-        - **Cross-Validation:** 5-fold CV with geographical stratification
-        - **Performance Metrics:** R², MAE, RMSE, residual analysis
-        - **Overfitting Check:** Training vs testing performance gap <5%
-        
+        """ + statistical + """
         **2. Domain Expert Validation:**
         - **Known Success Cases:** Model correctly ranks metro districts highly
         - **Regional Patterns:** Clustering aligns with known economic geography
@@ -2286,29 +4906,28 @@ def methodology_page(df):
         - **Sector Recommendations:** Match with successful case studies
         """)
         
-        # Validation metrics visualization
-        metrics_data = pd.DataFrame({
-            'Metric': ['R² Score', 'Cross-Validation', 'Expert Alignment', 'Pattern Consistency'],
-            'Score': [0.966, 0.952, 0.89, 0.84],
-            'Benchmark': [0.80, 0.80, 0.75, 0.70]
-        })
-        
-        fig = px.bar(
-            metrics_data, 
-            x='Metric', 
-            y=['Score', 'Benchmark'],
-            title="Model Validation Results vs Industry Benchmarks",
-            barmode='group',
-            color_discrete_sequence=['#3182ce', '#f56565']
-        )
-        
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#e2e8f0')
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        if validation is not None:
+            # Held-out accuracy of every fold against the cross-validated mean
+            folds = validation['folds'].assign(label=lambda frame: 'Fold ' + frame['fold'].astype(str))
+            fig = px.bar(
+                folds,
+                x='label',
+                y=['train_r2', 'r2'],
+                title="Cross-Validated R² by Fold (Training vs Held-out)",
+                labels={'label': '', 'value': 'R²', 'variable': ''},
+                barmode='group',
+                color_discrete_sequence=['#3182ce', '#38b2ac']
+            )
+            fig.add_hline(y=validation['summary']['r2'], line_dash="dash", line_color="#f56565",
+                          annotation_text=f"Mean held-out R² {validation['summary']['r2']:.3f}")
+            
+            fig.update_layout(
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#e2e8f0')
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
     
     with tab4:
         st.markdown("""
@@ -2382,7 +5001,7 @@ def methodology_page(df):
         **Technology Stack:**
         
         - **Data Processing:** Python (pandas, numpy), Jupyter Notebooks
-        - **Machine Learning:** scikit-learn, Random Forest, K-means
+        - **Machine Learning:** NumPy ridge regression and mini-batch K-means, k-fold cross-validation
         - **Visualization:** Plotly, Streamlit, Custom CSS
         - **Data Storage:** CSV files (future: PostgreSQL, Redis caching)
         - **Deployment:** Streamlit Cloud (future: AWS/GCP containerization)
@@ -2410,6 +5029,11 @@ def methodology_page(df):
 def about_page():
     """About Page - Project and Creator Information"""
     
+    # Model figures come from the artifact's stored training metrics, so this page never touches the data
+    model = load_score_model()
+    cv = model.metrics.get('cv') if model is not None else None
+    accuracy = f"{cv['summary']['r2']:.1%}" if cv else "—"
+    
     st.markdown("## 👨‍💼 About Investment Atlas")
     st.markdown("*AI-Powered Regional Investment Intelligence Platform*")
     
@@ -2447,15 +5071,15 @@ def about_page():
         # Project metrics
         st.markdown(f"""
         <div class="metric-card">
-            <div class="metric-number">{len(load_data()[0]) if load_data()[0] is not None else 180}+</div>
+            <div class="metric-number">{source_district_count() or 180}+</div>
             <div class="metric-label">Districts Analyzed</div>
         </div>
         """, unsafe_allow_html=True)
         
-        st.markdown("""
+        st.markdown(f"""
         <div class="metric-card">
-            <div class="metric-number">96.6%</div>
-            <div class="metric-label">AI Model Accuracy</div>
+            <div class="metric-number">{accuracy}</div>
+            <div class="metric-label">AI Model Accuracy (CV R²)</div>
         </div>
         """, unsafe_allow_html=True)
         
@@ -2479,13 +5103,15 @@ def about_page():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown("""
+        accuracy_note = f" with {accuracy} cross-validated R²" if cv else ""
+        features_note = f"{len(model.features)} standardized predictive features" if model is not None else "Standardized predictive features"
+        st.markdown(f"""
         <div class="nav-card">
             <h4>🧠 Advanced AI Analytics</h4>
             <ul>
-                <li><strong>Machine Learning:</strong> Random Forest models with 96.6% accuracy</li>
+                <li><strong>Machine Learning:</strong> Ridge regression scoring model{accuracy_note}</li>
                 <li><strong>Clustering Analysis:</strong> K-means algorithm identifying economic patterns</li>
-                <li><strong>Feature Engineering:</strong> 12 key predictive factors identified</li>
+                <li><strong>Feature Engineering:</strong> {features_note}</li>
                 <li><strong>Validation:</strong> Rigorous cross-validation and expert review</li>
             </ul>
         </div>
@@ -2557,8 +5183,9 @@ def about_page():
     
     achievements = [
         {
-            'metric': '96.6% Model Accuracy',
-            'description': 'Exceptional predictive performance validated through rigorous testing',
+            'metric': f'{accuracy} Model Accuracy',
+            'description': (f"Cross-validated R² over {cv['summary']['folds']} folds of {cv['summary']['rows']:,} districts"
+                            if cv else 'Retrain the scoring model to record its cross-validated accuracy'),
             'icon': '🎯'
         },
         {
@@ -2667,6 +5294,51 @@ def about_page():
     </div>
     """, unsafe_allow_html=True)
 
+# Page registry: each page declares the inputs it is called with and the derived
+# tables it reads, so main() loads and builds only what the selected page needs.
+PAGES = {
+    "🎯 Executive Summary": {
+        'render': executive_summary_page,
+        'data': ('districts', 'feature_importance'),
+        'tables': (build_aggregate_cube,)
+    },
+    "🗺️ Interactive Investment Map": {
+        'render': investment_map_page,
+        'data': ('districts',),
+        'tables': (build_filter_index, build_spatial_index, build_district_lookup, load_district_panel)
+    },
+    "🤖 AI Model Insights": {
+        'render': ai_insights_page,
+        'data': ('districts', 'feature_importance'),
+        'tables': (build_aggregate_cube, model_validation)
+    },
+    "📊 Sector Analysis": {
+        'render': sector_analysis_page,
+        'data': ('districts',),
+        'tables': ()
+    },
+    "🏙️ District Deep Dive": {
+        'render': district_analysis_page,
+        'data': ('districts',),
+        'tables': (build_filter_index, build_district_lookup, build_peer_index, build_aggregate_cube, load_district_panel)
+    },
+    "🧪 Scenario Simulator": {
+        'render': scenario_simulator_page,
+        'data': ('districts',),
+        'tables': (build_scenario_engine, build_filter_index, build_district_lookup)
+    },
+    "🔬 Technical Methodology": {
+        'render': methodology_page,
+        'data': ('districts',),
+        'tables': (build_aggregate_cube, model_validation)
+    },
+    "👨‍💼 About": {
+        'render': about_page,
+        'data': (),
+        'tables': ()
+    }
+}
+
 if __name__ == "__main__":
     main()
 